@@ -0,0 +1,397 @@
+"""On-disk caches for the scraper.
+
+Everything here is an optimisation: a missing, stale or corrupt cache file must
+only ever cost a full re-fetch, never a failed run. Loads swallow unreadable
+files and start empty; saves write a temp file and rename it into place, so a
+run killed mid-save cannot leave half a JSON document behind.
+
+The stores are plain classes with no knowledge of any particular source —
+scrape.py decides what is worth caching and for how long.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def load_json(path: str) -> Any:
+    """Parsed contents of ``path``, or None if it is missing or not valid JSON."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        if os.path.exists(path):
+            logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return None
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write ``data`` as minified JSON, replacing ``path`` in one rename."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class ValidatorStore:
+    """ETag / Last-Modified validators per URL, with the payload they vouch for.
+
+    Revalidating a feed only pays off if its result can be rebuilt without the
+    body, so each entry also keeps the payload parsed from the last full
+    response. On a 304 the caller takes that payload instead of downloading and
+    parsing the feed again.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        data = load_json(path)
+        self._entries: Dict[str, Dict[str, Any]] = (
+            data if isinstance(data, dict) else {}
+        )
+        self._dirty = False
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Conditional-request headers for ``url`` (empty if nothing is on file)."""
+        with self._lock:
+            entry = self._entries.get(url)
+        headers: Dict[str, str] = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def payload(self, url: str) -> Optional[Any]:
+        """The payload stored with ``url``'s validators, if any."""
+        with self._lock:
+            entry = self._entries.get(url)
+        return entry.get("payload") if entry else None
+
+    def remember(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        payload: Any,
+    ) -> None:
+        """Record a full response's validators; without any, forget the URL."""
+        if not (etag or last_modified):
+            self.forget(url)
+            return
+        with self._lock:
+            self._entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "payload": payload,
+            }
+            self._dirty = True
+
+    def forget(self, url: str) -> None:
+        with self._lock:
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist to disk if anything changed since the last load or save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._entries)
+            self._dirty = False
+        write_json_atomic(self.path, data)
+
+
+class EventIndex:
+    """Processed events from the last run, per calendar and UID, with their stamps.
+
+    An entry is reusable while the VEVENT's stamp — whatever the caller derives
+    from SEQUENCE, LAST-MODIFIED and friends — is unchanged. The whole index is
+    tied to a ``fingerprint`` of the rules that produced the events: open it
+    with a different one and it starts empty, so a rule change can never serve
+    events enriched under the old rules.
+    """
+
+    def __init__(self, path: str, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        data = load_json(path)
+        valid = isinstance(data, dict) and data.get("fingerprint") == fingerprint
+        self._calendars: Dict[str, Dict[str, Any]] = (
+            data.get("calendars", {}) if valid else {}
+        )
+        self._dirty = False
+
+    def get(self, calendar: str, uid: str, stamp: str) -> Optional[Dict[str, Any]]:
+        """A copy of the event stored for ``uid`` if its stamp still matches."""
+        with self._lock:
+            entry = self._calendars.get(calendar, {}).get(uid)
+        if entry is None or entry.get("stamp") != stamp:
+            return None
+        return dict(entry["event"])
+
+    def put(self, calendar: str, uid: str, stamp: str, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self._calendars.setdefault(calendar, {})[uid] = {
+                "stamp": stamp,
+                "event": dict(event),
+            }
+            self._dirty = True
+
+    def retain(self, calendar: str, uids) -> None:
+        """Forget every entry of ``calendar`` whose UID is not in ``uids``."""
+        with self._lock:
+            entries = self._calendars.get(calendar, {})
+            stale = [uid for uid in entries if uid not in uids]
+            for uid in stale:
+                del entries[uid]
+            if stale:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist to disk if anything changed since the last load or save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"fingerprint": self.fingerprint, "calendars": self._calendars}
+            write_json_atomic(self.path, data)
+            self._dirty = False
+
+
+class EnrichmentMemo:
+    """Results of pure text → value rules, keyed by a hash of their input text.
+
+    ``lookup(key, compute)`` runs ``compute`` once per distinct key and serves
+    the stored value after that — for the rest of the run (a recurring series
+    repeats its text dozens of times) and, given a ``path``, for later runs
+    too. As with ``EventIndex`` the memo belongs to a ``fingerprint`` of the
+    rules and starts empty under any other. At most ``max_entries`` values are
+    kept, least recently used evicted first; with no ``path`` it never touches
+    disk. ``get``/``put`` are there for callers that batch their misses; a
+    stored value is never None, which ``get`` uses to mean "not stored".
+
+    A hit only reorders entries in memory. ``save`` rewrites the file when
+    entries were added or evicted, or when hits reordered a memo at least
+    ``RECENCY_SAVE_FILL`` full — below that nothing is evicted soon, so the
+    stored order does not matter yet and an unchanged run writes nothing.
+    """
+
+    RECENCY_SAVE_FILL = 0.9
+
+    def __init__(self, path: Optional[str], fingerprint: str, max_entries: int):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        data = load_json(path) if path else None
+        valid = isinstance(data, dict) and data.get("fingerprint") == fingerprint
+        self._entries: "OrderedDict[str, Any]" = OrderedDict(
+            data.get("entries", {}) if valid else {}
+        )
+        self._dirty = False
+        self._reordered = False
+
+    @staticmethod
+    def key(kind: str, *texts: str) -> str:
+        """Key for the rule ``kind`` applied to ``texts``."""
+        h = hashlib.blake2b(kind.encode("utf-8"), digest_size=16)
+        for text in texts:
+            h.update(b"\0")
+            h.update((text or "").encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Any:
+        """The value stored under ``key``, or None."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._reordered = True
+            return self._entries[key]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def lookup(self, key: str, compute: Callable[[], Any]) -> Any:
+        """The value stored under ``key``, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dirty = self._dirty or bool(self._entries)
+            self._entries.clear()
+
+    def save(self) -> None:
+        """Persist to disk if there is a path and anything changed."""
+        with self._lock:
+            near_full = len(self._entries) >= self.max_entries * self.RECENCY_SAVE_FILL
+            if not self.path or not (self._dirty or self._reordered and near_full):
+                return
+            data = {"fingerprint": self.fingerprint, "entries": self._entries}
+            write_json_atomic(self.path, data)
+            self._dirty = self._reordered = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """Response bodies on disk, keyed by URL, with a TTL per lookup and an LRU cap.
+
+    One file per URL. A hit bumps the file's mtime, so mtime doubles as the
+    last-access time and ``prune()`` can evict least-recently-used entries
+    until the directory fits in ``max_bytes``. The TTL is the caller's to
+    choose at lookup time — different sources go stale at different rates.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, clock=time.time):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".json")
+
+    def get(self, url: str, ttl: float) -> Optional[str]:
+        """The body stored for ``url`` if it is younger than ``ttl`` seconds."""
+        path = self._path(url)
+        entry = load_json(path)
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        if self.clock() - entry.get("stored", 0) > ttl:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("body")
+
+    def put(self, url: str, body: str) -> None:
+        write_json_atomic(
+            self._path(url), {"url": url, "stored": self.clock(), "body": body}
+        )
+
+    def prune(self) -> None:
+        """Evict least-recently-used entries until the cache fits ``max_bytes``."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        entries = []
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+                total -= size
+            except OSError:
+                continue
+
+
+class Cassette:
+    """Every response a run saw, recorded once and replayable with no network.
+
+    In ``"record"`` mode the scraper stores each HTTP response and each
+    rendered page as it goes and ``save()`` writes them all to one JSON file.
+    In ``"replay"`` mode that file answers the same lookups instead of the
+    network; a lookup the recording never made comes back None, exactly like a
+    failed fetch. Entries are keyed by ``(kind, url)`` — the HTTP method, or
+    ``"RENDER"`` for a page taken from the browser.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, mode: str):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if mode == "replay":
+            data = load_json(path)
+            if not isinstance(data, dict) or data.get("version") != self.VERSION:
+                raise ValueError(f"Not a version-{self.VERSION} cassette: {path}")
+            self._entries = data.get("entries", {})
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def _key(kind: str, url: str) -> str:
+        return f"{kind} {url}"
+
+    def get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
+        """The recorded ``{"status", "headers", "body"}`` for a lookup, if any."""
+        with self._lock:
+            return self._entries.get(self._key(kind, url))
+
+    def record(
+        self,
+        kind: str,
+        url: str,
+        status: int,
+        body: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        if self.replaying:
+            return
+        with self._lock:
+            self._entries[self._key(kind, url)] = {
+                "status": status,
+                "headers": dict(headers or {}),
+                "body": body,
+            }
+
+    def save(self) -> None:
+        """Write the recording out; a no-op when replaying."""
+        if self.replaying:
+            return
+        with self._lock:
+            data = {"version": self.VERSION, "entries": dict(self._entries)}
+        write_json_atomic(self.path, data)
+
+    def __len__(self) -> int:
+        return len(self._entries)
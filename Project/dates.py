@@ -0,0 +1,167 @@
+"""Date and time parsing shared by every scraper.
+
+Every event from every source goes through at least one of these, so they are
+written for the hot path: ICS datetimes are sliced rather than strptime'd,
+month and weekday names come from lookup tables, and free-text clock and
+date strings — which
+repeat endlessly across a run ("7:00 pm", "Tuesday, February 10, 2026") — are
+parsed once and memoised. All local times are Champaign-Urbana's, via one shared
+``CHICAGO_TZ``.
+
+``benchmarks/bench_dates.py`` times these against the strptime/regex versions
+they replaced; ``tests/test_dates.py`` holds them to the same results.
+"""
+
+import logging
+import re
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+CHICAGO_TZ = ZoneInfo("America/Chicago")
+
+# English month names and their three-letter abbreviations, lower-cased — the
+# names strptime's %B / %b accept in the C locale the scraper runs under.
+_MONTH_NAMES = (
+    "january february march april may june july "
+    "august september october november december"
+).split()
+_FULL_MONTHS = {name: i for i, name in enumerate(_MONTH_NAMES, 1)}
+MONTHS = dict(_FULL_MONTHS)
+MONTHS.update({name[:3]: i for i, name in enumerate(_MONTH_NAMES, 1)})
+_WEEKDAYS = frozenset(
+    "monday tuesday wednesday thursday friday saturday sunday".split()
+)
+
+# Clock strings seen in one run number in the hundreds; this bounds the memo
+# should a source start emitting unique junk.
+_CLOCK_CACHE_SIZE = 4096
+
+_LONG_DATE = re.compile(r"(?:(\w+),\s+)?(\w+)\s+(\d{1,2})(,?)\s+(\d{4})")
+_CLOCK = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)", re.IGNORECASE)
+_CLOCK_RANGE = re.compile(
+    r"(\d{1,2}):(\d{2})\s*(am|pm)?\s*(?:[-–—]|to)\s*(\d{1,2}):(\d{2})\s*(am|pm)",
+    re.IGNORECASE,
+)
+
+
+def parse_month_to_number(month_str: str) -> int:
+    """Return 1-12 for a month name or abbreviation; returns 1 on unrecognised input."""
+    month = MONTHS.get(month_str.strip().lower())
+    if month is None:
+        logger.warning("Unrecognised month string: %r — defaulting to 1", month_str)
+        return 1
+    return month
+
+
+def to_24h(h: int, mer: str) -> int:
+    """12-hour value → 24-hour, given its meridiem ('am'/'pm')."""
+    if mer == "pm" and h != 12:
+        h += 12
+    elif mer == "am" and h == 12:
+        h = 0
+    return h
+
+
+@lru_cache(maxsize=_CLOCK_CACHE_SIZE)
+def parse_12h_time(text: str) -> Optional[tuple]:
+    """First '5:30 pm' / '5 pm' / '7 p.m.' clock in text → (hour24, minute), or None."""
+    m = _CLOCK.search(text.replace(".", ""))
+    if not m:
+        return None
+    return to_24h(int(m.group(1)), m.group(3).lower()), int(m.group(2) or 0)
+
+
+@lru_cache(maxsize=_CLOCK_CACHE_SIZE)
+def parse_12h_range(text: str) -> Optional[tuple]:
+    """'5:30 pm - 7:00 pm' (start meridiem may be omitted: '9:00 - 10:00 pm')
+    → ((start_h24, start_m), (end_h24, end_m)), or None."""
+    m = _CLOCK_RANGE.search(text.replace(".", ""))
+    if not m:
+        return None
+    sh, sm, s_mer, eh, em, e_mer = m.groups()
+    s_mer = (s_mer or e_mer).lower()
+    return (to_24h(int(sh), s_mer), int(sm)), (to_24h(int(eh), e_mer.lower()), int(em))
+
+
+@lru_cache(maxsize=_CLOCK_CACHE_SIZE)
+def parse_long_date(text: str, weekday: bool = False) -> Optional[date]:
+    """'July 5, 2026' / 'July 5 2026' → date, or None. With ``weekday`` the text
+    must lead with a day name instead ('Tuesday, February 10, 2026').
+
+    Accepts exactly what strptime's "%B %d, %Y" and "%B %d %Y" (with ``weekday``,
+    "%A, %B %d, %Y") do: full names in any case, the day name not checked
+    against the date.
+    """
+    m = _LONG_DATE.fullmatch(text)
+    if not m:
+        return None
+    day_name, month_name, day, comma, year = m.groups()
+    if (day_name is not None) != weekday or (weekday and not comma):
+        return None
+    if day_name is not None and day_name.lower() not in _WEEKDAYS:
+        return None
+    month = _FULL_MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+    try:
+        return date(int(year), month, int(day))
+    except ValueError:
+        return None
+
+
+def parse_ics_dt(value: str, tz: ZoneInfo = CHICAGO_TZ) -> Optional[datetime]:
+    """ICS datetime → aware datetime. Handles UTC ('...Z'), naive-local, and date-only.
+
+    The three canonical shapes (``YYYYMMDDTHHMMSSZ``, ``YYYYMMDDTHHMMSS``,
+    ``YYYYMMDD``) are sliced straight into ``datetime``; anything else takes
+    the strptime path, so odd-but-valid values parse exactly as they used to.
+    """
+    value = value.strip()
+    n = len(value)
+    try:
+        if n == 8 and _is_digits(value):
+            return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]), tzinfo=tz)
+        if (
+            (n == 15 or (n == 16 and value[15] == "Z"))
+            and value[8] == "T"
+            and _is_digits(value[:8])
+            and _is_digits(value[9:15])
+        ):
+            parts = (
+                int(value[:4]),
+                int(value[4:6]),
+                int(value[6:8]),
+                int(value[9:11]),
+                int(value[11:13]),
+                int(value[13:15]),
+            )
+            if n == 16:
+                return datetime(*parts, tzinfo=timezone.utc).astimezone(tz)
+            return datetime(*parts, tzinfo=tz)
+    except ValueError:
+        pass  # out of range — let strptime have the last word
+    return _parse_ics_dt_strptime(value, tz)
+
+
+def _is_digits(s: str) -> bool:
+    # str.isdigit() alone admits "²" and other non-ASCII digits int() rejects.
+    return s.isascii() and s.isdigit()
+
+
+def _parse_ics_dt_strptime(value: str, tz: ZoneInfo) -> Optional[datetime]:
+    try:
+        if value.endswith("Z"):
+            return (
+                datetime.strptime(value, "%Y%m%dT%H%M%SZ")
+                .replace(tzinfo=timezone.utc)
+                .astimezone(tz)
+            )
+        if "T" in value:
+            return datetime.strptime(value, "%Y%m%dT%H%M%S").replace(tzinfo=tz)
+        return datetime.strptime(value, "%Y%m%d").replace(tzinfo=tz)
+    except ValueError:
+        return None
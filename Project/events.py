@@ -0,0 +1,174 @@
+"""The compact event record scrape() post-processes between merge and publish.
+
+Scrapers build plain dicts; once merged, every event becomes an ``Event`` and
+the whole batch lives in one list until it is written out. Slots keep each
+record to a fixed handful of pointers instead of a per-event hash table,
+strings that repeat across thousands of events (location, organizer, tag,
+source) are interned so each distinct value is stored once, and start/end are
+parsed once on the way in rather than by every step that compares them.
+
+``Event`` also answers the small part of the dict protocol the enrichment
+code uses (``get``, ``[]``, ``pop``, ``in``), so classification and free-food
+tagging run on it unchanged. ``to_dict`` gives back the published JSON shape.
+"""
+
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+# Published JSON key → slot, in the order to_dict writes them (extras such as a
+# food resource's recurrence go between end and source).
+_SLOTS = {
+    "summary": "summary",
+    "description": "description",
+    "location": "location",
+    "organizer": "organizer",
+    "tag": "tag",
+    "htmlLink": "html_link",
+    "start": "start",
+    "end": "end",
+    "source": "source",
+    "series_total": "series_total",
+    "series_end": "series_end",
+}
+_INTERNED = frozenset(("location", "organizer", "tag", "source"))
+_TIMES = frozenset(("start", "end"))
+_MISSING = object()
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+def _parse_time(value: Any) -> Union[datetime, str, None]:
+    """A datetime for ISO text; anything unparseable is kept as given."""
+    if value and isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _format_time(value: Union[datetime, str, None]) -> Union[str, None]:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class Event:
+    """One event. Fields the source did not set are None (and left out of JSON).
+
+    ``start``/``end`` hold a datetime, or the raw value when it is not ISO
+    text (an empty string from a source that found no date, say); either way
+    ``to_dict`` writes back exactly the text the source produced. ``id`` is
+    the stable key scrape() publishes the event under; it is not a field.
+    """
+
+    __slots__ = tuple(_SLOTS.values()) + ("extra", "id")
+
+    def __init__(self, **fields: Any):
+        for slot in _SLOTS.values():
+            setattr(self, slot, None)
+        self.extra: Optional[Dict[str, Any]] = None
+        self.id: Optional[str] = None
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], source: Optional[str] = None) -> "Event":
+        # Spelled out rather than routed through __setitem__: every event of a
+        # run passes through here once.
+        event = cls.__new__(cls)
+        get = data.get
+        event.summary = get("summary")
+        event.description = get("description")
+        event.location = _intern(get("location"))
+        event.organizer = _intern(get("organizer"))
+        event.tag = _intern(get("tag"))
+        event.html_link = get("htmlLink")
+        event.start = _parse_time(get("start"))
+        event.end = _parse_time(get("end"))
+        event.source = _intern(source if source is not None else get("source"))
+        event.series_total = get("series_total")
+        event.series_end = get("series_end")
+        event.extra = None
+        event.id = None
+        if not _SLOTS.keys() >= data.keys():
+            event.extra = {k: v for k, v in data.items() if k not in _SLOTS}
+        return event
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for key, value in (
+            ("summary", self.summary),
+            ("description", self.description),
+            ("location", self.location),
+            ("organizer", self.organizer),
+            ("tag", self.tag),
+            ("htmlLink", self.html_link),
+            ("start", _format_time(self.start)),
+            ("end", _format_time(self.end)),
+        ):
+            if value is not None:
+                out[key] = value
+        if self.extra:
+            out.update(self.extra)
+        if self.source is not None:
+            out["source"] = self.source
+        if self.series_total is not None:
+            out["series_total"] = self.series_total
+            out["series_end"] = self.series_end
+        return out
+
+    # ---- The dict protocol the enrichment code relies on ---------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = _SLOTS.get(key)
+        if slot is None:
+            return self.extra.get(key, default) if self.extra else default
+        value = getattr(self, slot)
+        if value is None:
+            return default
+        return _format_time(value) if key in _TIMES else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        slot = _SLOTS.get(key)
+        if slot is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        elif key in _TIMES:
+            setattr(self, slot, _parse_time(value))
+        else:
+            setattr(self, slot, _intern(value) if key in _INTERNED else value)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def pop(self, key: str, default: Any = _MISSING) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        slot = _SLOTS.get(key)
+        if slot is None:
+            del self.extra[key]
+        else:
+            setattr(self, slot, None)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return f"Event({self.to_dict()!r})"
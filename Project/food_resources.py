@@ -17,10 +17,9 @@ and The Daily Illini reporting on cultural-house meal programs.
 
 from datetime import datetime, date, timedelta
 from math import asin, cos, radians, sin, sqrt
-from zoneinfo import ZoneInfo
 from typing import Dict, List, Any, Optional
 
-TZ = ZoneInfo("America/Chicago")
+from dates import CHICAGO_TZ as TZ, parse_ics_dt
 FREE_FOOD_TAG = "Free Food 🍕"
 
 # UIUC academic terms (instruction start through end of finals).
@@ -58,10 +57,10 @@ def derive_academic_terms(vevents: List[Dict[str, str]]) -> List[Any]:
         raw = (ve.get("DTSTART") or "")[:8]
         if len(raw) != 8 or not raw.isdigit():
             continue
-        try:
-            d = datetime.strptime(raw, "%Y%m%d").date()
-        except ValueError:
+        dt = parse_ics_dt(raw)
+        if dt is None:
             continue
+        d = dt.date()
         low = summary.lower()
         if "first day of instruction" in low and "semester" in low:
             starts.append(d)  # "…, Fall Semester" / "…, Spring Semester"
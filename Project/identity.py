@@ -0,0 +1,118 @@
+"""Which scraped listings are one event, by identity rather than by text.
+
+Two listings of one event usually share something sturdier than a title: the
+ICS UID the feed gave it, or a permalink to its page. ``IdentityIndex`` maps
+every such key to one event slot. A listing whose keys are all new opens a
+slot; one that hits a claimed key is a duplicate, dropped before anything is
+done with it. The keys it brought along still join the slot, so a feed event
+known by UID and URL catches a later HTML copy that knows only the URL.
+
+Keys are plain strings, so they survive a trip through JSON unchanged, and
+``stable_id`` hashes them into the ID an event is published under — the same
+event gets the same ID on every run.
+"""
+
+import hashlib
+import re
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+# calendars.illinois.edu links one event several ways: /detail/<calendar>?
+# eventId=N from each calendar page that lists it, and, in feed URLs,
+# /calendar/calendar/detail/<calendar>?key=<two yyyymmdd stamps>N.
+_CALENDARS_HOST = "calendars.illinois.edu"
+_CALENDAR_KEY = re.compile(r"^\d{16}(\d+)$")
+
+
+def canonical_url(url: str) -> Optional[str]:
+    """One spelling of an event link: no scheme, "www." or fragment, no
+    tracking parameters, query sorted. None for anything not an http(s) URL."""
+    parts = urlsplit(url.strip())
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return None
+    host = parts.hostname.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = parse_qsl(parts.query, keep_blank_values=True)
+
+    if host == _CALENDARS_HOST:
+        params = dict(query)
+        event_id = params.get("eventId")
+        if not event_id:
+            match = _CALENDAR_KEY.match(params.get("key", ""))
+            event_id = match.group(1) if match else None
+        if event_id:
+            return f"{host}/event/{event_id}"
+
+    query = sorted(
+        (k, v) for k, v in query if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/")
+    return host + path + (f"?{urlencode(query)}" if query else "")
+
+
+def event_keys(
+    uid: Optional[str] = None, url: Optional[str] = None, day: Optional[date] = None
+) -> List[str]:
+    """Identity keys for one listing.
+
+    A UID names one occurrence. A link does not: a recurring event's list
+    entries share one detail page, so the link counts only with its date.
+    Where one page can list several showings a day (a venue's matinee and
+    evening performance), pass the start datetime as ``day`` instead.
+    """
+    keys = []
+    if uid:
+        keys.append(f"uid:{uid}")
+    canonical = canonical_url(url) if url else None
+    if canonical and day is not None:
+        keys.append(f"url:{canonical}@{day.isoformat()}")
+    return keys
+
+
+def stable_id(keys: Sequence[str]) -> str:
+    """The published ID of a listing with these (non-empty) identity keys.
+
+    Its permalink key is preferred, since the general feed and its HTML
+    fallback both derive it; otherwise its first key. 16 hex digits of SHA-1
+    leave room for far more events than a run ever sees.
+    """
+    basis = next((k for k in keys if k.startswith("url:")), keys[0])
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:16]
+
+
+class IdentityIndex:
+    """Identity keys → event slot, for one pass over a batch of listings."""
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self.events = 0
+        self.duplicates = 0
+
+    def claim(self, keys: Iterable[str]) -> bool:
+        """True if these keys are a new event (a listing without keys always
+        is), False if any of them already belongs to one."""
+        keys = list(keys)
+        slot = next((self._slots[k] for k in keys if k in self._slots), None)
+        new = slot is None
+        if new:
+            slot = self.events
+            self.events += 1
+        else:
+            self.duplicates += 1
+        for key in keys:
+            self._slots.setdefault(key, slot)
+        return new
+
+    def known(self, keys: Iterable[str]) -> bool:
+        """True if any of these keys already belongs to an event. Claims
+        nothing: a listing is checked early, and claimed once it is kept."""
+        return any(k in self._slots for k in keys)
+
+    def slot(self, key: str) -> Optional[int]:
+        return self._slots.get(key)
+
+    def __len__(self) -> int:
+        return self.events
@@ -0,0 +1,114 @@
+"""Near-duplicate candidates by MinHash/LSH over title shingles.
+
+Exact dedupe only catches listings whose normalized title and start minute
+match. Mirrored listings drift: "Concerts for Kids" vs "Concert for Kids",
+a "| Krannert Art Museum" suffix, a start given as doors-open rather than
+curtain. Comparing every pair of events is quadratic, so candidates come from
+locality-sensitive hashing instead:
+
+* each title becomes a set of character shingles;
+* events are bucketed by start time, and only buckets that see more than one
+  group (source) are hashed at all;
+* a MinHash signature is cut into bands, and two events become a candidate
+  pair only when they share a band within neighbouring time buckets.
+
+Candidates are then checked by exact Jaccard similarity, so LSH decides only
+what gets compared, never what matches. Hashing is seeded and uses crc32, so
+the same input gives the same pairs on every run.
+
+The module knows nothing about events; scrape.py decides what counts as a
+group and which listing of a duplicate survives.
+"""
+
+import random
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Hashable, List, Sequence, Set, Tuple
+
+SHINGLE_SIZE = 3
+# 8 bands of 2 rows: a pair shares a band with probability 1 - (1 - J**2)**8 —
+# 0.97 at Jaccard 0.6, 0.995 at 0.7 — while unrelated titles (J ≈ 0.1) rarely
+# get as far as the exact check. Each extra permutation costs one more
+# element-wise min per event, the stage's main expense.
+NUM_PERM = 16
+BANDS = 8
+_ROWS = NUM_PERM // BANDS
+
+# Multiply-shift hashing of the 32-bit crc into 30 bits: values that small are
+# single-digit ints, which keeps the element-wise min in minhash cheap.
+_rng = random.Random(20260901)
+_PERMS = [
+    (_rng.getrandbits(64) | 1, _rng.getrandbits(64)) for _ in range(NUM_PERM)
+]
+_MASK64 = (1 << 64) - 1
+
+# (shingles, time in seconds, group) per item.
+Item = Tuple[FrozenSet[str], int, Hashable]
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> FrozenSet[str]:
+    """Character ``size``-grams of ``text``, padded so word edges count."""
+    padded = f" {text} "
+    if len(padded) <= size:
+        return frozenset((padded,))
+    return frozenset(padded[i : i + size] for i in range(len(padded) - size + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+@lru_cache(maxsize=1 << 16)
+def _permuted(shingle: str) -> Tuple[int, ...]:
+    """A shingle's hash under every permutation. Titles draw on a few thousand
+    distinct shingles, so each is worked out once per run."""
+    h = zlib.crc32(shingle.encode())
+    return tuple(((a * h + b) & _MASK64) >> 34 for a, b in _PERMS)
+
+
+def minhash(shingle_set: FrozenSet[str]) -> Tuple[int, ...]:
+    """NUM_PERM-value MinHash signature of a non-empty shingle set."""
+    return tuple(map(min, zip(*map(_permuted, shingle_set))))
+
+
+def candidate_pairs(items: Sequence[Item], window: int) -> Set[Tuple[int, int]]:
+    """Index pairs (i < j) from different groups, within ``window`` seconds of
+    each other, whose signatures share at least one LSH band."""
+    buckets: Dict[int, Set[Hashable]] = defaultdict(set)
+    for _, t, group in items:
+        buckets[t // window].add(group)
+
+    index: Dict[tuple, List[int]] = defaultdict(list)
+    pairs: Set[Tuple[int, int]] = set()
+    for i, (shingle_set, t, group) in enumerate(items):
+        bucket = t // window
+        nearby = (bucket - 1, bucket, bucket + 1)
+        if len(set().union(*(buckets.get(b, ()) for b in nearby))) < 2:
+            continue  # nothing from another group is close enough in time
+        signature = minhash(shingle_set)
+        for band in range(BANDS):
+            values = signature[band * _ROWS : (band + 1) * _ROWS]
+            for b in nearby:
+                for j in index.get((b, band, values), ()):
+                    _, t_j, group_j = items[j]
+                    if group_j != group and abs(t - t_j) <= window:
+                        pairs.add((j, i))
+            index[(bucket, band, values)].append(i)
+    return pairs
+
+
+def near_duplicate_pairs(
+    items: Sequence[Item], threshold: float, window: int
+) -> List[Tuple[float, int, int]]:
+    """Verified (similarity, i, j) pairs at or above ``threshold``, most
+    similar first (ties by position, so the order is stable)."""
+    found = []
+    for i, j in candidate_pairs(items, window):
+        similarity = jaccard(items[i][0], items[j][0])
+        if similarity >= threshold:
+            found.append((similarity, i, j))
+    found.sort(key=lambda p: (-p[0], p[1], p[2]))
+    return found
@@ -1,20 +1,37 @@
 # -----------------------IMPORTS & VARIABLES-----------------------#
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta, timezone
-from zoneinfo import ZoneInfo
+from datetime import datetime, timedelta
+import asyncio
+import codecs
+import hashlib
+import itertools
 import os
 import re
 import json
 import html
 import time
 import logging
-from typing import Dict, List, Optional, Any
-from playwright.sync_api import sync_playwright
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence, Set, Tuple
 import requests
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin, urlparse
 
+from cache import Cassette, EnrichmentMemo, EventIndex, ResponseCache, ValidatorStore
+from dates import (
+    CHICAGO_TZ as TZ,
+    parse_12h_range,
+    parse_12h_time,
+    parse_ics_dt,
+    parse_long_date,
+    parse_month_to_number,
+)
+from events import Event
+from identity import IdentityIndex, event_keys, stable_id
+import neardup
 
 # -----------------------CONFIGURATION & LOGGING-----------------------#
 # Configure logging
@@ -38,15 +55,82 @@ MAX_EVENTS_PER_SOURCE = 6000
 # Occurrences kept per same-titled recurring series. 8 covers a full week plus a
 # day, so the frontend can still infer the weekday pattern for its cadence label.
 MAX_OCCURRENCES_PER_SERIES = 8
+# Two listings from different sources are one event when their title shingles
+# reach this Jaccard similarity and they start within the window. 0.6 catches
+# "Concerts for Kids" / "Concert for Kids" (0.74) and an appended venue (0.64)
+# while unrelated same-hour events sharing a word stay under 0.4.
+NEAR_DUPLICATE_THRESHOLD = 0.6
+NEAR_DUPLICATE_WINDOW_MINUTES = 60
 # Description cap. 500 truncated 65% of feed events, cutting free-food mentions
 # that sit late in a blurb ("...lunch will be provided" after three paragraphs of
 # speaker bio). 2000 keeps 97.6% whole; past that it is ~30 KB for 40 events.
 MAX_DESCRIPTION_CHARS = 2000
 USER_AGENT = "Mozilla/5.0 (compatible; ProjectHelix/1.0; +https://github.com/infoshubhjain/Project-Helix)"
-RATE_LIMIT_DELAY = 1  # seconds between requests
+RATE_LIMIT_DELAY = 1  # seconds between requests to the same host
+# Per-host politeness: (requests per second, burst). Unlisted hosts get one
+# request every RATE_LIMIT_DELAY seconds. calendars.illinois.edu serves ~30
+# static feeds a run, so it gets a small burst and twice the default rate.
+HOST_RATE_LIMITS: Dict[str, tuple] = {
+    "calendars.illinois.edu": (2.0, 2),
+}
+# Sources scraped side by side. They hit different hosts, so a run is bound by
+# network wait rather than CPU; 1 restores the old one-after-another order.
+SCRAPE_WORKERS = 6
+# Processes for the enrichment stage (see enrich_events). 0 keeps it in-process;
+# the pool is only worth starting when a batch has this many unseen texts.
+ENRICH_PROCESSES = 0
+ENRICH_POOL_MIN_JOBS = 2000
+# Detail pages fetched side by side within one source. The host's rate limit
+# still applies; this only lets their latencies overlap.
+DETAIL_FETCH_WORKERS = 4
+# Connection pools shared by every scraper (see get_session): one pool per host
+# for up to POOL_CONNECTIONS hosts, each keeping POOL_MAXSIZE sockets alive —
+# enough for every worker to hold a connection to the same host at once.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 8
+# ICS feeds are read in chunks of this size and parsed as they download.
+ICS_CHUNK_BYTES = 64 * 1024
+
+# Persistent caches (feed validators, ...) live here when scrape.py runs as a
+# script. Imported as a module — by the tests, say — nothing is cached on disk.
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+# Detail pages barely change once a show is published, so they are cached on
+# disk per URL. TTL in seconds per source; the whole cache is LRU-capped.
+DETAIL_CACHE_TTL = {
+    "kcpa": 3 * 24 * 3600,
+    "state_farm": 3 * 24 * 3600,
+}
+DETAIL_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Classification / free-food results kept across runs (two per distinct text).
+ENRICHMENT_MEMO_MAX_ENTRIES = 50_000
+# Detail pages rendered at once, each in its own browser context, and how long
+# one page may take (navigation + content) before it is abandoned and replaced.
+RENDER_PAGES = 4
+RENDER_TIMEOUT = 20  # seconds
+# What the headless browser may load when a detail page has to be rendered (see
+# _browser_request_allowed). Only page.content() is read, so images, fonts,
+# stylesheets and media are aborted. Scripts load only from the page's own host
+# (they build the markup); blocked hosts lose even documents and XHR.
+BROWSER_ALLOWED_RESOURCE_TYPES = frozenset({"document", "xhr", "fetch"})
+BROWSER_FIRST_PARTY_RESOURCE_TYPES = frozenset({"script"})
+BROWSER_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "facebook.com",
+    "hotjar.com",
+    "newrelic.com",
+    "nr-data.net",
+    "segment.io",
+    "tiktok.com",
+)
 
 # Variables & Constants
 last_scrape_stats: Dict[str, Dict[str, Any]] = {}
+# Sources finish on worker threads, so writes to last_scrape_stats go through this.
+_stats_lock = threading.Lock()
 
 # Human-readable name per calendar ID, used as the event's `organizer`.
 #
@@ -170,10 +254,8 @@ ATHLETICS_ICS_FEEDS = [
 
 
 # -----------------------HELPER FUNCTIONS-----------------------#
-def create_robust_session() -> requests.Session:
-    """Create a requests session with retry logic and proper headers."""
-    session = requests.Session()
-
+def _build_adapter() -> HTTPAdapter:
+    """HTTP adapter with retry logic and a connection pool sized for concurrency."""
     retry_strategy = Retry(
         total=MAX_RETRIES,
         status_forcelist=[429, 500, 502, 503, 504],
@@ -181,7 +263,23 @@ def create_robust_session() -> requests.Session:
         raise_on_status=False,
         allowed_methods=["HEAD", "GET", "OPTIONS"],
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    return HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+    )
+
+
+def create_robust_session(adapter: Optional[HTTPAdapter] = None) -> requests.Session:
+    """Create a requests session with retry logic and proper headers.
+
+    Pass ``adapter`` to share its connection pools; by default the session
+    gets a private one.
+    """
+    session = requests.Session()
+
+    if adapter is None:
+        adapter = _build_adapter()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
@@ -201,18 +299,204 @@ def create_robust_session() -> requests.Session:
     return session
 
 
+# One adapter — and so one set of per-host connection pools — for the whole
+# process. urllib3's pool manager is thread-safe; requests.Session (cookie jar,
+# redirect state) is not documented to be, so each thread gets its own Session
+# object mounted on the shared adapter.
+_shared_adapter: Optional[HTTPAdapter] = None
+_shared_adapter_lock = threading.Lock()
+_thread_sessions = threading.local()
+
+
+def get_session() -> requests.Session:
+    """The calling thread's session, pooled with every other scraper's."""
+    global _shared_adapter
+    session = getattr(_thread_sessions, "session", None)
+    if session is None:
+        with _shared_adapter_lock:
+            if _shared_adapter is None:
+                _shared_adapter = _build_adapter()
+        session = create_robust_session(_shared_adapter)
+        _thread_sessions.session = session
+    return session
+
+
+# Conditional-GET validators for the ICS/JSON feeds; None disables revalidation.
+_feed_validators: Optional[ValidatorStore] = None
+# Detail-page bodies (HTTP and rendered); None disables it.
+_response_cache: Optional[ResponseCache] = None
+# General-feed events from the last run, reused while their VEVENT is unchanged —
+# tag and free-food result included, so a reused event is not enriched again.
+_event_index: Optional[EventIndex] = None
+# Record/replay of every response in a run; None means live, unrecorded.
+_cassette: Optional[Cassette] = None
+# Response headers worth keeping in a cassette — the ones the scrapers read.
+CASSETTE_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def configure_caches(cache_dir: Optional[str]) -> None:
+    """Open the persistent caches under ``cache_dir``, or disable them with None."""
+    global _feed_validators, _response_cache, _event_index, _enrichment_memo
+    if cache_dir is None:
+        _feed_validators = None
+        _response_cache = None
+        _event_index = None
+        _enrichment_memo = EnrichmentMemo(
+            None, enrichment_fingerprint(), ENRICHMENT_MEMO_MAX_ENTRIES
+        )
+        return
+    _feed_validators = ValidatorStore(os.path.join(cache_dir, "feed_validators.json"))
+    _response_cache = ResponseCache(
+        os.path.join(cache_dir, "responses"), DETAIL_CACHE_MAX_BYTES
+    )
+    _event_index = EventIndex(
+        os.path.join(cache_dir, "event_index.json"), enrichment_fingerprint()
+    )
+    _enrichment_memo = EnrichmentMemo(
+        os.path.join(cache_dir, "enrichment_memo.json"),
+        enrichment_fingerprint(),
+        ENRICHMENT_MEMO_MAX_ENTRIES,
+    )
+
+
+def configure_cassette(path: Optional[str], mode: str = "record") -> None:
+    """Record every response into the cassette at ``path``, or replay from it.
+
+    ``mode`` is ``"record"`` or ``"replay"``; a None ``path`` goes back to live,
+    unrecorded fetching. Either mode switches the persistent caches off — a
+    recording needs every full body, not a 304 or a cache hit, and a replay
+    must not depend on what happens to be cached locally.
+    """
+    global _cassette
+    if path is None:
+        _cassette = None
+        return
+    configure_caches(None)
+    _cassette = Cassette(path, mode)
+    if _cassette.replaying:
+        logger.info(f"Replaying {len(_cassette)} recorded responses from {path}")
+
+
+def save_cassette() -> None:
+    """Write out the cassette being recorded, if any."""
+    if _cassette is not None and not _cassette.replaying:
+        _cassette.save()
+        logger.info(f"Recorded {len(_cassette)} responses to {_cassette.path}")
+
+
+def save_caches() -> None:
+    """Write back whatever the open caches learned this run."""
+    if _feed_validators is not None:
+        _feed_validators.save()
+    if _response_cache is not None:
+        _response_cache.prune()
+    if _event_index is not None:
+        _event_index.save()
+    _enrichment_memo.save()
+    logger.info(
+        f"Enrichment memo: {_enrichment_memo.hits} reused, "
+        f"{_enrichment_memo.misses} computed, {len(_enrichment_memo)} stored"
+    )
+
+
+class _TokenBucket:
+    """Token bucket refilled at ``rate`` tokens/s, holding at most ``burst``.
+
+    ``reserve()`` always takes a token, letting the balance go negative, and
+    returns how long the caller must wait before its token is really there —
+    so concurrent callers queue up fairly instead of all waking at once.
+    """
+
+    def __init__(self, rate: float, burst: int, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.clock = clock
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+_host_buckets: Dict[str, _TokenBucket] = {}
+_host_buckets_lock = threading.Lock()
+
+
+def _wait_for_host(url: str) -> None:
+    """Block until ``url``'s host may be hit again. Hosts never wait on each other."""
+    host = (urlparse(url).hostname or "").lower()
+    with _host_buckets_lock:
+        bucket = _host_buckets.get(host)
+        if bucket is None:
+            rate, burst = HOST_RATE_LIMITS.get(host, (1 / RATE_LIMIT_DELAY, 1))
+            bucket = _host_buckets[host] = _TokenBucket(rate, burst)
+    delay = bucket.reserve()
+    if delay > 0:
+        time.sleep(delay)
+
+
 def safe_request(
-    url: str, session: requests.Session, method: str = "GET", **kwargs
+    url: str,
+    session: requests.Session,
+    method: str = "GET",
+    cache_ttl: Optional[float] = None,
+    **kwargs,
 ) -> Optional[requests.Response]:
-    """Make a safe HTTP request with error handling and logging."""
-    try:
-        # Add rate limiting
-        time.sleep(RATE_LIMIT_DELAY)
+    """Make a safe HTTP request with error handling and logging.
 
-        response = session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+    Returns the response on 200 — or on 304 when the request carried
+    conditional headers, so the caller can reuse its own copy. With
+    ``cache_ttl`` a GET is answered from the on-disk response cache while the
+    stored copy is younger than that many seconds. While a cassette is
+    replaying, the recorded response stands in for the network.
+    """
+    cache = _response_cache if cache_ttl and method == "GET" else None
+    if cache is not None:
+        body = cache.get(url, cache_ttl)
+        if body is not None:
+            logger.debug(f"Served from cache: {url}")
+            return _cached_response(url, body)
+    cassette = _cassette
+    try:
+        if cassette is not None and cassette.replaying:
+            entry = cassette.get(method, url)
+            if entry is None:
+                logger.warning(f"Not in cassette: {method} {url}")
+                return None
+            response = _cached_response(
+                url, entry["body"], entry["status"], entry["headers"]
+            )
+        else:
+            _wait_for_host(url)
+            response = session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+            if cassette is not None:
+                cassette.record(
+                    method,
+                    url,
+                    response.status_code,
+                    response.text,
+                    {
+                        h: response.headers[h]
+                        for h in CASSETTE_HEADERS
+                        if h in response.headers
+                    },
+                )
 
         if response.status_code == 200:
             logger.debug(f"Successfully fetched: {url}")
+            if cache is not None:
+                cache.put(url, response.text)
+            return response
+        if response.status_code == 304 and _is_conditional(kwargs.get("headers")):
+            logger.debug(f"Not modified: {url}")
             return response
         logger.warning(f"HTTP {response.status_code} for {url}")
         return None
@@ -221,43 +505,183 @@ def safe_request(
         return None
 
 
-def validate_event(event: Dict[str, Any]) -> bool:
-    """An event must have a non-empty summary."""
-    if not event.get("summary"):
-        logger.warning(f"Event missing required field 'summary': {event}")
-        return False
-    return True
+def fetch_pages(
+    urls: List[str],
+    cache_ttl: Optional[float] = None,
+    max_workers: int = DETAIL_FETCH_WORKERS,
+) -> List[Optional[requests.Response]]:
+    """GET ``urls`` concurrently; responses (None on failure) come back in order.
 
+    Each worker thread uses its own session from ``get_session()``, and every
+    request still goes through ``safe_request``, so per-host rate limits and
+    the response cache apply exactly as they do to a serial loop.
+    """
 
-def parse_month_to_number(month_str: str) -> int:
-    """Return 1-12 for a month name or abbreviation; returns 1 on unrecognised input."""
-    month_str = month_str.strip()
-    for fmt in ("%B", "%b"):
-        try:
-            return datetime.strptime(month_str, fmt).month
-        except ValueError:
-            continue
-    logger.warning("Unrecognised month string: %r — defaulting to 1", month_str)
-    return 1
-
+    def fetch(url: str) -> Optional[requests.Response]:
+        return safe_request(url, get_session(), cache_ttl=cache_ttl)
+
+    if max_workers <= 1 or len(urls) <= 1:
+        return [fetch(url) for url in urls]
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(urls)), thread_name_prefix="detail"
+    ) as pool:
+        return list(pool.map(fetch, urls))
+
+
+def _cached_response(
+    url: str,
+    body: str,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.Response:
+    """A response rebuilt from a stored body, indistinguishable to callers."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers or {})
+    response.encoding = "utf-8"
+    response._content = body.encode("utf-8")
+    response._content_consumed = True  # so iter_content() streams _content
+    return response
+
+
+def _stored_render(url: str, ttl: Optional[float]) -> Optional[str]:
+    """A rendered page that needs no browser: replayed, or cached and fresh.
+
+    Raises LookupError when a cassette is replaying and never saw ``url`` —
+    a replay must not fall through to a real browser.
+    """
+    cassette = _cassette
+    if cassette is not None and cassette.replaying:
+        entry = cassette.get("RENDER", url)
+        if entry is None:
+            raise LookupError(f"Not in cassette: RENDER {url}")
+        return entry["body"]
+    if ttl and _response_cache is not None:
+        # Keyed apart from the plain-HTTP body of the same URL, which may be cached too.
+        body = _response_cache.get(f"RENDER {url}", ttl)
+        if body is not None:
+            logger.debug(f"Rendered page served from cache: {url}")
+        return body
+    return None
+
+
+def _remember_render(url: str, ttl: Optional[float], body: str) -> None:
+    if ttl and _response_cache is not None:
+        _response_cache.put(f"RENDER {url}", body)
+    if _cassette is not None:
+        _cassette.record("RENDER", url, 200, body)
+
+
+def _is_conditional(headers: Optional[Dict[str, str]]) -> bool:
+    return bool(headers) and any(
+        h in headers for h in ("If-None-Match", "If-Modified-Since")
+    )
 
-def _to_24h(h: int, mer: str) -> int:
-    """12-hour value → 24-hour, given its meridiem ('am'/'pm')."""
-    if mer == "pm" and h != 12:
-        h += 12
-    elif mer == "am" and h == 12:
-        h = 0
-    return h
 
+def fetch_feed(
+    url: str, session: requests.Session, parse, stream: bool = False
+) -> Optional[Any]:
+    """GET a feed and return ``parse(response)``, revalidating the last copy.
+
+    When validators for ``url`` are on file the request is conditional, and a
+    304 returns the payload parsed from the last full response — no download,
+    no re-parse. ``parse`` returning None marks the body unusable, and nothing
+    is remembered for it. Returns None when the feed can't be fetched or parsed.
+
+    With ``stream`` the body is downloaded as ``parse`` reads it, so a lazy
+    payload (an iterator) overlaps parsing with the download. Its items are
+    collected as the caller consumes them, and remembered for a later 304 only
+    once it ends cleanly. A download that breaks off while ``parse`` peeks at
+    the body returns None; one that breaks off later raises from the iterator
+    (callers read it through ``_until_broken``). Either way the validators on
+    file are forgotten, so the next run fetches the feed whole. The response is
+    closed — its pooled connection handed back — as soon as nothing more will
+    be read from it: right after ``parse`` unless the payload is lazy, else
+    when the iterator ends, breaks off or is dropped unfinished.
+    """
+    store = _feed_validators
+    headers = store.request_headers(url) if store is not None else {}
+    response = safe_request(url, session, headers=headers, stream=stream)
+    if response is None:
+        return None
+    if response.status_code == 304:
+        payload = store.payload(url) if store is not None else None
+        _close(response)
+        if payload is not None:
+            logger.info("Not modified, reusing last parse: %s", url)
+            return payload
+        # Validators on file but no payload to go with them — fetch it whole.
+        response = safe_request(url, session, stream=stream)
+        if response is None:
+            return None
 
-def parse_12h_time(text: str) -> Optional[tuple]:
-    """First '5:30 pm' / '5 pm' / '7 p.m.' clock in text → (hour24, minute), or None."""
-    m = re.search(
-        r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)", text.replace(".", ""), re.IGNORECASE
-    )
-    if not m:
+    try:
+        payload = parse(response)
+    except requests.RequestException as e:
+        logger.warning("Feed broke off before parsing began: %s (%s)", url, e)
+        if store is not None:
+            store.forget(url)
+        _close(response)
         return None
-    return _to_24h(int(m.group(1)), m.group(3).lower()), int(m.group(2) or 0)
+    if isinstance(payload, Iterator):
+        return _stream_payload(store, url, response, payload)
+    _close(response)
+    if store is not None:
+        if payload is None:
+            store.forget(url)
+        else:
+            _remember_feed(store, url, response, payload)
+    return payload
+
+
+def _remember_feed(store: ValidatorStore, url: str, response, payload) -> None:
+    resp_headers = getattr(response, "headers", None) or {}
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    store.remember(
+        url,
+        etag if isinstance(etag, str) else None,
+        last_modified if isinstance(last_modified, str) else None,
+        payload,
+    )
+
+
+def _stream_payload(
+    store: Optional[ValidatorStore], url: str, response, items: Iterator
+) -> Iterator:
+    """Pass a streamed payload through, closing ``response`` however it ends.
+
+    With a ``store``, the items are remembered once they end cleanly.
+    """
+    seen: Optional[list] = [] if store is not None else None
+    try:
+        for item in items:
+            if seen is not None:
+                seen.append(item)
+            yield item
+    except requests.RequestException:
+        if store is not None:
+            store.forget(url)
+        raise
+    finally:
+        _close(response)
+    if store is not None:
+        _remember_feed(store, url, response, seen)
+
+
+def _close(response) -> None:
+    close = getattr(response, "close", None)
+    if close is not None:
+        close()
+
+
+def validate_event(event: Dict[str, Any]) -> bool:
+    """An event must have a non-empty summary."""
+    if not event.get("summary"):
+        logger.warning(f"Event missing required field 'summary': {event}")
+        return False
+    return True
 
 
 # ---- Minimal iCalendar parsing (stdlib only) -------------------------------
@@ -276,64 +700,114 @@ def _ics_unescape(s: str) -> str:
     )
 
 
-def _parse_ics_events(text: str) -> List[Dict[str, str]]:
-    """Return one {PROPERTY: raw_value} dict per VEVENT (params stripped)."""
-    # Unfold continuation lines (RFC 5545 §3.1)
-    lines: List[str] = []
-    for raw in text.splitlines():
-        if raw[:1] in (" ", "\t") and lines:
-            lines[-1] += raw[1:]
+def _unfold_ics_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Join continuation lines (RFC 5545 §3.1) as they stream past."""
+    current: Optional[str] = None
+    for raw in lines:
+        if raw[:1] in (" ", "\t") and current is not None:
+            current += raw[1:]
         else:
-            lines.append(raw)
+            if current is not None:
+                yield current
+            current = raw
+    if current is not None:
+        yield current
+
 
-    events: List[Dict[str, str]] = []
+def _iter_ics_events(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Yield one {PROPERTY: raw_value} dict per VEVENT (params stripped)."""
     cur: Optional[Dict[str, str]] = None
-    for line in lines:
+    for line in _unfold_ics_lines(lines):
         if line.startswith("BEGIN:VEVENT"):
             cur = {}
         elif line.startswith("END:VEVENT"):
             if cur is not None:
-                events.append(cur)
+                yield cur
             cur = None
         elif cur is not None and ":" in line:
             key, _, value = line.partition(":")
             cur[key.split(";", 1)[0].upper()] = value
-    return events
 
 
-def _parse_ics_dt(value: str, tz: ZoneInfo) -> Optional[datetime]:
-    """ICS datetime → aware datetime. Handles UTC ('...Z'), naive-local, and date-only."""
-    value = value.strip()
-    try:
-        if value.endswith("Z"):
-            return (
-                datetime.strptime(value, "%Y%m%dT%H%M%SZ")
-                .replace(tzinfo=timezone.utc)
-                .astimezone(tz)
-            )
-        if "T" in value:
-            return datetime.strptime(value, "%Y%m%dT%H%M%S").replace(tzinfo=tz)
-        return datetime.strptime(value, "%Y%m%d").replace(tzinfo=tz)
-    except ValueError:
-        return None
+def _parse_ics_events(text: str) -> List[Dict[str, str]]:
+    """Return one {PROPERTY: raw_value} dict per VEVENT (params stripped)."""
+    return list(_iter_ics_events(text.splitlines()))
 
 
-def parse_12h_range(text: str) -> Optional[tuple]:
-    """'5:30 pm - 7:00 pm' (start meridiem may be omitted: '9:00 - 10:00 pm')
-    → ((start_h24, start_m), (end_h24, end_m)), or None."""
-    m = re.search(
-        r"(\d{1,2}):(\d{2})\s*(am|pm)?\s*(?:[-–—]|to)\s*(\d{1,2}):(\d{2})\s*(am|pm)",
-        text.replace(".", ""),
-        re.IGNORECASE,
+def _iter_response_lines(response) -> Iterator[str]:
+    """Decoded lines of a response body, read chunk by chunk as it downloads.
+
+    Responses without ``iter_content`` (rebuilt or test doubles) fall back to
+    ``response.text``. The last line of each chunk is held back until the next
+    one arrives, so a line — or a CRLF — split across chunks comes out whole.
+    """
+    iter_content = getattr(response, "iter_content", None)
+    if iter_content is None:
+        yield from response.text.splitlines()
+        return
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(
+        errors="replace"
     )
-    if not m:
+    pending = ""
+    for chunk in iter_content(chunk_size=ICS_CHUNK_BYTES):
+        parts = (pending + decoder.decode(chunk)).splitlines(keepends=True)
+        pending = parts.pop() if parts else ""
+        if parts:
+            yield from "".join(parts).splitlines()
+    pending += decoder.decode(b"", final=True)
+    yield from pending.splitlines()
+
+
+def _until_broken(items: Iterable, failures: List[Exception]) -> Iterator:
+    """Yield from a streamed payload, stopping quietly if the download fails.
+
+    The error is appended to ``failures`` for the caller to act on once the
+    loop is over.
+    """
+    try:
+        yield from items
+    except requests.RequestException as e:
+        failures.append(e)
+
+
+def _parse_ics_response(response) -> Optional[Iterator[Dict[str, str]]]:
+    """VEVENT dicts from an ICS response, or None if the body isn't a calendar.
+
+    The events are yielded lazily while the body is still being read; only the
+    first line is consumed up front, to check that this is a calendar at all.
+    """
+    lines = _iter_response_lines(response)
+    first = next((line for line in lines if line.strip()), "")
+    if not first.lstrip("\ufeff").startswith("BEGIN:VCALENDAR"):
         return None
-    sh, sm, s_mer, eh, em, e_mer = m.groups()
-    s_mer = (s_mer or e_mer).lower()
-    return (_to_24h(int(sh), s_mer), int(sm)), (
-        _to_24h(int(eh), e_mer.lower()),
-        int(em),
-    )
+    return _iter_ics_events(itertools.chain([first], lines))
+
+
+def _keyword_alternation(words: List[str]) -> str:
+    """Regex alternation matching exactly ``words``, factored into a prefix trie.
+
+    "fair"/"family"/"festival" become ``f(?:a(?:ir|mily)|estival)``: the engine
+    tests each shared prefix once instead of once per keyword.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(ch) + build(sub) for ch, sub in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+
+    return build(trie)
 
 
 # --- Free-food detection -----------------------------------------------------
@@ -413,6 +887,60 @@ _FOOD_TITLE = re.compile(
     re.IGNORECASE,
 )
 
+# Every signal above is checked in one pass. _FOOD_SCAN visits each place one of
+# them could start — all begin at a word from _FOOD_LEADS, or at "$<digit>" —
+# and _FOOD_AT reports which of them match there (one capturing lookahead per
+# signal). A lead is a word prefix ("snack" covers "snacks"), so consuming one
+# never skips past the next place a signal can start. Add the leading word of
+# any new alternative to the patterns above here as well.
+_FOOD_LEADS = (
+    "admission at bagels barbecue bbq boba breakfast brunch buffet cash catered "
+    "catering coffee community complimentary cookies cookout courtesy dinner donuts "
+    "doughnuts food for free fundraiser ice included light lunch meal no on picnic "
+    "pizza potluck provided purchase refreshments registration served snack soup "
+    "tailgate ticket while"
+).split()
+_FOOD_SCAN = re.compile(
+    r"\$\d|\b(?:" + _keyword_alternation(_FOOD_LEADS) + ")", re.IGNORECASE
+)
+
+
+def _inline(pattern: re.Pattern) -> str:
+    """A compiled pattern's source, wrapped to keep its verbose flag when combined."""
+    if pattern.flags & re.VERBOSE:
+        return f"(?x:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
+
+
+_FOOD_AT = re.compile(
+    "".join(
+        f"(?:(?=(?P<{name}>{_inline(pattern)})))?"
+        for name, pattern in (
+            ("certain", _FOOD_ABSOLUTE),
+            ("offered", _FOOD_OFFERED),
+            ("noun", _FOOD_NOUN),
+            ("cue", _FREE_CUE),
+            ("veto", _FOOD_VETO),
+        )
+    ),
+    re.IGNORECASE,
+)
+# Title-only signals: either is enough, so one search of both.
+_FOOD_IN_TITLE = re.compile(
+    _inline(_FOOD_TITLE) + "|" + _inline(_FOOD_IDIOM), re.IGNORECASE
+)
+
+
+def _food_signals(text: str) -> set:
+    """Names of the _FOOD_AT signals that match anywhere in text."""
+    found = set()
+    for lead in _FOOD_SCAN.finditer(text):
+        at = _FOOD_AT.match(text, lead.start())
+        found.update(name for name, span in at.groupdict().items() if span is not None)
+        if "certain" in found:
+            break  # nothing outranks tier 1
+    return found
+
 
 def detect_free_food(event_info):
     """Append 'Free Food 🍕' when the text gives real evidence of free food.
@@ -421,37 +949,23 @@ def detect_free_food(event_info):
     across campus to a talk with no food, which is worse than a missed tag.
     Does not overwrite existing tags.
     """
-    text = " ".join(
-        [
-            event_info.get("summary", ""),
-            event_info.get("description", ""),
-            event_info.get("location", ""),
-        ]
-    )
+    summary = event_info.get("summary", "")
+    description = event_info.get("description", "")
+    location = event_info.get("location", "")
 
     # "Food for Thought" is a real free-lunch program, so the veto must not eat
     # the curated entries that already declare themselves.
     already_tagged = "Free Food" in (event_info.get("tag") or "")
 
-    if not already_tagged:
-        summary = event_info.get("summary", "")
-        # Tier 1 outranks the veto; tiers 2 and 3 do not.
-        certain = bool(_FOOD_ABSOLUTE.search(text))
-        # Tier 2: food is offered, the title advertises it, or the campus giveaway
-        # idiom is used. Tier 3: a food noun and a free-ness cue co-occur — they
-        # often sit in different sentences ("...breakfast from 9 to 10 a.m. ...
-        # All Research Park events are free"), so proximity is the wrong test.
-        strong = (
-            bool(_FOOD_OFFERED.search(text))
-            or bool(_FOOD_TITLE.search(summary))
-            or bool(_FOOD_IDIOM.search(summary))
-        )
-        likely = bool(_FOOD_NOUN.search(text)) and bool(_FREE_CUE.search(text))
-        if not (certain or strong or likely):
-            return event_info
-        if not certain and _FOOD_VETO.search(text):
-            return event_info
+    if not already_tagged and not _enrichment_memo.lookup(
+        EnrichmentMemo.key("free_food", summary, description, location),
+        lambda: _has_free_food(summary, description, location),
+    ):
+        return event_info
+    return _add_free_food_tag(event_info)
+
 
+def _add_free_food_tag(event_info):
     existing = event_info.get("tag", "")
     if "Free Food" not in existing:
         event_info["tag"] = (
@@ -460,6 +974,24 @@ def detect_free_food(event_info):
     return event_info
 
 
+def _has_free_food(summary: str, description: str, location: str) -> bool:
+    text = " ".join([summary, description, location])
+    signals = _food_signals(text)
+    # Tier 1 outranks the veto; tiers 2 and 3 do not.
+    certain = "certain" in signals
+    # Tier 2: food is offered, the title advertises it, or the campus giveaway
+    # idiom is used. Tier 3: a food noun and a free-ness cue co-occur — they
+    # often sit in different sentences ("...breakfast from 9 to 10 a.m. ...
+    # All Research Park events are free"), so proximity is the wrong test.
+    strong = "offered" in signals or bool(_FOOD_IN_TITLE.search(summary))
+    likely = "noun" in signals and "cue" in signals
+    if not (certain or strong or likely):
+        return False
+    if not certain and "veto" in signals:
+        return False
+    return True
+
+
 # Category keyword map — checked in priority order; first match wins.
 # Keywords are matched on word boundaries against summary + description + location.
 CATEGORY_KEYWORDS = [
@@ -596,15 +1128,27 @@ CATEGORY_KEYWORDS = [
     ),
 ]
 
-_CATEGORY_PATTERNS = [
-    (
-        cat,
-        re.compile(
-            r"\b(?:" + "|".join(re.escape(k) for k in kws) + r")\b", re.IGNORECASE
-        ),
-    )
-    for cat, kws in CATEGORY_KEYWORDS
-]
+
+# classify_event reports the first category in CATEGORY_KEYWORDS order with a
+# whole-word keyword hit anywhere in the text. Rather than one search per
+# category, _CATEGORY_SCAN finds every position where *some* keyword starts, and
+# _CATEGORY_AT names the highest-priority category matching there (its groups
+# c0..cN are tried in priority order). The best category over all positions is
+# the first-match answer; a hit on c0 ends the scan early.
+_CATEGORY_SCAN = re.compile(
+    r"\b(?=(?:"
+    + _keyword_alternation([k for _, kws in CATEGORY_KEYWORDS for k in kws])
+    + r")\b)",
+    re.IGNORECASE,
+)
+_CATEGORY_AT = re.compile(
+    "|".join(
+        f"(?P<c{i}>{_keyword_alternation(kws)})\\b"
+        for i, (_, kws) in enumerate(CATEGORY_KEYWORDS)
+    ),
+    re.IGNORECASE,
+)
+_CATEGORY_NAMES = [cat for cat, _ in CATEGORY_KEYWORDS]
 
 
 # calendars.illinois.edu publishes a CATEGORIES value on every feed event, chosen
@@ -633,13 +1177,26 @@ _ICS_CATEGORY_MAP = {
 
 
 def classify_event(
-    summary: str, description: str = "", location: str = "", categories: str = ""
+    summary: str,
+    description: str = "",
+    location: str = "",
+    categories: str = "",
 ) -> str:
     """Infer a category from event text. Returns a canonical category or 'General'.
 
     A publisher-assigned ICS CATEGORIES value wins when it maps to one of ours;
-    otherwise fall back to keyword matching over the event text.
+    otherwise fall back to keyword matching over the event text. Each distinct
+    text is classified once; repeats come from ``_enrichment_memo``.
     """
+    return _enrichment_memo.lookup(
+        EnrichmentMemo.key("category", summary, description, location, categories),
+        lambda: _classify(summary, description, location, categories),
+    )
+
+
+def _classify(
+    summary: str, description: str, location: str, categories: str = ""
+) -> str:
     for raw in (categories or "").split(","):
         mapped = _ICS_CATEGORY_MAP.get(raw.strip().lower())
         if mapped:
@@ -648,10 +1205,168 @@ def classify_event(
     text = " ".join(
         [summary or "", description or "", location or "", categories or ""]
     )
-    for category, pattern in _CATEGORY_PATTERNS:
-        if pattern.search(text):
-            return category
-    return "General"
+    best = len(_CATEGORY_NAMES)
+    for hit in _CATEGORY_SCAN.finditer(text):
+        rank = int(_CATEGORY_AT.match(text, hit.start()).lastgroup[1:])
+        if rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return _CATEGORY_NAMES[best] if best < len(_CATEGORY_NAMES) else "General"
+
+
+# Bump when classify_event / detect_free_food change in ways the fingerprint
+# below can't see (logic rather than keywords), so stored events are re-derived.
+ENRICHMENT_VERSION = 1
+
+
+def enrichment_fingerprint() -> str:
+    """Digest of every rule that shapes a processed event.
+
+    Stored events are only reusable under the rules that produced them. Keyword
+    and regex edits change this automatically; logic changes bump
+    ENRICHMENT_VERSION.
+    """
+    parts = [
+        str(ENRICHMENT_VERSION),
+        str(MAX_DESCRIPTION_CHARS),
+        repr(sorted(CALENDAR_NAMES.items())),
+        repr(sorted(_ICS_CATEGORY_MAP.items())),
+    ]
+    parts += [
+        p.pattern
+        for p in (
+            _CATEGORY_SCAN,
+            _CATEGORY_AT,
+            _FOOD_ABSOLUTE,
+            _FOOD_OFFERED,
+            _FOOD_NOUN,
+            _FREE_CUE,
+            _FOOD_VETO,
+            _FOOD_IDIOM,
+            _FOOD_TITLE,
+            _FOOD_SCAN,
+        )
+    ]
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+# Enrichment results by content hash. In-process until configure_caches gives it
+# a file; either way a series repeating its text is classified once.
+_enrichment_memo = EnrichmentMemo(
+    None, enrichment_fingerprint(), ENRICHMENT_MEMO_MAX_ENTRIES
+)
+
+
+def enrich_events(events, processes: Optional[int] = None):
+    """Classify and free-food-tag a whole batch of events, in place.
+
+    ``events`` is a source's dict of event dicts or scrape()'s list of Events.
+
+    Scrapers only parse: an event that leaves its ``tag`` empty is classified
+    here (from its text plus the ICS ``categories`` it may carry, which is then
+    dropped), and every event gets the free-food check — except one marked
+    ``enriched`` (the general feed's indexed events, already tagged when they
+    were stored), which only loses the mark. Each distinct text is
+    worked out once and remembered in ``_enrichment_memo``; with ``processes``
+    above 1, a batch of at least ENRICH_POOL_MIN_JOBS unseen texts is spread
+    over a process pool (default: ENRICH_PROCESSES). The results are identical
+    either way.
+    """
+    if processes is None:
+        processes = ENRICH_PROCESSES
+    memo = _enrichment_memo
+    results: Dict[str, Any] = {}
+    jobs: Dict[str, tuple] = {}
+
+    def need(kind: str, *texts: str) -> str:
+        key = EnrichmentMemo.key(kind, *texts)
+        if key not in results and key not in jobs:
+            value = memo.get(key)
+            if value is None:
+                jobs[key] = (kind, texts)
+            else:
+                results[key] = value
+        return key
+
+    planned = []
+    for ev in events.values() if isinstance(events, dict) else events:
+        if ev.pop("enriched", False):
+            continue
+        summary = ev.get("summary", "")
+        description = ev.get("description", "")
+        location = ev.get("location", "")
+        categories = ev.pop("categories", "")
+        category_key = None
+        if not ev.get("tag"):
+            category_key = need("category", summary, description, location, categories)
+        food_key = None
+        if "Free Food" not in (ev.get("tag") or ""):
+            food_key = need("free_food", summary, description, location)
+        planned.append((ev, category_key, food_key))
+
+    if jobs:
+        keys = list(jobs)
+        values = _run_enrich_jobs([jobs[k] for k in keys], processes)
+        for key, value in zip(keys, values):
+            memo.put(key, value)
+            results[key] = value
+
+    for ev, category_key, food_key in planned:
+        if category_key is not None:
+            ev["tag"] = results[category_key]
+        if food_key is not None and results[food_key]:
+            _add_free_food_tag(ev)
+    logger.info(
+        "Enrichment: %d events, %d new texts worked out", len(planned), len(jobs)
+    )
+    return events
+
+
+def _enrich_job(job: tuple) -> Any:
+    kind, texts = job
+    if kind == "category":
+        return _classify(*texts)
+    return _has_free_food(*texts)
+
+
+def _run_enrich_jobs(jobs: List[tuple], processes: int) -> List[Any]:
+    if processes > 1 and len(jobs) >= ENRICH_POOL_MIN_JOBS:
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                chunk = max(1, len(jobs) // (processes * 4))
+                return list(pool.map(_enrich_job, jobs, chunksize=chunk))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(
+                "Enrichment process pool unavailable (%s) — enriching in-process", e
+            )
+    return [_enrich_job(job) for job in jobs]
+
+
+# VEVENT properties a stored event was derived from. SEQUENCE, LAST-MODIFIED and
+# DTSTAMP mark a revision; the raw text is hashed as well because WebTools does
+# not promise to bump them on every edit, and a hash is far cheaper than the
+# decode + classify it saves.
+_STAMP_PROPS = (
+    "SEQUENCE",
+    "LAST-MODIFIED",
+    "DTSTAMP",
+    "DTSTART",
+    "DTEND",
+    "SUMMARY",
+    "DESCRIPTION",
+    "LOCATION",
+    "CATEGORIES",
+    "URL",
+)
+
+
+def _vevent_stamp(ve: Dict[str, str]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for prop in _STAMP_PROPS:
+        h.update(ve.get(prop, "").encode())
+        h.update(b"\0")
+    return h.hexdigest()
 
 
 def cap_events(
@@ -678,13 +1393,18 @@ def scrape_general() -> Dict[str, Any]:
     """General university calendars — iCal feed first (a stable, published
     contract), falling back to HTML scraping only if the feeds go dark.
     The July 2026 site redesign broke the HTML path for four days; feeds
-    don't churn like markup does."""
-    events, dead_links = _scrape_general_feed()
+    don't churn like markup does.
+
+    Feed and HTML share one identity index, so an HTML copy of an event the
+    feed already gave (same permalink and date) is dropped as soon as it is
+    parsed."""
+    identities = IdentityIndex()
+    events, dead_links = _scrape_general_feed(identities)
     if not events:
         logger.warning(
             "General iCal feeds yielded no events — falling back to HTML scraping."
         )
-        return _scrape_general_html()
+        return _scrape_general_html(identities=identities)
     if dead_links:
         # A broken feed shouldn't drop its calendar — HTML-scrape just those.
         logger.warning(
@@ -692,68 +1412,101 @@ def scrape_general() -> Dict[str, Any]:
             len(dead_links),
             dead_links,
         )
-        for ev in _scrape_general_html(dead_links).values():
+        for ev in _scrape_general_html(dead_links, identities).values():
             events[len(events)] = ev
     return events
 
 
-def _scrape_general_feed() -> tuple:
+def _scrape_general_feed(identities: Optional[IdentityIndex] = None) -> tuple:
     """Read each calendar's whole-calendar ICS feed (icalGmail/<id>.ics).
 
     Returns (events, dead_links) — dead_links are calendars whose feed was
     unreachable or not a calendar at all (a valid-but-empty feed is normal:
     several calendars are dormant, and cross-calendar UID dedup can leave a
-    later calendar with nothing new to add)."""
-    session = create_robust_session()
+    later calendar with nothing new to add). Each event carries its identity
+    keys (UID, permalink) for the merge; ``identities`` is the index they are
+    claimed in, a fresh one if not given."""
+    session = get_session()
     events: Dict[int, Any] = {}
     dead_links: List[str] = []
-    seen_uids: set = set()
-    TZ = ZoneInfo("America/Chicago")
-    cutoff = datetime.now(tz=TZ) - timedelta(
-        days=1
-    )  # feeds include history; keep volume sane
+    if identities is None:
+        identities = IdentityIndex()
+    index = _event_index
+    # Feeds carry years of history. Anything already over is dropped here, before
+    # its text is decoded — drop_past_events would discard it anyway.
+    cutoff = datetime.now(tz=TZ)
 
     for base_link in GENERAL_CALENDAR_LINKS:
         cal_id = base_link.rstrip("/").rsplit("/", 1)[-1]
         if not cal_id.isdigit():
             continue
-        response = safe_request(
-            f"https://calendars.illinois.edu/icalGmail/{cal_id}.ics", session
+        vevents = fetch_feed(
+            f"https://calendars.illinois.edu/icalGmail/{cal_id}.ics",
+            session,
+            _parse_ics_response,
+            stream=True,
         )
-        if not response or "BEGIN:VCALENDAR" not in response.text:
+        if vevents is None:
             logger.warning(
                 "General: unusable ICS feed for calendar %s — will HTML-scrape it",
                 cal_id,
             )
             dead_links.append(base_link)
             continue
-        if "BEGIN:VEVENT" not in response.text:
-            logger.info("General: calendar %s feed is valid but empty", cal_id)
-            continue
 
         count = 0
-        for ve in _parse_ics_events(response.text):
+        vevent_count = 0
+        broken: List[Exception] = []
+        indexed: set = set()  # UIDs this calendar stored or reused this run
+        fresh: List[tuple] = []  # (uid, stamp, event) to enrich, then index
+        reused_count = 0
+        for ve in _until_broken(vevents, broken):
+            vevent_count += 1
             try:
-                summary = _ics_unescape(ve.get("SUMMARY", "")).strip()
+                # Cheap fields first: the time window and UID dedupe reject
+                # most VEVENTs, and the text below is only decoded for survivors.
                 start_raw = ve.get("DTSTART", "")
-                start_dt = _parse_ics_dt(start_raw, TZ)
-                if not summary or not start_dt:
+                start_dt = parse_ics_dt(start_raw, TZ)
+                if not start_dt:
                     continue
 
-                end_dt = _parse_ics_dt(ve.get("DTEND", ""), TZ)
                 if "T" not in start_raw:  # date-only → all-day
                     end_dt = start_dt.replace(hour=23, minute=59)
-                elif not end_dt or end_dt <= start_dt:
-                    end_dt = start_dt + timedelta(hours=1)
+                else:
+                    end_dt = parse_ics_dt(ve.get("DTEND", ""), TZ)
+                    if not end_dt or end_dt <= start_dt:
+                        end_dt = start_dt + timedelta(hours=1)
                 if end_dt < cutoff:
                     continue
 
                 # UID is unique per occurrence and shared across calendars,
-                # so it also dedupes events listed on several feeds.
-                uid = ve.get("UID") or f"{summary}|{start_raw}"
-                if uid in seen_uids:
+                # so it also dedupes events listed on several feeds; the
+                # permalink catches the same occurrence under another UID.
+                uid = ve.get("UID")
+                link = ve.get("URL", "").replace("http://", "https://", 1)
+                keys = event_keys(uid, link, start_dt.date())
+                if uid and identities.known(keys):
                     continue
-                seen_uids.add(uid)
+                stamp = _vevent_stamp(ve) if uid and index is not None else None
+                if stamp is not None:
+                    reused = index.get(cal_id, uid, stamp)
+                    if reused is not None:
+                        identities.claim(keys)
+                        indexed.add(uid)
+                        reused["identity"] = keys
+                        events[len(events)] = reused
+                        count += 1
+                        reused_count += 1
+                        continue
+
+                summary = _ics_unescape(ve.get("SUMMARY", "")).strip()
+                if not summary:
+                    continue
+                if not uid:
+                    uid = f"{summary}|{start_raw}"
+                    keys = event_keys(uid, link, start_dt.date())
+                    if identities.known(keys):
+                        continue
 
                 description = _ics_unescape(ve.get("DESCRIPTION", "")).strip()[
                     :MAX_DESCRIPTION_CHARS
@@ -766,31 +1519,67 @@ def _scrape_general_feed() -> tuple:
                     "description": description,
                     "location": location,
                     "organizer": CALENDAR_NAMES.get(int(cal_id), ""),
-                    "htmlLink": ve.get("URL", "").replace("http://", "https://", 1)
-                    or f"https://calendars.illinois.edu/list/{cal_id}",
-                    "tag": classify_event(
-                        summary, description, location, categories=categories
-                    ),
+                    "htmlLink": link or f"https://calendars.illinois.edu/list/{cal_id}",
+                    "categories": categories,  # for enrich_events, then dropped
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
+                    # Claimed only now: a rejected VEVENT must not keep a later
+                    # valid copy of the event (HTML, another calendar) out.
+                    identities.claim(keys)
                     events[len(events)] = event_info
                     count += 1
+                    if stamp is not None:
+                        fresh.append((uid, stamp, event_info))
+                        indexed.add(uid)
+                    event_info["identity"] = keys  # for the merge, not the index
             except Exception as e:
                 logger.error("General feed: error parsing VEVENT: %s", e)
                 continue
-        logger.info("General feed: %s events from calendar %s", count, cal_id)
+        if fresh:
+            # Indexed events are stored enriched, so a reused one skips
+            # enrich_events entirely; "enriched" tells it so.
+            enrich_events([ev for _, _, ev in fresh])
+            for uid, stamp, ev in fresh:
+                ev["enriched"] = True
+                stored = {k: v for k, v in ev.items() if k != "identity"}
+                index.put(cal_id, uid, stamp, stored)
+        if broken:
+            # Already-kept events stay; dedupe_events folds them into the HTML copies.
+            logger.warning(
+                "General: feed for calendar %s broke off mid-download (%s) — will HTML-scrape it",
+                cal_id,
+                broken[0],
+            )
+            dead_links.append(base_link)
+            continue
+        if index is not None:
+            index.retain(cal_id, indexed)  # past and deleted occurrences age out
+        if not vevent_count:
+            logger.info("General: calendar %s feed is valid but empty", cal_id)
+            continue
+        logger.info(
+            "General feed: %s events from calendar %s (%s reused unchanged)",
+            count,
+            cal_id,
+            reused_count,
+        )
 
     return events, dead_links
 
 
-def _scrape_general_html(links: Optional[List[str]] = None) -> Dict[str, Any]:
-    """Scrape general university calendars from their HTML list pages."""
-    session = create_robust_session()
+def _scrape_general_html(
+    links: Optional[List[str]] = None, identities: Optional[IdentityIndex] = None
+) -> Dict[str, Any]:
+    """Scrape general university calendars from their HTML list pages.
+
+    Entries whose permalink and date are already in ``identities`` (the
+    feed's, when this is its fallback) are skipped."""
+    session = get_session()
     events: Dict[int, Any] = {}
-    seen_links: set = set()  # deduplicate across calendar pages
+    if identities is None:
+        identities = IdentityIndex()
     local_count = 0
     successful_calendars = 0
     failed_calendars = 0
@@ -839,11 +1628,9 @@ def _scrape_general_html(links: Optional[List[str]] = None) -> Dict[str, Any]:
                     # Example date_str: "Tuesday, February 10, 2026"
 
                     # Verify this is actually a date header
-                    try:
-                        # Attempt to parse date to confirm it's a date header
-                        # Format: DayOfWeek, Month Day, Year
-                        current_date_obj = datetime.strptime(date_str, "%A, %B %d, %Y")
-                    except ValueError:
+                    # Format: DayOfWeek, Month Day, Year
+                    current_date_obj = parse_long_date(date_str, weekday=True)
+                    if current_date_obj is None:
                         # Not a date header, skip
                         continue
 
@@ -880,16 +1667,17 @@ def _scrape_general_html(links: Optional[List[str]] = None) -> Dict[str, Any]:
                                 else:
                                     event_info["htmlLink"] = raw_href
 
-                                # Skip duplicates from overlapping calendar pages —
-                                # keyed by (date, link) so a recurring event keeps
-                                # every occurrence, not just its first date.
-                                seen_key = (
-                                    current_date_obj.date(),
-                                    event_info["htmlLink"],
+                                # Skip duplicates from overlapping calendar pages
+                                # and the feed — keyed by (link, date) so a
+                                # recurring event keeps every occurrence, not
+                                # just its first date.
+                                keys = event_keys(
+                                    url=event_info["htmlLink"],
+                                    day=current_date_obj,
                                 )
-                                if seen_key in seen_links:
+                                if identities.known(keys):
                                     continue
-                                seen_links.add(seen_key)
+                                event_info["identity"] = keys
 
                                 # Meta: Time and Location — old markup: div.event-meta with
                                 # li.date / li.location; redesign: dl.entry-meta with
@@ -920,15 +1708,12 @@ def _scrape_general_html(links: Optional[List[str]] = None) -> Dict[str, Any]:
                                 event_info["description"] = (
                                     ""  # List view doesn't have full description
                                 )
-                                event_info["tag"] = classify_event(
-                                    event_info["summary"], "", location
-                                )
+                                # No tag: enrich_events classifies it.
 
                                 # Parse Time
                                 start_dt = None
                                 end_dt = None
 
-                                TZ = ZoneInfo("America/Chicago")
                                 y, mo, d = (
                                     current_date_obj.year,
                                     current_date_obj.month,
@@ -964,7 +1749,7 @@ def _scrape_general_html(links: Optional[List[str]] = None) -> Dict[str, Any]:
 
                                 # Validate and add event
                                 if validate_event(event_info):
-                                    event_info = detect_free_food(event_info)
+                                    identities.claim(keys)
                                     events[local_count] = event_info
                                     local_count += 1
                                     calendar_events += 1
@@ -1014,7 +1799,7 @@ def scrape_state_farm():
     print("\n🔍 Scraping State Farm Center...")
     print(f"   Link: {STATE_FARM_CENTER_CALENDAR_LINK}")
     try:
-        session = create_robust_session()
+        session = get_session()
         response = safe_request(STATE_FARM_CENTER_CALENDAR_LINK, session)
         if not response:
             print("   ❌ Failed to fetch State Farm Center main page")
@@ -1027,121 +1812,268 @@ def scrape_state_farm():
 
         print(f"   Found {len(event_listings)} event listings")
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            )
+        detail_links = []
+        for a in event_listings:
+            event_link = a.get("href")
+            if not event_link:
+                continue
+            if not event_link.startswith("http"):
+                event_link = urljoin("https://www.statefarmcenter.com/", event_link)
+            # SSRF guard: only follow links on the expected host
+            if urlparse(event_link).netloc != _STATEFARM_ALLOWED_HOST:
+                logger.warning("Skipping off-domain URL: %s", event_link)
+                continue
+            if event_link not in detail_links:
+                detail_links.append(event_link)
+
+        # Tier 1: plain HTTP. Most detail pages ship the date sidebar in the
+        # server-rendered HTML, and those never need a browser.
+        ttl = DETAIL_CACHE_TTL.get("state_farm")
+        detail_soups: Dict[str, Any] = {}
+        needs_render = []
+        for event_link, detail_resp in zip(
+            detail_links, fetch_pages(detail_links, cache_ttl=ttl)
+        ):
+            soup = BeautifulSoup(detail_resp.text, "lxml") if detail_resp else None
+            if soup is not None and soup.find("ul", class_="eventDetailList"):
+                detail_soups[event_link] = soup
+            else:
+                needs_render.append(event_link)
 
-            seen_urls = set()
-            for i, a in enumerate(event_listings):
-                try:
-                    event_link = a.get("href")
-                    if not event_link or event_link in seen_urls:
-                        continue
-                    if not event_link.startswith("http"):
-                        event_link = urljoin(
-                            "https://www.statefarmcenter.com/", event_link
+        # Tier 2: Chromium, only for the pages the first tier couldn't use.
+        if needs_render:
+            print(f"   Rendering {len(needs_render)} detail pages in a browser")
+            for event_link, html_text in _render_pages(needs_render, ttl).items():
+                detail_soups[event_link] = BeautifulSoup(html_text, "lxml")
+
+        for i, event_link in enumerate(detail_links):
+            try:
+                detail_soup = detail_soups.get(event_link)
+                if detail_soup is None:
+                    continue
+                print(f"   [{i + 1}/{len(detail_links)}] Detail: {event_link}")
+
+                event_info = {}
+                title_el = detail_soup.find("h1", class_="title") or detail_soup.find(
+                    "h1"
+                )
+                event_info["summary"] = (
+                    title_el.text.strip()
+                    if title_el and title_el.text
+                    else "State Farm Center Event"
+                )
+
+                event_info["description"] = ""
+                desc = detail_soup.find("div", class_="description_inner")
+                if desc:
+                    ps = desc.find_all("p")
+                    event_info["description"] = " ".join(
+                        p.text for p in ps if p.text
+                    ).strip()[:MAX_DESCRIPTION_CHARS]
+
+                event_info["htmlLink"] = event_link
+                event_info["location"] = (
+                    "State Farm Center 1800 S 1st St, Champaign, IL 61820"
+                )
+                event_info["tag"] = "Entertainment"
+
+                sidebar = detail_soup.find("ul", class_="eventDetailList")
+                if sidebar:
+                    month_el = sidebar.find("span", class_="m-date__month")
+                    day_el = sidebar.find("span", class_="m-date__day")
+                    year_el = sidebar.find("span", class_="m-date__year")
+
+                    if month_el and day_el and year_el:
+                        month = month_el.text.strip()
+                        day = int(re.sub(r"\D", "", day_el.text.strip()) or "1")
+                        year = int(
+                            re.sub(r"\D", "", year_el.text.strip())
+                            or str(datetime.now().year)
                         )
-                    # SSRF guard: only follow links on the expected host
-                    if urlparse(event_link).netloc != _STATEFARM_ALLOWED_HOST:
-                        logger.warning("Skipping off-domain URL: %s", event_link)
-                        continue
-                    seen_urls.add(event_link)
-
-                    print(f"   [{i + 1}/{len(event_listings)}] Detail: {event_link}")
-                    page.goto(event_link, wait_until="domcontentloaded", timeout=20000)
-                    detail_soup = BeautifulSoup(page.content(), "lxml")
-
-                    event_info = {}
-                    title_el = detail_soup.find(
-                        "h1", class_="title"
-                    ) or detail_soup.find("h1")
-                    event_info["summary"] = (
-                        title_el.text.strip()
-                        if title_el and title_el.text
-                        else "State Farm Center Event"
-                    )
 
-                    event_info["description"] = ""
-                    desc = detail_soup.find("div", class_="description_inner")
-                    if desc:
-                        ps = desc.find_all("p")
-                        event_info["description"] = " ".join(
-                            p.text for p in ps if p.text
-                        ).strip()[:MAX_DESCRIPTION_CHARS]
-
-                    event_info["htmlLink"] = event_link
-                    event_info["location"] = (
-                        "State Farm Center 1800 S 1st St, Champaign, IL 61820"
-                    )
-                    event_info["tag"] = "Entertainment"
-
-                    sidebar = detail_soup.find("ul", class_="eventDetailList")
-                    if sidebar:
-                        month_el = sidebar.find("span", class_="m-date__month")
-                        day_el = sidebar.find("span", class_="m-date__day")
-                        year_el = sidebar.find("span", class_="m-date__year")
-
-                        if month_el and day_el and year_el:
-                            month = month_el.text.strip()
-                            day = int(re.sub(r"\D", "", day_el.text.strip()) or "1")
-                            year = int(
-                                re.sub(r"\D", "", year_el.text.strip())
-                                or str(datetime.now().year)
-                            )
-
-                            start_li = sidebar.find(
-                                "li", class_="item sidebar_event_starts"
-                            )
-                            start_time_str = (
-                                start_li.find("span").text.strip()
-                                if start_li and start_li.find("span")
-                                else ""
-                            )
-
-                            t = parse_12h_time(start_time_str)
-                            # Default to 7PM if time missing but date exists
-                            hour, minute = t if t else (19, 0)
-                            start_dt = datetime(
-                                year,
-                                parse_month_to_number(month),
-                                day,
-                                hour,
-                                minute,
-                                tzinfo=ZoneInfo("America/Chicago"),
-                            )
-
-                            end_dt = start_dt + timedelta(hours=3)
-                            event_info["start"] = start_dt.isoformat()
-                            event_info["end"] = end_dt.isoformat()
-                        else:
-                            event_info["start"] = ""
-                            event_info["end"] = ""
+                        start_li = sidebar.find(
+                            "li", class_="item sidebar_event_starts"
+                        )
+                        start_time_str = (
+                            start_li.find("span").text.strip()
+                            if start_li and start_li.find("span")
+                            else ""
+                        )
+
+                        t = parse_12h_time(start_time_str)
+                        # Default to 7PM if time missing but date exists
+                        hour, minute = t if t else (19, 0)
+                        start_dt = datetime(
+                            year,
+                            parse_month_to_number(month),
+                            day,
+                            hour,
+                            minute,
+                            tzinfo=TZ,
+                        )
+
+                        end_dt = start_dt + timedelta(hours=3)
+                        event_info["start"] = start_dt.isoformat()
+                        event_info["end"] = end_dt.isoformat()
+                        # One detail page can list several showings a day.
+                        event_info["identity"] = event_keys(
+                            url=event_link, day=start_dt
+                        )
                     else:
                         event_info["start"] = ""
                         event_info["end"] = ""
+                else:
+                    event_info["start"] = ""
+                    event_info["end"] = ""
 
-                    event_info = {
-                        k: (v.strip() if isinstance(v, str) else v)
-                        for k, v in event_info.items()
-                    }
-                    event_info = detect_free_food(event_info)
-                    if not validate_event(event_info):
-                        continue
-                    events[local_count] = event_info
-                    local_count += 1
-
-                except Exception as e:
-                    print(f"      ⚠️  Error processing {event_link}: {e}")
+                event_info = {
+                    k: (v.strip() if isinstance(v, str) else v)
+                    for k, v in event_info.items()
+                }
+                if not validate_event(event_info):
                     continue
+                events[local_count] = event_info
+                local_count += 1
 
-            browser.close()
+            except Exception as e:
+                print(f"      ⚠️  Error processing {event_link}: {e}")
+                continue
     except Exception as e:
         print(f"   ❌ Error in scrape_state_farm: {e}")
     return events
 
 
+def _browser_request_allowed(
+    resource_type: str, url: str, first_party: str = _STATEFARM_ALLOWED_HOST
+) -> bool:
+    """Whether the render browser should let a subresource request through."""
+    host = (urlparse(url).hostname or "").lower()
+    if any(host == h or host.endswith("." + h) for h in BROWSER_BLOCKED_HOSTS):
+        return False
+    if resource_type in BROWSER_ALLOWED_RESOURCE_TYPES:
+        return True
+    return resource_type in BROWSER_FIRST_PARTY_RESOURCE_TYPES and host == first_party
+
+
+async def _route_request(route) -> None:
+    request = route.request
+    if _browser_request_allowed(request.resource_type, request.url):
+        await route.continue_()
+    else:
+        await route.abort()
+
+
+def _render_pages(urls: List[str], ttl: Optional[float]) -> Dict[str, str]:
+    """Rendered HTML for each of ``urls`` that Chromium could load, by URL.
+
+    Cached and replayed pages come back without a browser. Playwright is
+    imported and Chromium launched only when something is left to render;
+    without Playwright installed those pages are skipped with a warning rather
+    than failing the source.
+    """
+    rendered: Dict[str, str] = {}
+    missing = []
+    for url in urls:
+        try:
+            body = _stored_render(url, ttl)
+        except LookupError as e:
+            logger.warning(str(e))
+            continue
+        if body is None:
+            missing.append(url)
+        else:
+            rendered[url] = body
+    if not missing:
+        return rendered
+
+    try:
+        fresh = asyncio.run(_render_in_browser(missing))
+    except ImportError:
+        logger.warning(
+            "Playwright is not installed; skipping %d page(s) that need a browser",
+            len(missing),
+        )
+        return rendered
+    except Exception as e:
+        logger.warning("Browser rendering failed: %s", e)
+        return rendered
+    for url in missing:
+        if url in fresh:
+            _remember_render(url, ttl, fresh[url])
+            rendered[url] = fresh[url]
+    return rendered
+
+
+async def _render_in_browser(urls: List[str]) -> Dict[str, str]:
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            return await _render_with_browser(browser, urls)
+        finally:
+            await browser.close()
+
+
+async def _render_with_browser(
+    browser,
+    urls: List[str],
+    pages: int = RENDER_PAGES,
+    timeout: float = RENDER_TIMEOUT,
+) -> Dict[str, str]:
+    """Render ``urls`` on up to ``pages`` pages of one browser at a time.
+
+    Each worker owns a context + page and pulls URLs off a shared queue. A page
+    that errors, crashes or overruns ``timeout`` is closed with its context and
+    replaced before the worker's next URL, so one bad page never poisons the
+    rest of the run. Pages that failed are simply absent from the result.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    results: Dict[str, str] = {}
+
+    async def open_page():
+        context = await browser.new_context(
+            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+        )
+        page = await context.new_page()
+        await page.route("**/*", _route_request)
+        return context, page
+
+    async def load(page, url: str) -> str:
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+        return await page.content()
+
+    async def worker() -> None:
+        context = page = None
+        try:
+            while not queue.empty():
+                url = queue.get_nowait()
+                try:
+                    if page is None:
+                        context, page = await open_page()
+                    results[url] = await asyncio.wait_for(load(page, url), timeout)
+                except Exception as e:
+                    logger.warning("Could not render %s: %r", url, e)
+                    if context is not None:
+                        await _close_quietly(context)
+                    context = page = None
+        finally:
+            if context is not None:
+                await _close_quietly(context)
+
+    await asyncio.gather(*(worker() for _ in range(min(pages, len(urls)))))
+    return results
+
+
+async def _close_quietly(context) -> None:
+    try:
+        await context.close()
+    except Exception:
+        pass  # already gone with a crashed page
+
+
 def scrape_athletics():
     """Home games for the four ticketed sports — Sidearm ICS feed first,
     HTML schedule pages as fallback (the markup broke silently in July 2026;
@@ -1156,19 +2088,21 @@ def scrape_athletics():
 
 
 def _scrape_athletics_feed() -> Dict[str, Any]:
-    session = create_robust_session()
+    session = get_session()
     events: Dict[int, Any] = {}
-    TZ = ZoneInfo("America/Chicago")
 
     print("\n🔍 Scraping Athletics ICS feeds...")
     for sport, feed_url, schedule_url in ATHLETICS_ICS_FEEDS:
-        response = safe_request(feed_url, session)
-        if not response or "BEGIN:VEVENT" not in response.text:
+        vevents = fetch_feed(feed_url, session, _parse_ics_response, stream=True)
+        if vevents is None:
             logger.warning("Athletics: no usable ICS feed for %s", sport)
             continue
 
         count = 0
-        for ve in _parse_ics_events(response.text):
+        vevent_count = 0
+        broken: List[Exception] = []
+        for ve in _until_broken(vevents, broken):
+            vevent_count += 1
             try:
                 summary = _ics_unescape(ve.get("SUMMARY", "")).strip()
                 # Past games carry a result prefix like "[W] " — strip it.
@@ -1179,10 +2113,10 @@ def _scrape_athletics_feed() -> Dict[str, Any]:
                     continue
                 opponent = re.split(r"\s+[-–—|]\s+", m.group(1))[0].strip()
 
-                start_dt = _parse_ics_dt(ve.get("DTSTART", ""), TZ)
+                start_dt = parse_ics_dt(ve.get("DTSTART", ""), TZ)
                 if not start_dt:
                     continue
-                end_dt = _parse_ics_dt(ve.get("DTEND", ""), TZ) or start_dt + timedelta(
+                end_dt = parse_ics_dt(ve.get("DTEND", ""), TZ) or start_dt + timedelta(
                     hours=3
                 )
 
@@ -1198,20 +2132,26 @@ def _scrape_athletics_feed() -> Dict[str, Any]:
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[len(events)] = event_info
                     count += 1
             except Exception as e:
                 logger.error("Athletics feed: error parsing VEVENT: %s", e)
                 continue
+        if broken:
+            logger.warning(
+                "Athletics: %s feed broke off mid-download: %s", sport, broken[0]
+            )
+        if not vevent_count:
+            logger.warning("Athletics: no usable ICS feed for %s", sport)
+            continue
         print(f"   ✅ {sport}: {count} home games from feed")
 
     return events
 
 
 def _scrape_athletics_html():
-    session = create_robust_session()
+    session = get_session()
     events: Dict[int, Any] = {}
     local_count = 0
 
@@ -1345,7 +2285,7 @@ def _scrape_athletics_html():
                             day,
                             hour,
                             minute,
-                            tzinfo=ZoneInfo("America/Chicago"),
+                            tzinfo=TZ,
                         )
                         end_dt = start_dt + timedelta(hours=3)
                         event_info["start"] = start_dt.isoformat()
@@ -1355,7 +2295,6 @@ def _scrape_athletics_html():
                         k: (v.strip() if isinstance(v, str) else v)
                         for k, v in event_info.items()
                     }
-                    event_info = detect_free_food(event_info)
                     if not validate_event(event_info):
                         continue
                     events[local_count] = event_info
@@ -1378,8 +2317,7 @@ def scrape_kcpa() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping Krannert Center for the Performing Arts...")
     try:
@@ -1393,31 +2331,34 @@ def scrape_kcpa() -> Dict[str, Any]:
         print(f"   Found {len(rows)} event rows")
 
         seen_hrefs: set = set()
+        listings = []
         for row in rows:
-            try:
-                link_el = row.find("a")
-                if not link_el:
-                    continue
-                href = link_el.get("href", "")
-                if not href or href in seen_hrefs:
-                    continue
-                seen_hrefs.add(href)
-                event_url = (
-                    href
-                    if href.startswith("http")
-                    else "https://krannertcenter.com" + href
-                )
+            link_el = row.find("a")
+            if not link_el:
+                continue
+            href = link_el.get("href", "")
+            if not href or href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+            event_url = (
+                href if href.startswith("http") else "https://krannertcenter.com" + href
+            )
 
-                # Parse date from list row — "JUL 16, 2026" or "Th Jul 16, 2026 - 5:30pm CT"
-                date_el = row.find(class_=re.compile("date", re.I))
-                list_date_text = (
-                    date_el.get_text(strip=True)
-                    if date_el
-                    else row.get_text(" ", strip=True)
-                )
+            # Parse date from list row — "JUL 16, 2026" or "Th Jul 16, 2026 - 5:30pm CT"
+            date_el = row.find(class_=re.compile("date", re.I))
+            list_date_text = (
+                date_el.get_text(strip=True)
+                if date_el
+                else row.get_text(" ", strip=True)
+            )
+            listings.append((link_el, event_url, list_date_text))
 
-                # Fetch detail page for time + venue + description
-                detail_resp = safe_request(event_url, session)
+        # Fetch detail pages for time + venue + description, all at once
+        details = fetch_pages(
+            [url for _, url, _ in listings], cache_ttl=DETAIL_CACHE_TTL.get("kcpa")
+        )
+        for (link_el, event_url, list_date_text), detail_resp in zip(listings, details):
+            try:
                 if not detail_resp:
                     continue
                 detail = BeautifulSoup(detail_resp.text, "lxml")
@@ -1439,7 +2380,7 @@ def scrape_kcpa() -> Dict[str, Any]:
                     f"{venue}, Krannert Center, 500 S Goodwin Ave, Urbana, IL 61801"
                 )
 
-                # Price / tag — default to Performances; detect_free_food handles food keywords separately
+                # Price / tag — default to Performances; enrich_events adds any free-food tag
                 tag = "Performances"
 
                 # Date + time from detail event-date: "Th Jul 16, 2026 - 5:30pm CT"
@@ -1480,8 +2421,9 @@ def scrape_kcpa() -> Dict[str, Any]:
                     "htmlLink": event_url,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    # by start time: a show's matinee and evening share a page
+                    "identity": event_keys(url=event_url, day=start_dt),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -1507,8 +2449,7 @@ def scrape_kam() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping Krannert Art Museum...")
     try:
@@ -1595,8 +2536,8 @@ def scrape_kam() -> Dict[str, Any]:
                     "htmlLink": event_url,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    "identity": event_keys(url=event_url, day=start_dt),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -1621,8 +2562,7 @@ def scrape_music() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping School of Music events...")
     try:
@@ -1673,14 +2613,10 @@ def scrape_music() -> Dict[str, Any]:
                     continue
 
                 # Parse date "July 5, 2026"
-                try:
-                    date_obj = datetime.strptime(date_text, "%B %d, %Y")
-                except ValueError:
-                    try:
-                        date_obj = datetime.strptime(date_text, "%B %d %Y")
-                    except ValueError:
-                        logger.warning("Music: could not parse date %r", date_text)
-                        continue
+                date_obj = parse_long_date(date_text)
+                if date_obj is None:
+                    logger.warning("Music: could not parse date %r", date_text)
+                    continue
 
                 y, mo, d = date_obj.year, date_obj.month, date_obj.day
 
@@ -1711,8 +2647,8 @@ def scrape_music() -> Dict[str, Any]:
                     "htmlLink": event_url,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    "identity": event_keys(url=event_url, day=start_dt),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -1737,8 +2673,7 @@ def scrape_spurlock() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping Spurlock Museum events...")
     try:
@@ -1814,8 +2749,8 @@ def scrape_spurlock() -> Dict[str, Any]:
                     "htmlLink": event_url,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    "identity": event_keys(url=event_url, day=start_dt),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -1831,6 +2766,14 @@ def scrape_spurlock() -> Dict[str, Any]:
     return events
 
 
+def _parse_parkland_response(response) -> Optional[Any]:
+    try:
+        return response.json()
+    except ValueError as e:
+        logger.error("Parkland: invalid JSON: %s", e)
+        return None
+
+
 def scrape_parkland() -> Dict[str, Any]:
     """Scrape Parkland College events from its 25Live Publisher JSON feed.
 
@@ -1840,22 +2783,15 @@ def scrape_parkland() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping Parkland College events...")
     try:
-        response = safe_request(PARKLAND_EVENTS_JSON, session)
-        if not response:
+        feed = fetch_feed(PARKLAND_EVENTS_JSON, session, _parse_parkland_response)
+        if feed is None:
             print("   ❌ Failed to fetch Parkland feed")
             return events
 
-        try:
-            feed = response.json()
-        except ValueError as e:
-            logger.error("Parkland: invalid JSON: %s", e)
-            return events
-
         print(f"   Found {len(feed)} feed entries")
         for item in feed:
             try:
@@ -1909,11 +2845,8 @@ def scrape_parkland() -> Dict[str, Any]:
                 else:
                     end_dt = start_dt + timedelta(hours=1)
 
-                web_link = (
-                    item.get("permaLinkUrl")
-                    or item.get("webLink")
-                    or PARKLAND_EVENTS_JSON
-                )
+                permalink = item.get("permaLinkUrl") or item.get("webLink")
+                web_link = permalink or PARKLAND_EVENTS_JSON
 
                 event_info = {
                     "summary": summary,
@@ -1923,8 +2856,9 @@ def scrape_parkland() -> Dict[str, Any]:
                     "htmlLink": web_link,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    # the feed URL stands in for a missing permalink: no key
+                    "identity": event_keys(url=permalink, day=start_dt),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -1948,8 +2882,7 @@ def scrape_urbana_library() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping Urbana Free Library events...")
     try:
@@ -2027,8 +2960,8 @@ def scrape_urbana_library() -> Dict[str, Any]:
                     "htmlLink": href,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    "identity": event_keys(url=href, day=start_dt),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -2053,8 +2986,7 @@ def scrape_gies() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping Gies College of Business events...")
     try:
@@ -2121,8 +3053,8 @@ def scrape_gies() -> Dict[str, Any]:
                     "htmlLink": event_url,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    "identity": event_keys(url=event_url, day=start_dt),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -2148,8 +3080,7 @@ def scrape_cs() -> Dict[str, Any]:
     """
     events: Dict[int, Any] = {}
     local_count = 0
-    session = create_robust_session()
-    TZ = ZoneInfo("America/Chicago")
+    session = get_session()
 
     print("\n🔍 Scraping Siebel School (CS) calendar...")
     try:
@@ -2225,8 +3156,9 @@ def scrape_cs() -> Dict[str, Any]:
                     "htmlLink": event_url,
                     "start": start_dt.isoformat(),
                     "end": end_dt.isoformat(),
+                    # calendars.illinois.edu permalinks, as general's are
+                    "identity": event_keys(url=event_url, day=start_dt.date()),
                 }
-                event_info = detect_free_food(event_info)
                 if validate_event(event_info):
                     events[local_count] = event_info
                     local_count += 1
@@ -2254,7 +3186,7 @@ def _refresh_academic_terms(food_resources_module) -> None:
     fallback in place, because wrong term dates are worse than stale ones.
     """
     try:
-        response = safe_request(ACADEMIC_DATES_FEED, create_robust_session())
+        response = safe_request(ACADEMIC_DATES_FEED, get_session())
         if not response:
             return
         terms = food_resources_module.derive_academic_terms(
@@ -2311,34 +3243,28 @@ FOOD_DIRECTORY_FILE = os.path.join(os.path.dirname(__file__), "food_resources.js
 
 
 def drop_past_events(
-    events: Dict[Any, Dict[str, Any]], now: Optional[datetime] = None
-) -> Dict[Any, Dict[str, Any]]:
-    """Remove events whose end time is already in the past (re-keyed sequentially)."""
-    TZ = ZoneInfo("America/Chicago")
+    events: List[Event], now: Optional[datetime] = None
+) -> List[Event]:
+    """Remove events whose end time is already in the past."""
     if now is None:
         now = datetime.now(tz=TZ)
+    return [ev for ev in events if not _is_past(ev, now)]
 
-    result: Dict[int, Any] = {}
-    for ev in events.values():
-        end_raw = ev.get("end") or ev.get("start")
-        if not end_raw:
-            result[len(result)] = ev
-            continue
-        try:
-            end_dt = datetime.fromisoformat(end_raw)
-            if end_dt.tzinfo is None:
-                end_dt = end_dt.replace(tzinfo=TZ)
-        except (ValueError, TypeError):
-            result[len(result)] = ev  # keep if unparseable
-            continue
-        if end_dt >= now:
-            result[len(result)] = ev
-    return result
+
+def _is_past(ev: Event, now: datetime) -> bool:
+    """True once the event has ended; never for no date or one that doesn't
+    parse."""
+    end_dt = ev.end or ev.start
+    if not isinstance(end_dt, datetime):
+        return False
+    if end_dt.tzinfo is None:
+        end_dt = end_dt.replace(tzinfo=TZ)
+    return end_dt < now
 
 
 def cap_recurring_series(
-    events: Dict[Any, Dict[str, Any]], max_per_series: int = MAX_OCCURRENCES_PER_SERIES
-) -> Dict[Any, Dict[str, Any]]:
+    events: List[Event], max_per_series: int = MAX_OCCURRENCES_PER_SERIES
+) -> List[Event]:
     """Keep only the next N occurrences of each same-titled series.
 
     The frontend already collapses same-titled events into a single card, so
@@ -2350,32 +3276,52 @@ def cap_recurring_series(
     count and final date — so the cadence label stays honest after trimming.
     Run this *after* drop_past_events and dedupe, so "next N" means upcoming.
     """
-    groups: Dict[str, List[Any]] = {}
-    for key, ev in events.items():
-        groups.setdefault(_normalize_title(ev.get("summary", "")), []).append(key)
-
-    keep: set = set()
-    for member_keys in groups.values():
-        member_keys.sort(key=lambda k: events[k].get("start") or "")
-        if len(member_keys) <= max_per_series:
-            keep.update(member_keys)
+    titles = [_normalize_title(ev.summary) for ev in events]
+    dropped = _cap_series(events, titles, max_per_series)
+    if not dropped:
+        return events
+    return [ev for ev in events if id(ev) not in dropped]
+
+
+def _cap_series(
+    events: List[Event], titles: List[str], max_per_series: int
+) -> Set[int]:
+    """Mark the first ``max_per_series`` of each longer series with its
+    totals; return the ids of the rest."""
+    groups: Dict[str, List[Event]] = {}
+    for ev, title in zip(events, titles):
+        groups.setdefault(title, []).append(ev)
+
+    dropped: Set[int] = set()
+    for members in groups.values():
+        if len(members) <= max_per_series:
             continue
-        total = len(member_keys)
-        last_start = events[member_keys[-1]].get("start") or ""
-        for k in member_keys[:max_per_series]:
-            events[k]["series_total"] = total
-            events[k]["series_end"] = last_start
-            keep.add(k)
+        members.sort(key=lambda ev: ev.get("start") or "")
+        total = len(members)
+        last_start = members[-1].get("start") or ""
+        for ev in members[:max_per_series]:
+            ev.series_total = total
+            ev.series_end = last_start
+        dropped.update(map(id, members[max_per_series:]))
+    return dropped
+
 
-    return {i: ev for i, (k, ev) in enumerate(events.items()) if k in keep}
+_NON_ALNUM_RUN = re.compile(r"[^a-z0-9]+")
 
 
 def _normalize_title(title: str) -> str:
     """Lowercase and collapse non-alphanumerics for fuzzy title comparison."""
-    return re.sub(r"[^a-z0-9]+", " ", (title or "").lower()).strip()
+    return _NON_ALNUM_RUN.sub(" ", (title or "").lower()).strip()
+
 
+def _start_minute(start: Any) -> Any:
+    """Start to the minute, as wall-clock fields (raw text if it didn't parse)."""
+    if isinstance(start, datetime):
+        return start.year, start.month, start.day, start.hour, start.minute
+    return (start or "")[:16]  # YYYY-MM-DDTHH:MM
 
-def dedupe_events(events: Dict[Any, Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+
+def dedupe_events(events: List[Event]) -> List[Event]:
     """Drop duplicate events across sources, keyed by (normalized title, start datetime).
 
     The start is compared to the minute so the same event listed on several
@@ -2385,40 +3331,164 @@ def dedupe_events(events: Dict[Any, Dict[str, Any]]) -> Dict[Any, Dict[str, Any]
     prevails (e.g. KCPA over a bare calendars.illinois.edu row). Events lacking a
     title or start are always kept.
     """
-    chosen: Dict[Any, Dict[str, Any]] = {}
-    order: List[Any] = []
-
-    for ev in events.values():
-        title = _normalize_title(ev.get("summary", ""))
-        start = (ev.get("start") or "")[:16]  # YYYY-MM-DDTHH:MM
-        if not title or not start:
-            key = ("__unique__", len(order))
-        else:
-            key = (title, start)
+    titles = [_normalize_title(ev.summary) for ev in events]
+    return _dedupe(events, titles)[0]
+
+
+def _dedupe(events: List[Event], titles: List[str]) -> Tuple[List[Event], List[str]]:
+    """dedupe_events over titles already normalized; returns the winners and
+    their titles."""
+    # Insertion-ordered: a richer duplicate takes its slot, not the end.
+    chosen: Dict[Any, Tuple[Event, str]] = {}
+    for i, (ev, title) in enumerate(zip(events, titles)):
+        start = _start_minute(ev.start)
+        key = (title, start) if title and start else i
+
+        existing = chosen.get(key)
+        if existing is None or len(ev.description or "") > len(
+            existing[0].description or ""
+        ):
+            chosen[key] = (ev, title)
+    return [ev for ev, _ in chosen.values()], [title for _, title in chosen.values()]
+
+
+def near_dedupe_events(
+    events: List[Event],
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    window_minutes: int = NEAR_DUPLICATE_WINDOW_MINUTES,
+) -> List[Event]:
+    """Collapse near-identical listings of one event from different sources.
+
+    Run after dedupe_events. Candidates come from MinHash/LSH over title
+    shingles in start-time buckets (see neardup.py), so the cost grows with
+    the number of events, not pairs of them. As in dedupe_events, the richer
+    (longer) description wins and takes the first listing's place.
+    """
+    titles = [_normalize_title(ev.summary) for ev in events]
+    order = _near_duplicate_order(events, titles, threshold, window_minutes)
+    return [events[i] for i in order]
+
+
+def _near_duplicate_order(
+    events: List[Event], titles: List[str], threshold: float, window_minutes: int
+) -> List[int]:
+    """Indices of the events to keep, in order, with each cluster of near
+    duplicates represented by its winner at its first member's position."""
+    positions = []
+    items = []
+    for i, (ev, title) in enumerate(zip(events, titles)):
+        start = ev.start
+        if not title or not isinstance(start, datetime):
+            continue
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=TZ)
+        positions.append(i)
+        items.append((neardup.shingles(title), int(start.timestamp()), ev.source))
+    pairs = neardup.near_duplicate_pairs(items, threshold, window_minutes * 60)
+    if not pairs:
+        return list(range(len(events)))
+
+    # Union the most similar pairs first; a cluster never takes in a second
+    # listing from a source it already has — one source's two events at the
+    # same hour are two events.
+    parent = list(range(len(items)))
+    sources = [{source} for _, _, source in items]
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for _, a, b in pairs:
+        ra, rb = find(a), find(b)
+        if ra == rb or sources[ra] & sources[rb]:
+            continue
+        ra, rb = min(ra, rb), max(ra, rb)  # the root is the first listing
+        parent[rb] = ra
+        sources[ra] |= sources[rb]
+
+    winner: Dict[int, int] = {}  # cluster root → position of its richest event
+    for k, i in enumerate(positions):
+        root = find(k)
+        best = winner.get(root)
+        if best is None or len(events[i].description or "") > len(
+            events[best].description or ""
+        ):
+            winner[root] = i
+    replaced = {positions[root]: i for root, i in winner.items()}
+    absorbed = {positions[k] for k in range(len(items)) if find(k) != k}
+    return [replaced.get(i, i) for i in range(len(events)) if i not in absorbed]
+
+
+def event_id(event: Event, keys: Sequence[str] = ()) -> str:
+    """The stable ID ``event`` is published under: from its identity keys
+    (UID, permalink), or for sources without them its normalized title and
+    start minute — what dedupe_events already treats as one event."""
+    if not keys:
+        start = (event.get("start") or "")[:16]
+        keys = [f"title:{_normalize_title(event.summary)}@{start}"]
+    return stable_id(keys)
+
+
+def publish_events(events: List[Event]) -> Dict[str, Dict[str, Any]]:
+    """The published mapping: each event under its stable ID, in list order.
+
+    Two kept events can share an ID only if they lack a title or a start,
+    which dedupe never merges; the later ones get "-2", "-3"… appended.
+    """
+    published: Dict[str, Dict[str, Any]] = {}
+    for ev in events:
+        base = ev.id or event_id(ev)
+        key, n = base, 1
+        while key in published:
+            n += 1
+            key = f"{base}-{n}"
+        published[key] = ev.to_dict()
+    return published
+
+
+def postprocess_events(
+    events: List[Event],
+    now: Optional[datetime] = None,
+    max_per_series: int = MAX_OCCURRENCES_PER_SERIES,
+    near_threshold: float = NEAR_DUPLICATE_THRESHOLD,
+) -> tuple:
+    """drop_past_events, dedupe_events, near_dedupe_events and
+    cap_recurring_series, fused.
+
+    The four share their helpers; here each event's title is normalized once
+    and serves dedupe, near-duplicate shingling and series grouping. Returns
+    (kept events, count after the past-filter, count after dedupe, count after
+    near-dedupe) — the result and counts are exactly those of running the four
+    in turn.
+    """
+    if now is None:
+        now = datetime.now(tz=TZ)
 
-        if key not in chosen:
-            chosen[key] = ev
-            order.append(key)
-        else:
-            existing = chosen[key]
-            if len(ev.get("description") or "") > len(
-                existing.get("description") or ""
-            ):
-                chosen[key] = ev
+    events = [ev for ev in events if not _is_past(ev, now)]
+    after_past = len(events)
+
+    events, titles = _dedupe(events, [_normalize_title(ev.summary) for ev in events])
+    after_dedupe = len(events)
 
-    result: Dict[int, Any] = {}
-    for key in order:
-        result[len(result)] = chosen[key]
-    return result
+    order = _near_duplicate_order(
+        events, titles, near_threshold, NEAR_DUPLICATE_WINDOW_MINUTES
+    )
+    events = [events[i] for i in order]
+    titles = [titles[i] for i in order]
+
+    dropped = _cap_series(events, titles, max_per_series)
+    kept = [ev for ev in events if id(ev) not in dropped]
+    return kept, after_past, after_dedupe, len(events)
 
 
 # Scrape All Function
-def scrape():
+def scrape(max_workers: int = SCRAPE_WORKERS, processes: Optional[int] = None):
     global last_scrape_stats
-    combined_json_data = {}
     last_scrape_stats = {}
 
-    for scraper_name, scraper_fn in [
+    sources = [
         ("state_farm", scrape_state_farm),
         ("athletics", scrape_athletics),
         ("general", scrape_general),
@@ -2431,15 +3501,14 @@ def scrape():
         ("gies", scrape_gies),
         ("cs", scrape_cs),
         ("food_resources", scrape_food_resources),
-    ]:
+    ]
+
+    def run_source(scraper_name, scraper_fn) -> Dict[Any, Dict[str, Any]]:
         source_events = {}
         try:
             scraped = scraper_fn()
             if isinstance(scraped, dict):
                 source_events = cap_events(scraped, MAX_EVENTS_PER_SOURCE)
-                for event in source_events.values():
-                    event["source"] = scraper_name  # enables per-source salvage
-                    combined_json_data[len(combined_json_data)] = event
             else:
                 logger.warning(
                     f"{scraper_name} scraper returned non-dict payload; skipping merge."
@@ -2449,7 +3518,43 @@ def scrape():
         finally:
             source_count = len(source_events) if isinstance(source_events, dict) else 0
             status = "success" if source_count > 0 else "empty_or_failed"
-            last_scrape_stats[scraper_name] = {"events": source_count, "status": status}
+            with _stats_lock:
+                last_scrape_stats[scraper_name] = {
+                    "events": source_count,
+                    "status": status,
+                }
+        return source_events
+
+    if max_workers <= 1:
+        results = [run_source(name, fn) for name, fn in sources]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(sources)), thread_name_prefix="scrape"
+        ) as pool:
+            results = list(pool.map(lambda src: run_source(*src), sources))
+
+    # Merge in source order, not completion order — keys, dedupe winners and the
+    # published file must not depend on which host happened to answer first.
+    # From here to the end the batch is one list of compact Events. A listing
+    # whose UID or permalink an earlier source already brought is dropped here,
+    # before it is enriched or stored.
+    identities = IdentityIndex()
+    events: List[Event] = []
+    for (scraper_name, _), source_events in zip(sources, results):
+        for event in source_events.values():
+            keys = event.pop("identity", ())
+            if not identities.claim(keys):
+                continue
+            # source enables per-source salvage
+            merged = Event.from_dict(event, source=scraper_name)
+            merged.id = event_id(merged, keys)
+            events.append(merged)
+    if identities.duplicates:
+        logger.info(
+            "Identity index: %d listings already merged from another source",
+            identities.duplicates,
+        )
+    last_scrape_stats = {name: last_scrape_stats[name] for name, _ in sources}
 
     logger.info("Scrape summary by source: %s", last_scrape_stats)
 
@@ -2463,10 +3568,12 @@ def scrape():
                 previous = json.load(f)
         except (OSError, ValueError):
             previous = {}
-        for ev in previous.values():
+        for previous_id, ev in previous.items():
             src = ev.get("source")
             if src in empty_sources:
-                combined_json_data[len(combined_json_data)] = ev
+                salvaged = Event.from_dict(ev)
+                salvaged.id = previous_id  # the ID clients already know it by
+                events.append(salvaged)
                 stats = last_scrape_stats[src]
                 stats["salvaged"] = stats.get("salvaged", 0) + 1
                 stats["status"] = "salvaged_from_previous_run"
@@ -2479,32 +3586,47 @@ def scrape():
                     salvaged,
                 )
 
-    raw_count = len(combined_json_data)
-    combined_json_data = drop_past_events(combined_json_data)
-    after_past = len(combined_json_data)
-    combined_json_data = dedupe_events(combined_json_data)
-    after_dedupe = len(combined_json_data)
-    combined_json_data = cap_recurring_series(combined_json_data)
-    after_series = len(combined_json_data)
+    raw_count = len(events)
+    events, after_past, after_dedupe, after_near = postprocess_events(events)
+    after_series = len(events)
+    # Sources only parse; classification and free-food tagging run once, over
+    # the events that survived the filters above.
+    enrich_events(events, processes)
     logger.info(
         "Post-processing: %d merged -> %d after past-filter (-%d) -> %d after dedupe (-%d)"
-        " -> %d after series cap (-%d)",
+        " -> %d after near-dedupe (-%d) -> %d after series cap (-%d)",
         raw_count,
         after_past,
         raw_count - after_past,
         after_dedupe,
         after_past - after_dedupe,
+        after_near,
+        after_dedupe - after_near,
         after_series,
-        after_dedupe - after_series,
+        after_near - after_series,
     )
-    logger.info("Total events: %s", len(combined_json_data))
-
-    return combined_json_data
-
-
-def main():
+    logger.info("Total events: %s", len(events))
+
+    return publish_events(events)
+
+
+def main(
+    cache_dir: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    processes: Optional[int] = None,
+):
+    """Scrape, health-check and publish. ``output_dir`` takes the published
+    files instead of their committed place beside this script (a replay must
+    never overwrite those); ``processes`` goes to enrich_events."""
+    if cache_dir is not None:
+        configure_caches(cache_dir)
+    output_file, food_file = OUTPUT_FILE, FOOD_DIRECTORY_FILE
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        output_file = os.path.join(output_dir, os.path.basename(OUTPUT_FILE))
+        food_file = os.path.join(output_dir, os.path.basename(FOOD_DIRECTORY_FILE))
     print("Scraping events...")
-    data = scrape()
+    data = scrape(processes=processes)
     source_event_total = sum(
         stat.get("events", 0) for stat in last_scrape_stats.values()
     )
@@ -2546,19 +3668,75 @@ def main():
             print(f"::warning title=Empty scraper source::{warn}")
 
     # Save to JSON file (minified for faster loading)
-    with open(OUTPUT_FILE, "w") as f:
+    with open(output_file, "w") as f:
         json.dump(data, f, separators=(",", ":"))
 
-    print(f"Scraped {len(data)} events. Saved to {OUTPUT_FILE}")
+    print(f"Scraped {len(data)} events. Saved to {output_file}")
+    save_caches()
 
     # The curated food table also ships as a standalone directory for the
     # "Food Resources" panel, so the frontend never re-implements the list.
     from food_resources import food_directory
 
-    with open(FOOD_DIRECTORY_FILE, "w") as f:
+    with open(food_file, "w") as f:
         json.dump(food_directory(), f, separators=(",", ":"))
-    print(f"Wrote {len(food_directory())} food resources to {FOOD_DIRECTORY_FILE}")
+    print(f"Wrote {len(food_directory())} food resources to {food_file}")
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Scrape campus events.")
+    parser.add_argument(
+        "--cache-dir",
+        default=CACHE_DIR,
+        help="where persistent caches live (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="fetch everything in full and leave the caches untouched",
+    )
+    parser.add_argument(
+        "--enrich-processes",
+        type=int,
+        default=ENRICH_PROCESSES,
+        metavar="N",
+        help="classify and tag large batches on N processes (default: in-process)",
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        metavar="PATH",
+        help="record every response and rendered page into a cassette at PATH",
+    )
+    cassette.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="run entirely offline from a cassette recorded with --record",
+    )
+    parser.add_argument(
+        "--output-dir",
+        metavar="DIR",
+        help="write the published JSON files to DIR instead of beside scrape.py"
+        " (with --replay the default is PATH's name minus .json, plus -output)",
+    )
+    args = parser.parse_args()
+    if args.record or args.replay:
+        configure_cassette(
+            args.record or args.replay, "record" if args.record else "replay"
+        )
+    output_dir = args.output_dir
+    if output_dir is None and args.replay:
+        output_dir = os.path.splitext(args.replay)[0] + "-output"
+    try:
+        main(
+            cache_dir=(
+                None if args.no_cache or _cassette is not None else args.cache_dir
+            ),
+            output_dir=output_dir,
+            processes=args.enrich_processes,
+        )
+    finally:
+        # Saved even when the run fails — that is the run worth reproducing.
+        save_cassette()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Accuracy benchmark: detect_free_food and classify_event on labeled events.
+
+labeled_events.json holds 180 real event texts taken from the published
+scraped_events.json, each hand-labeled with whether it offers free food and
+which category it belongs in. Roughly a third were tagged Free Food at the
+time, a third mention food without the tag, and the rest are a random draw,
+so both false positives and false negatives are represented.
+
+Reports free-food precision/recall, category accuracy with per-category
+precision/recall, events per second through the public entry points (memo
+cleared each pass), and the time each enrichment regex spends on the corpus.
+
+    python3 benchmarks/bench_accuracy.py [--repeat N] [--verbose]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from collections import Counter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "Project"))
+
+import scrape  # noqa: E402
+
+CORPUS = os.path.join(ROOT, "benchmarks", "labeled_events.json")
+
+# ---- Inputs -----------------------------------------------------------------
+
+
+def load_corpus(path: str = CORPUS):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _texts(ev):
+    return ev["summary"], ev["description"], ev["location"]
+
+
+def _is_tagged(ev) -> bool:
+    event = dict(zip(("summary", "description", "location"), _texts(ev)))
+    return "Free Food" in (scrape.detect_free_food(event).get("tag") or "")
+
+
+# ---- Scoring ----------------------------------------------------------------
+
+
+def _precision_recall(tp: int, fp: int, fn: int):
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    return precision, recall
+
+
+def score(corpus):
+    """Score both classifiers against the labels.
+
+    Returns a dict with free-food precision/recall, category accuracy,
+    per-category (precision, recall), and the misses of each.
+    """
+    scrape._enrichment_memo.clear()
+    food = Counter()
+    food_misses = []
+    cat_hits = Counter()
+    predicted = Counter()
+    expected = Counter()
+    cat_misses = []
+    for ev in corpus:
+        want = ev["labels"]
+        got = _is_tagged(ev)
+        food[(got, want["free_food"])] += 1
+        if got != want["free_food"]:
+            food_misses.append((ev["summary"], want["free_food"], got))
+
+        category = scrape.classify_event(*_texts(ev))
+        predicted[category] += 1
+        expected[want["category"]] += 1
+        if category == want["category"]:
+            cat_hits[category] += 1
+        else:
+            cat_misses.append((ev["summary"], want["category"], category))
+
+    precision, recall = _precision_recall(
+        food[(True, True)], food[(True, False)], food[(False, True)]
+    )
+    per_category = {
+        cat: _precision_recall(
+            cat_hits[cat], predicted[cat] - cat_hits[cat], expected[cat] - cat_hits[cat]
+        )
+        for cat in sorted(set(predicted) | set(expected))
+    }
+    return {
+        "free_food_precision": precision,
+        "free_food_recall": recall,
+        "free_food_misses": food_misses,
+        "category_accuracy": sum(cat_hits.values()) / len(corpus),
+        "per_category": per_category,
+        "category_misses": cat_misses,
+    }
+
+
+# ---- Harness ----------------------------------------------------------------
+
+
+def _regexes():
+    """(name, pattern, field) for every regex enrichment runs."""
+    return [
+        ("_FOOD_SCAN", scrape._FOOD_SCAN, "text"),
+        ("_FOOD_AT", scrape._FOOD_AT, "leads"),
+        ("_FOOD_IN_TITLE", scrape._FOOD_IN_TITLE, "summary"),
+        ("_CATEGORY_SCAN", scrape._CATEGORY_SCAN, "text"),
+        ("_CATEGORY_AT", scrape._CATEGORY_AT, "hits"),
+    ]
+
+
+def regex_breakdown(corpus, repeat: int):
+    """Seconds per pass each enrichment regex spends on the corpus."""
+    texts = [" ".join(_texts(ev)) for ev in corpus]
+    summaries = [ev["summary"] for ev in corpus]
+    leads = [(t, m.start()) for t in texts for m in scrape._FOOD_SCAN.finditer(t)]
+    hits = [(t, m.start()) for t in texts for m in scrape._CATEGORY_SCAN.finditer(t)]
+    inputs = {"text": texts, "summary": summaries, "leads": leads, "hits": hits}
+
+    rows = []
+    for name, pattern, field in _regexes():
+        items = inputs[field]
+        if field in ("leads", "hits"):
+
+            def loop(items=items, match=pattern.match):
+                for text, pos in items:
+                    match(text, pos)
+
+        elif field == "summary":
+
+            def loop(items=items, search=pattern.search):
+                for text in items:
+                    search(text)
+
+        else:
+
+            def loop(items=items, finditer=pattern.finditer):
+                for text in items:
+                    for _ in finditer(text):
+                        pass
+
+        rows.append(
+            (name, len(items), min(timeit.repeat(loop, number=1, repeat=repeat)))
+        )
+    return rows
+
+
+def throughput(corpus, repeat: int):
+    """Events per second through detect_free_food and classify_event."""
+
+    def loop():
+        scrape._enrichment_memo.clear()
+        for ev in corpus:
+            _is_tagged(ev)
+            scrape.classify_event(*_texts(ev))
+
+    return len(corpus) / min(timeit.repeat(loop, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--verbose", action="store_true", help="list every misclassified event"
+    )
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    result = score(corpus)
+    positives = sum(ev["labels"]["free_food"] for ev in corpus)
+    print(f"{len(corpus)} labeled events ({positives} with free food)\n")
+    print(
+        f"free food   precision {result['free_food_precision']:6.1%}"
+        f"   recall {result['free_food_recall']:6.1%}"
+    )
+    print(f"category    accuracy  {result['category_accuracy']:6.1%}")
+    for cat, (precision, recall) in result["per_category"].items():
+        print(f"  {cat:<14} precision {precision:6.1%}   recall {recall:6.1%}")
+    if args.verbose:
+        print("\nfree-food misses (labeled → detected):")
+        for summary, want, got in result["free_food_misses"]:
+            print(f"  {want!s:>5} → {got!s:<5} {summary}")
+        print("\ncategory misses (labeled → classified):")
+        for summary, want, got in result["category_misses"]:
+            print(f"  {want:>13} → {got:<13} {summary}")
+
+    print(f"\nthroughput  {throughput(corpus, args.repeat):,.0f} events/s (cold memo)")
+    print(f"\n{'regex':<16} {'calls':>6} {'time':>11}")
+    for name, calls, seconds in regex_breakdown(corpus, args.repeat):
+        print(f"{name:<16} {calls:>6} {seconds * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
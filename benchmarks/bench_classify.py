@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Microbenchmark: single-pass classify_event against the per-category loop.
+
+Inputs are the summary/description/location of every event in the published
+scraped_events.json. Both classifiers must agree on every event before either
+is timed. The single pass is timed bare, behind a memo that starts each pass
+empty (one run's reuse), and behind a memo kept from a previous pass (a run
+whose text was all seen before).
+
+    python3 benchmarks/bench_classify.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "Project"))
+
+import scrape  # noqa: E402
+
+# ---- The first-match loop classify_event replaced, verbatim -----------------
+
+LEGACY_CATEGORY_PATTERNS = [
+    (
+        cat,
+        re.compile(
+            r"\b(?:" + "|".join(re.escape(k) for k in kws) + r")\b", re.IGNORECASE
+        ),
+    )
+    for cat, kws in scrape.CATEGORY_KEYWORDS
+]
+
+
+def legacy_classify_event(
+    summary: str, description: str = "", location: str = "", categories: str = ""
+) -> str:
+    for raw in (categories or "").split(","):
+        mapped = scrape._ICS_CATEGORY_MAP.get(raw.strip().lower())
+        if mapped:
+            return mapped
+
+    text = " ".join(
+        [summary or "", description or "", location or "", categories or ""]
+    )
+    for category, pattern in LEGACY_CATEGORY_PATTERNS:
+        if pattern.search(text):
+            return category
+    return "General"
+
+
+# ---- Inputs -----------------------------------------------------------------
+
+
+def load_inputs():
+    with open(os.path.join(ROOT, "Project", "scraped_events.json")) as f:
+        events = list(json.load(f).values())
+    return [
+        (ev.get("summary") or "", ev.get("description") or "", ev.get("location") or "")
+        for ev in events
+    ]
+
+
+# ---- Harness ----------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    inputs = load_inputs()
+    for args_ in inputs:
+        if legacy_classify_event(*args_) != scrape.classify_event(*args_):
+            raise SystemExit(f"classify_event: results differ for {args_[0]!r}")
+
+    def run(fn, memo="cold"):
+        def loop():
+            if memo == "cold":
+                # Only one run's worth of repeated text (recurring series) is reused.
+                scrape._enrichment_memo.clear()
+            for args_ in inputs:
+                fn(*args_)
+
+        if memo == "warm":
+            loop()  # a previous run's memo, carried over via the cache dir
+        return min(timeit.repeat(loop, number=1, repeat=args.repeat))
+
+    old = run(legacy_classify_event)
+    per = 1e6 / len(inputs)
+    print(f"{'classifier':<30} {'time':>11} {'speedup':>8}")
+    print(f"{'legacy first-match loop':<30} {old * per:8.2f} µs")
+    for name, fn, memo in (
+        ("single pass, no memo", scrape._classify, None),
+        ("single pass, cold memo", scrape.classify_event, "cold"),
+        ("single pass, warm memo", scrape.classify_event, "warm"),
+    ):
+        new = run(fn, memo)
+        print(
+            f"{name:<30} {new * per:8.2f} µs {old / new:7.1f}x"
+            f"   ({len(inputs) / new:,.0f} events/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
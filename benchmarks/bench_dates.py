@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Microbenchmarks: Project/dates.py against the helpers it replaced.
+
+Inputs are drawn from the published scraped_events.json, so the mix of ICS
+values, month names, clock strings and long dates is the one a real run sees.
+Each pair is checked for identical results before it is timed.
+
+    python3 benchmarks/bench_dates.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "Project"))
+
+import dates  # noqa: E402
+
+# ---- The pre-dates.py helpers, verbatim -------------------------------------
+
+
+def legacy_parse_month_to_number(month_str: str) -> int:
+    month_str = month_str.strip()
+    for fmt in ("%B", "%b"):
+        try:
+            return datetime.strptime(month_str, fmt).month
+        except ValueError:
+            continue
+    return 1
+
+
+def _legacy_to_24h(h: int, mer: str) -> int:
+    if mer == "pm" and h != 12:
+        h += 12
+    elif mer == "am" and h == 12:
+        h = 0
+    return h
+
+
+def legacy_parse_12h_time(text: str):
+    m = re.search(
+        r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)", text.replace(".", ""), re.IGNORECASE
+    )
+    if not m:
+        return None
+    return _legacy_to_24h(int(m.group(1)), m.group(3).lower()), int(m.group(2) or 0)
+
+
+def legacy_parse_12h_range(text: str):
+    m = re.search(
+        r"(\d{1,2}):(\d{2})\s*(am|pm)?\s*(?:[-–—]|to)\s*(\d{1,2}):(\d{2})\s*(am|pm)",
+        text.replace(".", ""),
+        re.IGNORECASE,
+    )
+    if not m:
+        return None
+    sh, sm, s_mer, eh, em, e_mer = m.groups()
+    s_mer = (s_mer or e_mer).lower()
+    return (_legacy_to_24h(int(sh), s_mer), int(sm)), (
+        _legacy_to_24h(int(eh), e_mer.lower()),
+        int(em),
+    )
+
+
+def legacy_parse_ics_dt(value: str, tz: ZoneInfo):
+    value = value.strip()
+    try:
+        if value.endswith("Z"):
+            return (
+                datetime.strptime(value, "%Y%m%dT%H%M%SZ")
+                .replace(tzinfo=timezone.utc)
+                .astimezone(tz)
+            )
+        if "T" in value:
+            return datetime.strptime(value, "%Y%m%dT%H%M%S").replace(tzinfo=tz)
+        return datetime.strptime(value, "%Y%m%d").replace(tzinfo=tz)
+    except ValueError:
+        return None
+
+
+def legacy_parse_long_date(text: str):
+    # The general HTML day headers and the Music listing, as they parsed them.
+    formats = (
+        ("%A, %B %d, %Y",) if "," in text.split(" ")[0] else ("%B %d, %Y", "%B %d %Y")
+    )
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+# ---- Inputs -----------------------------------------------------------------
+
+
+def load_inputs():
+    with open(os.path.join(ROOT, "Project", "scraped_events.json")) as f:
+        events = list(json.load(f).values())
+
+    ics = []
+    clocks = []
+    for ev in events:
+        start = datetime.fromisoformat(ev["start"])
+        if start.hour == 0 and start.minute == 0:
+            ics.append(start.strftime("%Y%m%d"))
+        elif len(ics) % 3 == 0:
+            ics.append(start.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ"))
+        else:
+            ics.append(start.strftime("%Y%m%dT%H%M%S"))
+        end = datetime.fromisoformat(ev["end"])
+        clocks.append(
+            f"{start.strftime('%I:%M %p').lstrip('0')} - "
+            f"{end.strftime('%I:%M %p').lstrip('0')}".lower()
+        )
+    months = [
+        datetime.fromisoformat(ev["start"]).strftime("%B" if i % 2 else "%b")
+        for i, ev in enumerate(events)
+    ]
+    long_dates = [
+        datetime.fromisoformat(ev["start"])
+        .strftime(("%A, %B {}, %Y", "%B {}, %Y", "%B {} %Y")[i % 3])
+        .format(datetime.fromisoformat(ev["start"]).day)
+        for i, ev in enumerate(events)
+    ]
+    return ics, months, clocks, long_dates
+
+
+# ---- Harness ----------------------------------------------------------------
+
+
+def bench(name, legacy, fast, inputs, repeat, reset=None):
+    for x in inputs:
+        if legacy(x) != fast(x):
+            raise SystemExit(f"{name}: results differ for {x!r}")
+
+    def run(fn):
+        def loop():
+            if reset is not None:
+                reset()  # a cold memo per pass: one real run's worth of reuse
+            for x in inputs:
+                fn(x)
+
+        return min(timeit.repeat(loop, number=1, repeat=repeat))
+
+    old, new = run(legacy), run(fast)
+    per = 1e6 / len(inputs)
+    print(
+        f"{name:<22} {old * per:8.2f} µs {new * per:8.2f} µs {old / new:7.1f}x"
+        f"   ({len(inputs)} inputs)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    ics, months, clocks, long_dates = load_inputs()
+    tz = dates.CHICAGO_TZ
+    print(f"{'helper':<22} {'legacy':>11} {'dates.py':>11} {'speedup':>8}")
+    bench(
+        "parse_ics_dt",
+        lambda v: legacy_parse_ics_dt(v, tz),
+        dates.parse_ics_dt,
+        ics,
+        args.repeat,
+    )
+    bench(
+        "parse_month_to_number",
+        legacy_parse_month_to_number,
+        dates.parse_month_to_number,
+        months,
+        args.repeat,
+    )
+    bench(
+        "parse_12h_time",
+        legacy_parse_12h_time,
+        dates.parse_12h_time,
+        clocks,
+        args.repeat,
+        reset=dates.parse_12h_time.cache_clear,
+    )
+    bench(
+        "parse_12h_range",
+        legacy_parse_12h_range,
+        dates.parse_12h_range,
+        clocks,
+        args.repeat,
+        reset=dates.parse_12h_range.cache_clear,
+    )
+    bench(
+        "parse_long_date",
+        legacy_parse_long_date,
+        lambda text: dates.parse_long_date(text, weekday="," in text.split(" ")[0]),
+        long_dates,
+        args.repeat,
+        reset=dates.parse_long_date.cache_clear,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Microbenchmark: post-processing a list of Events against re-keyed dicts.
+
+Inputs are the events of the published scraped_events.json, with their end
+times shifted into the future so nothing is dropped as past and every step has
+the full batch to work on. Both pipelines (merge → drop past → dedupe → series
+cap → publish) must publish identical events before either is timed, and
+postprocess_events, which fuses those steps with near-dedupe, must match the
+Event steps run with near_dedupe_events in turn. "steps" times the filters
+alone; "end to end" adds the merge and, for Events, building them and
+serialising them back. Memory is what
+tracemalloc sees retained by the whole batch in each representation.
+
+    python3 benchmarks/bench_events.py [--repeat N]
+"""
+
+import argparse
+import copy
+import json
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "Project"))
+
+import scrape  # noqa: E402
+from events import Event  # noqa: E402
+
+TZ = scrape.TZ
+
+# ---- The dict-of-dicts steps the Event list replaced, verbatim --------------
+
+
+def legacy_drop_past_events(events, now=None):
+    if now is None:
+        now = datetime.now(tz=TZ)
+
+    result = {}
+    for ev in events.values():
+        end_raw = ev.get("end") or ev.get("start")
+        if not end_raw:
+            result[len(result)] = ev
+            continue
+        try:
+            end_dt = datetime.fromisoformat(end_raw)
+            if end_dt.tzinfo is None:
+                end_dt = end_dt.replace(tzinfo=TZ)
+        except (ValueError, TypeError):
+            result[len(result)] = ev  # keep if unparseable
+            continue
+        if end_dt >= now:
+            result[len(result)] = ev
+    return result
+
+
+def legacy_cap_recurring_series(
+    events, max_per_series=scrape.MAX_OCCURRENCES_PER_SERIES
+):
+    groups = {}
+    for key, ev in events.items():
+        groups.setdefault(_legacy_normalize_title(ev.get("summary", "")), []).append(
+            key
+        )
+
+    keep = set()
+    for member_keys in groups.values():
+        member_keys.sort(key=lambda k: events[k].get("start") or "")
+        if len(member_keys) <= max_per_series:
+            keep.update(member_keys)
+            continue
+        total = len(member_keys)
+        last_start = events[member_keys[-1]].get("start") or ""
+        for k in member_keys[:max_per_series]:
+            events[k]["series_total"] = total
+            events[k]["series_end"] = last_start
+            keep.add(k)
+
+    return {i: ev for i, (k, ev) in enumerate(events.items()) if k in keep}
+
+
+def _legacy_normalize_title(title):
+    return re.sub(r"[^a-z0-9]+", " ", (title or "").lower()).strip()
+
+
+def legacy_dedupe_events(events):
+    chosen = {}
+    order = []
+
+    for ev in events.values():
+        title = _legacy_normalize_title(ev.get("summary", ""))
+        start = (ev.get("start") or "")[:16]  # YYYY-MM-DDTHH:MM
+        if not title or not start:
+            key = ("__unique__", len(order))
+        else:
+            key = (title, start)
+
+        if key not in chosen:
+            chosen[key] = ev
+            order.append(key)
+        else:
+            existing = chosen[key]
+            if len(ev.get("description") or "") > len(
+                existing.get("description") or ""
+            ):
+                chosen[key] = ev
+
+    result = {}
+    for key in order:
+        result[len(result)] = chosen[key]
+    return result
+
+
+def legacy_steps(events, now):
+    events = legacy_drop_past_events(events, now)
+    events = legacy_dedupe_events(events)
+    return legacy_cap_recurring_series(events)
+
+
+def legacy_postprocess(raw, now):
+    return legacy_steps({i: ev for i, ev in enumerate(raw)}, now)  # merge, steps
+
+
+def steps(events, now):
+    events = scrape.drop_past_events(events, now)
+    events = scrape.dedupe_events(events)
+    return scrape.cap_recurring_series(events)
+
+
+def near_steps(events, now):
+    events = scrape.drop_past_events(events, now)
+    events = scrape.dedupe_events(events)
+    events = scrape.near_dedupe_events(events)
+    return scrape.cap_recurring_series(events)
+
+
+def postprocess(raw, now, steps=steps):
+    events = steps([Event.from_dict(ev) for ev in raw], now)  # merge, steps
+    return {i: ev.to_dict() for i, ev in enumerate(events)}  # and publish
+
+
+def near_postprocess(raw, now):
+    return postprocess(raw, now, near_steps)
+
+
+def fused(events, now):
+    return scrape.postprocess_events(events, now)[0]
+
+
+def fused_postprocess(raw, now):
+    events = fused([Event.from_dict(ev) for ev in raw], now)
+    return {i: ev.to_dict() for i, ev in enumerate(events)}
+
+
+# ---- Inputs -----------------------------------------------------------------
+
+
+def load_inputs():
+    """The published events, each ending after the returned ``now``."""
+    with open(os.path.join(ROOT, "Project", "scraped_events.json")) as f:
+        events = list(json.load(f).values())
+    ends = [datetime.fromisoformat(ev["end"]) for ev in events if ev.get("end")]
+    now = min(ends) - timedelta(days=1)
+    return events, now
+
+
+def _traced(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    batch = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del batch
+    return size
+
+
+# ---- Harness ----------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw, now = load_inputs()
+    legacy = legacy_postprocess(copy.deepcopy(raw), now)
+    if legacy != postprocess(raw, now):
+        raise SystemExit("post-processing: results differ")
+    if near_postprocess(raw, now) != fused_postprocess(raw, now):
+        raise SystemExit("fused post-processing: results differ")
+
+    text = json.dumps(raw)
+    dict_bytes = _traced(lambda: dict(enumerate(json.loads(text))))
+    event_bytes = _traced(lambda: [Event.from_dict(ev) for ev in json.loads(text)])
+
+    def run(fn, batch):
+        return min(timeit.repeat(lambda: fn(batch, now), number=1, repeat=args.repeat))
+
+    # The dict steps write series fields into their input — the same values on
+    # every pass, so one private copy serves them all.
+    legacy_raw = copy.deepcopy(raw)
+    rows = [
+        (
+            "dicts, re-keyed",
+            run(legacy_steps, dict(enumerate(legacy_raw))),
+            run(legacy_postprocess, legacy_raw),
+        ),
+        (
+            "Event list",
+            run(steps, [Event.from_dict(ev) for ev in raw]),
+            run(postprocess, raw),
+        ),
+        (
+            "+ near-dedupe",
+            run(near_steps, [Event.from_dict(ev) for ev in raw]),
+            run(near_postprocess, raw),
+        ),
+        (
+            "fused, + near",
+            run(fused, [Event.from_dict(ev) for ev in raw]),
+            run(fused_postprocess, raw),
+        ),
+    ]
+    per = 1e6 / len(raw)
+    print(f"{len(raw)} events, per event")
+    print(f"{'pipeline':<18} {'steps':>11} {'end to end':>11}")
+    for name, step_time, total_time in rows:
+        print(f"{name:<18} {step_time * per:8.2f} µs {total_time * per:8.2f} µs")
+    print(
+        f"\nmemory per event, strings included: dicts {dict_bytes / len(raw):,.0f} B,"
+        f" Events {event_bytes / len(raw):,.0f} B"
+        f" ({1 - event_bytes / dict_bytes:.0%} less)"
+    )
+
+
+if __name__ == "__main__":
+    main()
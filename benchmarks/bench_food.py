@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Microbenchmark: one-scan detect_free_food against the seven-search version.
+
+Inputs are the events of the published scraped_events.json, with their tags
+cleared so every event goes through detection. Both versions must tag every
+event identically before either is timed.
+
+    python3 benchmarks/bench_food.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "Project"))
+
+import scrape  # noqa: E402
+from scrape import (  # noqa: E402
+    _FOOD_ABSOLUTE,
+    _FOOD_IDIOM,
+    _FOOD_NOUN,
+    _FOOD_OFFERED,
+    _FOOD_TITLE,
+    _FOOD_VETO,
+    _FREE_CUE,
+)
+
+# ---- The detector the single scan replaced, verbatim ------------------------
+
+
+def legacy_detect_free_food(event_info):
+    text = " ".join(
+        [
+            event_info.get("summary", ""),
+            event_info.get("description", ""),
+            event_info.get("location", ""),
+        ]
+    )
+
+    already_tagged = "Free Food" in (event_info.get("tag") or "")
+
+    if not already_tagged:
+        summary = event_info.get("summary", "")
+        certain = bool(_FOOD_ABSOLUTE.search(text))
+        strong = (
+            bool(_FOOD_OFFERED.search(text))
+            or bool(_FOOD_TITLE.search(summary))
+            or bool(_FOOD_IDIOM.search(summary))
+        )
+        likely = bool(_FOOD_NOUN.search(text)) and bool(_FREE_CUE.search(text))
+        if not (certain or strong or likely):
+            return event_info
+        if not certain and _FOOD_VETO.search(text):
+            return event_info
+
+    existing = event_info.get("tag", "")
+    if "Free Food" not in existing:
+        event_info["tag"] = (
+            (existing + ", Free Food 🍕").lstrip(", ") if existing else "Free Food 🍕"
+        )
+    return event_info
+
+
+# ---- Inputs -----------------------------------------------------------------
+
+
+def _without_free_food(tag):
+    parts = [t for t in tag.split(", ") if not t.startswith("Free Food")]
+    return ", ".join(parts) or "General"
+
+
+def load_inputs():
+    with open(os.path.join(ROOT, "Project", "scraped_events.json")) as f:
+        events = list(json.load(f).values())
+    return [
+        {
+            "summary": ev.get("summary") or "",
+            "description": ev.get("description") or "",
+            "location": ev.get("location") or "",
+            "tag": _without_free_food(ev.get("tag") or "General"),
+        }
+        for ev in events
+    ]
+
+
+# ---- Harness ----------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    inputs = load_inputs()
+    tagged = 0
+    for ev in inputs:
+        old = legacy_detect_free_food(dict(ev))["tag"]
+        if scrape.detect_free_food(dict(ev))["tag"] != old:
+            raise SystemExit(f"detect_free_food: results differ for {ev['summary']!r}")
+        tagged += "Free Food" in old
+
+    def run(fn):
+        def loop():
+            # A cold memo per pass: only a single run's repeated text is reused.
+            scrape._enrichment_memo.clear()
+            for ev in inputs:
+                fn(dict(ev))
+
+        return min(timeit.repeat(loop, number=1, repeat=args.repeat))
+
+    old, new = run(legacy_detect_free_food), run(scrape.detect_free_food)
+    per = 1e6 / len(inputs)
+    print(f"{'detector':<22} {'legacy':>11} {'one-scan':>11} {'speedup':>8}")
+    print(
+        f"{'detect_free_food':<22} {old * per:8.2f} µs {new * per:8.2f} µs"
+        f" {old / new:7.1f}x   ({len(inputs)} events, {tagged} tagged)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Microbenchmark: MinHash/LSH near-duplicate search against all pairs.
+
+Inputs are the published scraped_events.json after exact dedupe. At that size
+the LSH pairs must equal an all-pairs comparison before anything is timed;
+the batch is then replicated in whole-week steps (each copy shifted past the
+last) to show how the stage grows toward tens of thousands of events.
+
+    python3 benchmarks/bench_neardup.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "Project"))
+
+import neardup  # noqa: E402
+import scrape  # noqa: E402
+from events import Event  # noqa: E402
+
+WINDOW = scrape.NEAR_DUPLICATE_WINDOW_MINUTES * 60
+
+
+def all_pairs(items, threshold):
+    """Every qualifying pair, found by comparing each event with every other."""
+    found = []
+    for i in range(len(items)):
+        shingles_i, t_i, group_i = items[i]
+        for j in range(i + 1, len(items)):
+            shingles_j, t_j, group_j = items[j]
+            if group_i == group_j or abs(t_i - t_j) > WINDOW:
+                continue
+            similarity = neardup.jaccard(shingles_i, shingles_j)
+            if similarity >= threshold:
+                found.append((similarity, i, j))
+    found.sort(key=lambda p: (-p[0], p[1], p[2]))
+    return found
+
+
+# ---- Inputs -----------------------------------------------------------------
+
+
+def load_events():
+    with open(os.path.join(ROOT, "Project", "scraped_events.json")) as f:
+        events = [Event.from_dict(ev) for ev in json.load(f).values()]
+    return scrape.dedupe_events(events)
+
+
+def replicate(events, copies):
+    starts = [ev.start for ev in events]
+    span = max(starts) - min(starts)
+    step = timedelta(weeks=span // timedelta(weeks=1) + 1)
+    out = []
+    for k in range(copies):
+        for ev in events:
+            copy = Event.from_dict(ev.to_dict())
+            copy.start = ev.start + k * step
+            out.append(copy)
+    return out
+
+
+def items_of(events):
+    return [
+        (
+            neardup.shingles(scrape._normalize_title(ev.summary)),
+            int(ev.start.timestamp()),
+            ev.source,
+        )
+        for ev in events
+    ]
+
+
+# ---- Harness ----------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    threshold = scrape.NEAR_DUPLICATE_THRESHOLD
+    events = load_events()
+    items = items_of(events)
+    if neardup.near_duplicate_pairs(items, threshold, WINDOW) != all_pairs(
+        items, threshold
+    ):
+        raise SystemExit("near_duplicate_pairs: results differ from all pairs")
+
+    def time(fn):
+        return min(timeit.repeat(fn, number=1, repeat=args.repeat))
+
+    brute = time(lambda: all_pairs(items, threshold))
+    print(
+        f"{'events':>7} {'all pairs':>11} {'LSH':>9} {'per event':>10} {'candidates':>11}"
+    )
+    for copies in (1, 4, 16):
+        batch = items_of(replicate(events, copies)) if copies > 1 else items
+        lsh = time(lambda: neardup.near_duplicate_pairs(batch, threshold, WINDOW))
+        candidates = len(neardup.candidate_pairs(batch, WINDOW))
+        base = f"{brute:9.2f} s" if copies == 1 else f"{'—':>11}"
+        print(
+            f"{len(batch):>7} {base} {lsh:7.2f} s {lsh / len(batch) * 1e6:7.1f} µs"
+            f" {candidates:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
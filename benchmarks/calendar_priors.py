@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Measure whether any calendar could skip keyword classification.
+
+A per-calendar category prior would only ever decide events whose ICS
+CATEGORIES map to nothing, so that is the population measured: the
+general-feed events of a recorded run (``scrape.py --record RUN.json``)
+replayed through _scrape_general_feed, minus those with a mapped category. For
+each publishing calendar the candidate prior is the category today's
+classifier (CATEGORIES text included) gives most of them, and its agreement is
+the share of them the classifier already puts there — exactly the share of
+events whose category the prior would keep.
+
+scrape.py applies no priors yet: the report is how to find out whether any
+calendar earns one. A calendar qualifies at MIN_AGREEMENT or better over
+MIN_EVENTS events.
+
+Published events no longer carry their CATEGORIES, and their tags are the
+classifier's own output, so scraped_events.json cannot stand in for a run.
+
+    python3 benchmarks/calendar_priors.py RUN.json
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter, defaultdict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "Project"))
+
+import scrape  # noqa: E402
+
+# A prior may change at most 5% of the categories it decides.
+MIN_AGREEMENT = 0.95
+MIN_EVENTS = 30
+
+# ---- Measurement ------------------------------------------------------------
+
+
+def load_fall_through(cassette: str):
+    """Calendar → the replayed general-feed events no ICS category decides."""
+    scrape.configure_cassette(cassette, "replay")
+    try:
+        events, _ = scrape._scrape_general_feed()
+    finally:
+        scrape.configure_cassette(None)
+    return fall_through(events.values())
+
+
+def fall_through(events):
+    by_calendar = defaultdict(list)
+    for ev in events:
+        categories = (ev.get("categories") or "").split(",")
+        if any(c.strip().lower() in scrape._ICS_CATEGORY_MAP for c in categories):
+            continue
+        by_calendar[ev.get("organizer", "")].append(ev)
+    return by_calendar
+
+
+def measure(by_calendar):
+    """Calendar → {category, agreement, events} on the fall-through."""
+    priors = {}
+    for calendar, events in sorted(by_calendar.items()):
+        verdicts = Counter(
+            scrape._classify(
+                ev["summary"],
+                ev.get("description", ""),
+                ev.get("location", ""),
+                ev.get("categories", ""),
+            )
+            for ev in events
+        )
+        category, count = verdicts.most_common(1)[0]
+        priors[calendar] = {
+            "category": category,
+            "agreement": round(count / len(events), 3),
+            "events": len(events),
+        }
+    return priors
+
+
+def qualifies(prior) -> bool:
+    return prior["agreement"] >= MIN_AGREEMENT and prior["events"] >= MIN_EVENTS
+
+
+# ---- Report -----------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette", help="a run recorded with scrape.py --record")
+    args = parser.parse_args()
+
+    priors = measure(load_fall_through(args.cassette))
+    print(f"{'calendar':<36} {'events':>6} {'prior':<13} {'agrees':>7}  qualifies")
+    qualified = skipped = changed = 0
+    for calendar, prior in priors.items():
+        if qualifies(prior):
+            qualified += 1
+            skipped += prior["events"]
+            changed += round((1 - prior["agreement"]) * prior["events"])
+        print(
+            f"{calendar or '(unnamed)':<36} {prior['events']:>6}"
+            f" {prior['category']:<13} {prior['agreement']:7.1%}"
+            f"  {'yes' if qualifies(prior) else ''}"
+        )
+    total = sum(p["events"] for p in priors.values())
+    print(
+        f"\n{qualified} calendars qualify: {skipped} of {total} fall-through"
+        f" events would skip the keyword scan, {changed} of them changing category"
+    )
+
+
+if __name__ == "__main__":
+    main()
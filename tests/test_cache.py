@@ -0,0 +1,260 @@
+"""Tests for the on-disk scraper caches (no live HTTP)."""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Project"))
+import cache
+
+
+class TestValidatorStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "validators.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_headers_from_remembered_validators(self):
+        store = cache.ValidatorStore(self.path)
+        store.remember("u", '"abc"', "Tue, 01 Sep 2026 00:00:00 GMT", [1])
+        self.assertEqual(
+            store.request_headers("u"),
+            {
+                "If-None-Match": '"abc"',
+                "If-Modified-Since": "Tue, 01 Sep 2026 00:00:00 GMT",
+            },
+        )
+        self.assertEqual(store.payload("u"), [1])
+        self.assertEqual(store.request_headers("other"), {})
+
+    def test_round_trips_through_disk(self):
+        store = cache.ValidatorStore(self.path)
+        store.remember("u", '"abc"', None, [{"UID": "1"}])
+        store.save()
+        reloaded = cache.ValidatorStore(self.path)
+        self.assertEqual(reloaded.request_headers("u"), {"If-None-Match": '"abc"'})
+        self.assertEqual(reloaded.payload("u"), [{"UID": "1"}])
+
+    def test_response_without_validators_is_forgotten(self):
+        store = cache.ValidatorStore(self.path)
+        store.remember("u", '"abc"', None, [1])
+        store.remember("u", None, None, [2])
+        self.assertEqual(store.request_headers("u"), {})
+        self.assertIsNone(store.payload("u"))
+
+    def test_unchanged_store_is_not_written(self):
+        cache.ValidatorStore(self.path).save()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_corrupt_file_starts_empty(self):
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        store = cache.ValidatorStore(self.path)
+        self.assertEqual(store.request_headers("u"), {})
+        store.remember("u", '"x"', None, [])
+        store.save()
+        with open(self.path) as f:
+            self.assertIn("u", json.load(f))
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = [1000.0]
+        self.cache = cache.ResponseCache(
+            self.tmp.name, max_bytes=10_000, clock=lambda: self.now[0]
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hit_within_ttl_miss_after(self):
+        self.cache.put("https://a/1", "<html>one</html>")
+        self.now[0] += 59
+        self.assertEqual(self.cache.get("https://a/1", ttl=60), "<html>one</html>")
+        self.now[0] += 2
+        self.assertIsNone(self.cache.get("https://a/1", ttl=60))
+        self.assertEqual(self.cache.get("https://a/1", ttl=3600), "<html>one</html>")
+
+    def test_unknown_url_misses(self):
+        self.assertIsNone(self.cache.get("https://a/missing", ttl=60))
+
+    def test_prune_evicts_least_recently_used(self):
+        small = cache.ResponseCache(self.tmp.name, max_bytes=1, clock=time.time)
+        for i, url in enumerate(["https://a/old", "https://a/used", "https://a/new"]):
+            small.put(url, "x" * 100)
+            os.utime(small._path(url), (1000 + i, 1000 + i))
+        small.get("https://a/old", ttl=60)  # touched → most recently used
+        small.max_bytes = sum(
+            os.path.getsize(small._path(u)) for u in ("https://a/old", "https://a/new")
+        )
+        small.prune()
+        self.assertIsNotNone(small.get("https://a/old", ttl=60))
+        self.assertIsNone(small.get("https://a/used", ttl=60))
+        self.assertIsNotNone(small.get("https://a/new", ttl=60))
+
+
+class TestCassette(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cassette.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_record_then_replay(self):
+        rec = cache.Cassette(self.path, "record")
+        rec.record("GET", "https://a/", 200, "body", {"ETag": '"1"'})
+        rec.record("RENDER", "https://a/", 200, "<html/>")
+        rec.save()
+        play = cache.Cassette(self.path, "replay")
+        self.assertEqual(
+            play.get("GET", "https://a/"),
+            {"status": 200, "headers": {"ETag": '"1"'}, "body": "body"},
+        )
+        self.assertEqual(play.get("RENDER", "https://a/")["body"], "<html/>")
+        self.assertIsNone(play.get("GET", "https://b/"))
+
+    def test_replay_needs_a_cassette(self):
+        with self.assertRaises(ValueError):
+            cache.Cassette(self.path, "replay")
+        with self.assertRaises(ValueError):
+            cache.Cassette(self.path, "rewind")
+
+
+class TestEventIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "index.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reused_only_while_stamp_matches(self):
+        index = cache.EventIndex(self.path, "rules-1")
+        index.put("7", "uid-1", "s1", {"summary": "A"})
+        self.assertEqual(index.get("7", "uid-1", "s1"), {"summary": "A"})
+        self.assertIsNone(index.get("7", "uid-1", "s2"))
+        self.assertIsNone(index.get("557", "uid-1", "s1"))
+
+    def test_returns_copies(self):
+        index = cache.EventIndex(self.path, "rules-1")
+        event = {"summary": "A"}
+        index.put("7", "u", "s", event)
+        event["source"] = "general"  # mutated downstream after storing
+        index.get("7", "u", "s")["series_total"] = 3
+        self.assertEqual(index.get("7", "u", "s"), {"summary": "A"})
+
+    def test_other_rules_start_empty(self):
+        index = cache.EventIndex(self.path, "rules-1")
+        index.put("7", "u", "s", {"summary": "A"})
+        index.save()
+        self.assertIsNotNone(cache.EventIndex(self.path, "rules-1").get("7", "u", "s"))
+        self.assertIsNone(cache.EventIndex(self.path, "rules-2").get("7", "u", "s"))
+
+    def test_retain_drops_vanished_uids(self):
+        index = cache.EventIndex(self.path, "rules-1")
+        index.put("7", "keep", "s", {"summary": "A"})
+        index.put("7", "gone", "s", {"summary": "B"})
+        index.retain("7", {"keep"})
+        self.assertIsNotNone(index.get("7", "keep", "s"))
+        self.assertIsNone(index.get("7", "gone", "s"))
+
+
+class TestEnrichmentMemo(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "memo.json")
+        self.calls = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _compute(self, value):
+        def compute():
+            self.calls.append(value)
+            return value
+
+        return compute
+
+    def test_computes_once_per_key(self):
+        memo = cache.EnrichmentMemo(None, "rules-1", max_entries=10)
+        key = memo.key("category", "Jazz Night", "")
+        self.assertEqual(
+            memo.lookup(key, self._compute("Performances")), "Performances"
+        )
+        self.assertEqual(memo.lookup(key, self._compute("other")), "Performances")
+        self.assertEqual(self.calls, ["Performances"])
+        self.assertEqual((memo.hits, memo.misses), (1, 1))
+
+    def test_key_separates_kinds_and_fields(self):
+        key = cache.EnrichmentMemo.key
+        self.assertNotEqual(key("category", "a"), key("free_food", "a"))
+        self.assertNotEqual(key("category", "ab", ""), key("category", "a", "b"))
+        self.assertEqual(key("category", None), key("category", ""))
+
+    def test_falsy_values_are_remembered(self):
+        memo = cache.EnrichmentMemo(None, "rules-1", max_entries=10)
+        memo.lookup("k", self._compute(False))
+        self.assertFalse(memo.lookup("k", self._compute(True)))
+        self.assertEqual(self.calls, [False])
+
+    def test_evicts_least_recently_used(self):
+        memo = cache.EnrichmentMemo(None, "rules-1", max_entries=2)
+        memo.lookup("a", self._compute(1))
+        memo.lookup("b", self._compute(2))
+        memo.lookup("a", self._compute(1))  # a is now the most recent
+        memo.lookup("c", self._compute(3))
+        self.assertEqual(len(memo), 2)
+        memo.lookup("a", self._compute(1))
+        memo.lookup("b", self._compute(2))
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+
+    def test_persists_under_same_rules_only(self):
+        memo = cache.EnrichmentMemo(self.path, "rules-1", max_entries=10)
+        memo.lookup("k", self._compute("Arts"))
+        memo.save()
+        again = cache.EnrichmentMemo(self.path, "rules-1", max_entries=10)
+        self.assertEqual(again.lookup("k", self._compute("x")), "Arts")
+        changed = cache.EnrichmentMemo(self.path, "rules-2", max_entries=10)
+        self.assertEqual(changed.lookup("k", self._compute("x")), "x")
+
+    def test_hits_alone_do_not_rewrite_the_file(self):
+        memo = cache.EnrichmentMemo(self.path, "rules-1", max_entries=10)
+        memo.lookup("a", self._compute(1))
+        memo.lookup("b", self._compute(2))
+        memo.save()
+        again = cache.EnrichmentMemo(self.path, "rules-1", max_entries=10)
+        again.lookup("a", self._compute(1))
+        with patch.object(cache, "write_json_atomic") as write:
+            again.save()
+        write.assert_not_called()
+
+    def test_recency_is_saved_once_eviction_is_near(self):
+        memo = cache.EnrichmentMemo(self.path, "rules-1", max_entries=2)
+        memo.lookup("a", self._compute(1))
+        memo.lookup("b", self._compute(2))
+        memo.save()
+        again = cache.EnrichmentMemo(self.path, "rules-1", max_entries=2)
+        again.lookup("a", self._compute(1))  # a is now the most recent
+        again.save()
+        last = cache.EnrichmentMemo(self.path, "rules-1", max_entries=2)
+        last.lookup("c", self._compute(3))
+        last.lookup("a", self._compute(1))
+        self.assertEqual(self.calls, [1, 2, 3])
+
+    def test_without_path_never_writes(self):
+        memo = cache.EnrichmentMemo(None, "rules-1", max_entries=10)
+        memo.lookup("k", self._compute(1))
+        memo.save()
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
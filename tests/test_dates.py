@@ -0,0 +1,132 @@
+"""Tests for the shared date/time parsing helpers (Project/dates.py)."""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Project"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+import dates
+import bench_dates as legacy
+
+
+class TestParseIcsDt(unittest.TestCase):
+    def test_shapes(self):
+        tz = dates.CHICAGO_TZ
+        self.assertEqual(
+            dates.parse_ics_dt("20260712T130000"), datetime(2026, 7, 12, 13, tzinfo=tz)
+        )
+        self.assertEqual(
+            dates.parse_ics_dt("20260712T180000Z"),
+            datetime(2026, 7, 12, 18, tzinfo=timezone.utc),
+        )
+        self.assertEqual(dates.parse_ics_dt("20260712T180000Z").hour, 13)  # CDT
+        self.assertEqual(
+            dates.parse_ics_dt(" 20260713 "), datetime(2026, 7, 13, tzinfo=tz)
+        )
+
+    def test_matches_strptime_on_edge_cases(self):
+        values = [
+            "",
+            "2026",
+            "20260230",  # no Feb 30
+            "20261301",
+            "20260712T250000",
+            "20260712T13000",
+            "2026071T130000",  # strptime's %m/%d take one digit too
+            "20260712T130000z",
+            "2026-07-12",
+            "20²60712",
+            "20260712X130000",
+            "20260308T023000",  # inside the spring-forward gap
+            "20261101T013000",  # ambiguous fall-back hour
+            "20261101T063000Z",
+        ]
+        for v in values:
+            with self.subTest(value=v):
+                self.assertEqual(
+                    dates.parse_ics_dt(v),
+                    legacy.legacy_parse_ics_dt(v, dates.CHICAGO_TZ),
+                )
+
+
+class TestParseMonthToNumber(unittest.TestCase):
+    def test_matches_strptime(self):
+        names = [datetime(2026, m, 1).strftime(f) for m in range(1, 13) for f in "Bb"]
+        for name in names + [n.upper() for n in names] + [" May ", "Sept", "Mayo", ""]:
+            with self.subTest(name=name):
+                self.assertEqual(
+                    dates.parse_month_to_number(name),
+                    legacy.legacy_parse_month_to_number(name),
+                )
+
+
+class TestParseLongDate(unittest.TestCase):
+    CASES = [
+        "Tuesday, February 10, 2026",
+        "tuesday, FEBRUARY 10, 2026",
+        "Tue, February 10, 2026",  # strptime's %A and %B take full names only
+        "Funday, February 10, 2026",
+        "Tuesday, February 10 2026",
+        "Monday, February 30, 2026",
+        "July 5, 2026",
+        "July 05 2026",
+        "Jul 5, 2026",
+        "July 5,2026",
+        "July 0, 2026",
+        "July 5, 2026 ",
+        "",
+    ]
+
+    def test_matches_strptime(self):
+        formats = {True: ["%A, %B %d, %Y"], False: ["%B %d, %Y", "%B %d %Y"]}
+        for text in self.CASES:
+            for weekday, fmts in formats.items():
+                with self.subTest(text=text, weekday=weekday):
+                    expected = None
+                    for fmt in fmts:
+                        try:
+                            expected = datetime.strptime(text, fmt).date()
+                            break
+                        except ValueError:
+                            continue
+                    self.assertEqual(
+                        dates.parse_long_date(text, weekday=weekday), expected
+                    )
+
+
+class TestClockParsing(unittest.TestCase):
+    CASES = [
+        "5:30 pm",
+        "5 pm",
+        "7 p.m.",
+        "12:00 AM",
+        "12 pm",
+        "9:00 - 10:00 pm",
+        "10:00 a.m. to 4:00 p.m.",
+        "6:00pm–8:30pm",
+        "All day",
+        "",
+    ]
+
+    def test_matches_legacy(self):
+        for text in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    dates.parse_12h_time(text), legacy.legacy_parse_12h_time(text)
+                )
+                self.assertEqual(
+                    dates.parse_12h_range(text), legacy.legacy_parse_12h_range(text)
+                )
+
+    def test_repeat_strings_are_memoised(self):
+        dates.parse_12h_time.cache_clear()
+        for _ in range(3):
+            dates.parse_12h_time("7:30 pm")
+        info = dates.parse_12h_time.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
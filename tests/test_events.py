@@ -0,0 +1,71 @@
+"""Tests for the compact post-processing event record (Project/events.py)."""
+
+import json
+import os
+import sys
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Project"))
+from events import Event
+
+PUBLISHED = os.path.join(
+    os.path.dirname(__file__), "..", "Project", "scraped_events.json"
+)
+
+
+class TestEvent(unittest.TestCase):
+    def test_round_trips_every_published_event(self):
+        with open(PUBLISHED) as f:
+            events = json.load(f).values()
+        for data in events:
+            self.assertEqual(Event.from_dict(data).to_dict(), data)
+
+    def test_times_are_parsed_once(self):
+        ev = Event.from_dict(
+            {"summary": "Talk", "start": "2026-09-01T10:00:00-05:00", "end": ""}
+        )
+        self.assertIsInstance(ev.start, datetime)
+        self.assertEqual(ev["start"], "2026-09-01T10:00:00-05:00")
+        self.assertEqual(ev.end, "")  # no date found stays as the source gave it
+        self.assertEqual(Event(start="not-a-date").to_dict(), {"start": "not-a-date"})
+
+    def test_repeated_strings_are_shared(self):
+        a = Event.from_dict({"location": "".join(["Krannert ", "Center"])}, "kcpa")
+        b = Event.from_dict({"location": "".join(["Krannert ", "Cent", "er"])}, "kcpa")
+        self.assertIs(a.location, b.location)
+        self.assertIs(a.source, b.source)
+
+    def test_slots_only(self):
+        with self.assertRaises(AttributeError):
+            Event().__dict__
+
+    def test_dict_protocol(self):
+        ev = Event.from_dict({"summary": "Talk", "categories": "Lecture"})
+        self.assertIn("categories", ev)
+        self.assertEqual(ev.pop("categories", ""), "Lecture")
+        self.assertNotIn("categories", ev)
+        self.assertEqual(ev.pop("calendar", None), None)
+        self.assertIsNone(ev.get("tag"))
+        ev["tag"] = "Academic"
+        self.assertEqual(ev["tag"], "Academic")
+        with self.assertRaises(KeyError):
+            ev["organizer"]
+
+    def test_source_from_merge_wins(self):
+        ev = Event.from_dict({"summary": "Talk", "source": "general"}, "kcpa")
+        self.assertEqual(ev.to_dict()["source"], "kcpa")
+
+    def test_id_is_not_a_field(self):
+        ev = Event.from_dict({"summary": "Talk"})
+        self.assertIsNone(ev.id)
+        ev.id = "3f2a"
+        self.assertEqual(ev.to_dict(), {"summary": "Talk"})
+
+    def test_extras_are_published(self):
+        data = {"summary": "Pantry", "recurrence": {"freq": "weekly"}}
+        self.assertEqual(Event.from_dict(data).to_dict(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
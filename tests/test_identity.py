@@ -0,0 +1,95 @@
+"""Tests for cross-source event identity (Project/identity.py)."""
+
+import os
+import sys
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Project"))
+from identity import IdentityIndex, canonical_url, event_keys, stable_id
+
+
+class TestCanonicalUrl(unittest.TestCase):
+    def test_calendar_links_to_one_event_agree(self):
+        links = [
+            "https://calendars.illinois.edu/detail/7?eventId=33557812",
+            "http://calendars.illinois.edu/detail/557?eventId=33557812",
+            "https://calendars.illinois.edu/calendar/calendar/detail/7"
+            "?key=200001012000010133557812",
+        ]
+        self.assertEqual(
+            {canonical_url(link) for link in links},
+            {"calendars.illinois.edu/event/33557812"},
+        )
+
+    def test_spelling_differences_are_ignored(self):
+        self.assertEqual(
+            canonical_url("http://www.Example.com/events/talk/?b=2&a=1#tickets"),
+            canonical_url("https://example.com/events/talk?utm_source=x&a=1&b=2"),
+        )
+
+    def test_distinct_pages_stay_distinct(self):
+        self.assertNotEqual(
+            canonical_url("https://example.com/event?id=1"),
+            canonical_url("https://example.com/event?id=2"),
+        )
+
+    def test_non_links(self):
+        self.assertIsNone(canonical_url(""))
+        self.assertIsNone(canonical_url("/detail/7?eventId=1"))
+        self.assertIsNone(canonical_url("mailto:events@illinois.edu"))
+
+
+class TestEventKeys(unittest.TestCase):
+    def test_link_counts_only_with_its_date(self):
+        link = "https://calendars.illinois.edu/detail/7?eventId=1"
+        self.assertEqual(event_keys(url=link), [])
+        self.assertEqual(
+            event_keys("1-1@illinois.edu", link, date(2099, 7, 12)),
+            ["uid:1-1@illinois.edu", "url:calendars.illinois.edu/event/1@2099-07-12"],
+        )
+
+
+class TestStableId(unittest.TestCase):
+    def test_permalink_key_is_preferred(self):
+        url = "url:calendars.illinois.edu/event/1@2099-07-12"
+        self.assertEqual(stable_id(["uid:1-1@illinois.edu", url]), stable_id([url]))
+        self.assertNotEqual(stable_id(["uid:1-1@illinois.edu"]), stable_id([url]))
+
+    def test_short_hex_and_deterministic(self):
+        key = stable_id(["uid:1-1@illinois.edu"])
+        self.assertRegex(key, r"^[0-9a-f]{16}$")
+        self.assertEqual(key, stable_id(["uid:1-1@illinois.edu"]))
+
+
+class TestIdentityIndex(unittest.TestCase):
+    def test_first_listing_wins(self):
+        index = IdentityIndex()
+        self.assertTrue(index.claim(["uid:a", "url:x@1"]))
+        self.assertFalse(index.claim(["url:x@1"]))
+        self.assertTrue(index.claim(["url:x@2"]))
+        self.assertEqual((len(index), index.duplicates), (2, 1))
+
+    def test_duplicate_keys_join_the_slot(self):
+        index = IdentityIndex()
+        index.claim(["uid:a"])
+        self.assertFalse(index.claim(["uid:a", "url:x@1"]))
+        self.assertFalse(index.claim(["url:x@1"]))
+        self.assertEqual(index.slot("url:x@1"), index.slot("uid:a"))
+
+    def test_listings_without_keys_are_always_new(self):
+        index = IdentityIndex()
+        self.assertTrue(index.claim([]))
+        self.assertTrue(index.claim(()))
+        self.assertEqual(len(index), 2)
+
+    def test_known_claims_nothing(self):
+        index = IdentityIndex()
+        self.assertFalse(index.known(["uid:a"]))
+        self.assertTrue(index.claim(["uid:a"]))
+        self.assertTrue(index.known(["url:x@1", "uid:a"]))
+        self.assertEqual((len(index), index.duplicates), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
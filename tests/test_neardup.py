@@ -0,0 +1,86 @@
+"""Tests for MinHash/LSH near-duplicate search (Project/neardup.py)."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Project"))
+import neardup
+
+HOUR = 3600
+
+
+def _item(title, t, group):
+    return (neardup.shingles(title), t, group)
+
+
+class TestShingles(unittest.TestCase):
+    def test_padded_trigrams(self):
+        self.assertEqual(neardup.shingles("ab cd"), {" ab", "ab ", "b c", " cd", "cd "})
+
+    def test_short_text_is_one_shingle(self):
+        self.assertEqual(neardup.shingles(""), {"  "})
+
+    def test_jaccard(self):
+        a = neardup.shingles("concert for kids")
+        self.assertEqual(neardup.jaccard(a, a), 1.0)
+        self.assertGreater(
+            neardup.jaccard(a, neardup.shingles("concerts for kids")), 0.6
+        )
+        self.assertLess(neardup.jaccard(a, neardup.shingles("pantry hours")), 0.2)
+        self.assertEqual(neardup.jaccard(frozenset(), frozenset()), 1.0)
+
+
+class TestNearDuplicatePairs(unittest.TestCase):
+    def test_signature_is_deterministic(self):
+        s = neardup.shingles("career fair")
+        self.assertEqual(neardup.minhash(s), neardup.minhash(set(s)))
+        self.assertEqual(len(neardup.minhash(s)), neardup.NUM_PERM)
+
+    def test_finds_cross_group_mirror(self):
+        items = [
+            _item("concert for kids", 0, "kcpa"),
+            _item("pantry hours", 0, "food"),
+            _item("concerts for kids", 900, "general"),
+        ]
+        pairs = neardup.near_duplicate_pairs(items, 0.6, HOUR)
+        self.assertEqual([(i, j) for _, i, j in pairs], [(0, 2)])
+
+    def test_same_group_and_distant_times_are_ignored(self):
+        items = [
+            _item("concert for kids", 0, "kcpa"),
+            _item("concert for kids", 600, "kcpa"),
+            _item("concert for kids", 3 * HOUR, "general"),
+        ]
+        self.assertEqual(neardup.near_duplicate_pairs(items, 0.6, HOUR), [])
+
+    def test_matches_all_pairs(self):
+        titles = [
+            "gies career fair",
+            "gies career fair spring",
+            "cafe conversations",
+            "cafe conversations kam",
+            "kids at kam",
+            "kids at kam family day",
+            "study abroad info session",
+        ]
+        items = [
+            _item(title, (k % 3) * 1200, k % 2) for k, title in enumerate(titles * 3)
+        ]
+        expected = sorted(
+            (
+                (neardup.jaccard(items[i][0], items[j][0]), i, j)
+                for i in range(len(items))
+                for j in range(i + 1, len(items))
+                if items[i][2] != items[j][2]
+                and abs(items[i][1] - items[j][1]) <= HOUR
+                and neardup.jaccard(items[i][0], items[j][0]) >= 0.6
+            ),
+            key=lambda p: (-p[0], p[1], p[2]),
+        )
+        self.assertTrue(expected)
+        self.assertEqual(neardup.near_duplicate_pairs(items, 0.6, HOUR), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
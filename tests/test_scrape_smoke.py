@@ -3,9 +3,10 @@
 
 import os
 import sys
+import tempfile
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "Project"))
 if PROJECT_DIR not in sys.path:
@@ -15,9 +16,10 @@ import scrape  # noqa: E402
 
 
 class MockResponse:
-    def __init__(self, text: str, status_code: int = 200):
+    def __init__(self, text: str, status_code: int = 200, headers=None):
         self.text = text
         self.status_code = status_code
+        self.headers = headers or {}
 
 
 # ---------------------------------------------------------------------------
@@ -313,6 +315,24 @@ CS_HTML = """
 """
 
 
+KCPA_LIST_HTML = """
+<div class="view-content">
+  <div class="views-row"><a href="/events/first-show">First</a><span class="date">JUL 16, 2026</span></div>
+  <div class="views-row"><a href="/events/second-show">Second</a><span class="date">JUL 17, 2026</span></div>
+  <div class="views-row"><a href="/events/third-show">Third</a><span class="date">JUL 18, 2026</span></div>
+</div>
+"""
+
+
+def kcpa_detail_html(title: str, day: int) -> str:
+    return f"""
+<h1>{title}</h1>
+<div class="event-date">Th Jul {day}, 2026 - 7:30pm CT</div>
+<div class="field--name-field-display-venue">Foellinger Great Hall</div>
+<div class="body"><p>An evening of music.</p></div>
+"""
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -395,7 +415,7 @@ class TestScrapeGies(unittest.TestCase):
         Bare food nouns no longer tag on their own — "Coffee & Conversation"
         (the giveaway idiom) does, "Coffee Chat" deliberately does not.
         """
-        data = self._run()
+        data = scrape.enrich_events(self._run())
         ev = [e for e in data.values() if "Coffee" in e["summary"]][0]
         self.assertNotIn("Free Food", ev["tag"])
 
@@ -418,6 +438,87 @@ class TestScrapeCS(unittest.TestCase):
         self.assertNotEqual(ev["location"], "")
 
 
+class TestScrapeStateFarm(unittest.TestCase):
+    DETAIL_URL = "https://www.statefarmcenter.com/events/detail/test-event-1"
+
+    def _run(self, detail_html, rendered=None):
+        def fake(url, session, **kw):
+            if url == scrape.STATE_FARM_CENTER_CALENDAR_LINK:
+                return MockResponse(STATEFARM_LIST_HTML)
+            return MockResponse(detail_html)
+
+        render = MagicMock(return_value=rendered or {})
+        with (
+            patch.object(scrape, "safe_request", side_effect=fake),
+            patch.object(scrape, "_render_pages", render),
+        ):
+            return scrape.scrape_state_farm(), render
+
+    def test_server_rendered_sidebar_skips_the_browser(self):
+        data, render = self._run(STATEFARM_DETAIL_HTML)
+        render.assert_not_called()
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["summary"], "Concert Night")
+        self.assertIn("2026-10-15T19:30", data[0]["start"])
+
+    def test_page_without_sidebar_falls_back_to_browser(self):
+        shell = "<html><body><div id='app'></div></body></html>"
+        data, render = self._run(shell, {self.DETAIL_URL: STATEFARM_DETAIL_HTML})
+        render.assert_called_once()
+        self.assertEqual(render.call_args.args[0], [self.DETAIL_URL])
+        self.assertEqual(data[0]["summary"], "Concert Night")
+
+
+class TestScrapeKCPA(unittest.TestCase):
+    def test_details_fetched_concurrently_in_list_order(self):
+        import threading
+        import time
+
+        details = {
+            "https://krannertcenter.com/events/first-show": ("First Show", 16, 0.06),
+            "https://krannertcenter.com/events/second-show": ("Second Show", 17, 0.03),
+            "https://krannertcenter.com/events/third-show": ("Third Show", 18, 0.0),
+        }
+        lock = threading.Lock()
+        in_flight = [0, 0]  # current, peak
+
+        def fake(url, session, **kw):
+            if url == scrape.KCPA_CALENDAR_LINK:
+                return MockResponse(KCPA_LIST_HTML)
+            title, day, delay = details[url]
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(delay)  # earlier shows finish last
+            with lock:
+                in_flight[0] -= 1
+            return MockResponse(kcpa_detail_html(title, day))
+
+        with patch.object(scrape, "safe_request", side_effect=fake):
+            data = scrape.scrape_kcpa()
+
+        self.assertGreater(in_flight[1], 1)
+        self.assertEqual(
+            [e["summary"] for e in data.values()],
+            ["First Show", "Second Show", "Third Show"],
+        )
+        first = data[0]
+        self.assertIn("2026-07-16T19:30", first["start"])
+        self.assertTrue(first["location"].startswith("Foellinger Great Hall"))
+
+    def test_failed_detail_skips_only_that_show(self):
+        def fake(url, session, **kw):
+            if url == scrape.KCPA_CALENDAR_LINK:
+                return MockResponse(KCPA_LIST_HTML)
+            if url.endswith("second-show"):
+                return None
+            return MockResponse(kcpa_detail_html("Show", 20))
+
+        with patch.object(scrape, "safe_request", side_effect=fake):
+            data = scrape.scrape_kcpa()
+        self.assertEqual(len(data), 2)
+
+
 class TestScrapeGeneralFeed(unittest.TestCase):
     """Primary path: whole-calendar ICS feed."""
 
@@ -443,7 +544,10 @@ class TestScrapeGeneralFeed(unittest.TestCase):
         self.assertEqual(ev["location"], "Riggs Beer Company")
         self.assertIn("beer and science", ev["description"])  # \\n → space
         self.assertTrue(ev["htmlLink"].startswith("https://"))  # http upgraded
-        self.assertEqual(ev["tag"], "Arts")  # CATEGORIES feeds classify
+        self.assertNotIn("tag", ev)  # classified in the batch stage...
+        scrape.enrich_events(data)
+        self.assertEqual(ev["tag"], "Arts")  # ...where CATEGORIES feeds it
+        self.assertNotIn("categories", ev)
 
     def test_all_day_event(self):
         data = self._run()
@@ -473,6 +577,68 @@ class TestScrapeGeneralFeed(unittest.TestCase):
         # Same feed served for both calendars — UIDs collapse the duplicates.
         self.assertEqual(len(data), 2)
 
+    def test_text_decoded_only_for_surviving_events(self):
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                [
+                    "https://calendars.illinois.edu/list/7",
+                    "https://calendars.illinois.edu/list/557",
+                ],
+            ),
+            patch.object(
+                scrape, "safe_request", return_value=MockResponse(GENERAL_ICS)
+            ),
+            patch.object(
+                scrape, "_ics_unescape", wraps=scrape._ics_unescape
+            ) as unescape,
+        ):
+            data = scrape.scrape_general()
+        decoded = [c.args[0] for c in unescape.call_args_list]
+        self.assertEqual(len(data), 2)
+        self.assertNotIn("Ancient Past Event", decoded)  # outside the window
+        self.assertEqual(decoded.count("All Day Exhibit"), 1)  # not for the dupe
+
+    def test_event_already_over_is_skipped(self):
+        now = datetime.now(scrape.TZ)
+        start = (now - scrape.timedelta(hours=3)).strftime("%Y%m%dT%H%M%S")
+        end = (now - scrape.timedelta(hours=1)).strftime("%Y%m%dT%H%M%S")
+        ics = (
+            "BEGIN:VCALENDAR\nBEGIN:VEVENT\n"
+            f"DTSTART:{start}\nDTEND:{end}\nSUMMARY:Earlier Today\nUID:x\n"
+            "END:VEVENT\nEND:VCALENDAR\n"
+        )
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                ["https://calendars.illinois.edu/list/7"],
+            ),
+            patch.object(scrape, "safe_request", return_value=MockResponse(ics)),
+        ):
+            events, dead = scrape._scrape_general_feed()
+        self.assertEqual((events, dead), ({}, []))
+
+    def test_rejected_copy_does_not_claim_the_event(self):
+        ics = (
+            "BEGIN:VCALENDAR\nBEGIN:VEVENT\n"
+            "DTSTART:20990712T100000\nSUMMARY:\nUID:x\n"
+            "END:VEVENT\nBEGIN:VEVENT\n"
+            "DTSTART:20990712T100000\nSUMMARY:Kept Copy\nUID:x\n"
+            "END:VEVENT\nEND:VCALENDAR\n"
+        )
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                ["https://calendars.illinois.edu/list/7"],
+            ),
+            patch.object(scrape, "safe_request", return_value=MockResponse(ics)),
+        ):
+            events, _ = scrape._scrape_general_feed()
+        self.assertEqual([e["summary"] for e in events.values()], ["Kept Copy"])
+
     def test_falls_back_to_html_when_feed_dead(self):
         def fake(url, session, **kw):
             if url.endswith(".ics"):
@@ -515,6 +681,477 @@ class TestScrapeGeneralFeed(unittest.TestCase):
         self.assertIn("All Day Exhibit", summaries)  # from the working feed
         self.assertIn("Mock Event", summaries)  # from the HTML fallback
 
+    def test_html_fallback_skips_events_the_feed_gave(self):
+        # Calendar 557 cross-lists the feed's eventId=1; its dead feed falls
+        # back to HTML, which must not add a second copy.
+        cross_listed = """
+        <div id="ws-calendar-container">
+          <h2>Sunday, July 12, 2099</h2>
+          <ul class="event-entries">
+            <li class="entry">
+              <div class="title"><a href="/detail/557?eventId=1">Science on Tap</a></div>
+              <div class="event-meta"><li class="date">1:00 pm</li></div>
+            </li>
+          </ul>
+        </div>
+        """
+
+        def fake(url, session, **kw):
+            if url.endswith("/7.ics"):
+                return MockResponse(GENERAL_ICS)
+            if url.endswith(".ics"):
+                return None
+            return MockResponse(cross_listed)
+
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                [
+                    "https://calendars.illinois.edu/list/7",
+                    "https://calendars.illinois.edu/list/557",
+                ],
+            ),
+            patch.object(scrape, "safe_request", side_effect=fake),
+        ):
+            data = scrape.scrape_general()
+        copies = [e for e in data.values() if "Science on Tap" in e["summary"]]
+        self.assertEqual(len(copies), 1)
+        self.assertIn("beer and science", copies[0]["description"])  # the feed's
+
+
+class ChunkedResponse:
+    """A streamed response: the body arrives in fixed-size byte chunks."""
+
+    def __init__(self, text: str, chunk_size: int = 7, fail_after=None):
+        self.body = text.encode("utf-8")
+        self.chunk_size = chunk_size
+        self.fail_after = fail_after
+        self.encoding = "utf-8"
+        self.status_code = 200
+        self.headers = {}
+        self.chunks_read = 0
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def iter_content(self, chunk_size=None):
+        for i in range(0, len(self.body), self.chunk_size):
+            if self.fail_after is not None and self.chunks_read >= self.fail_after:
+                raise scrape.requests.exceptions.ChunkedEncodingError("reset")
+            self.chunks_read += 1
+            yield self.body[i : i + self.chunk_size]
+
+
+class TestStreamingICS(unittest.TestCase):
+    """ICS feeds are parsed chunk by chunk, yielding VEVENTs as they arrive."""
+
+    FOLDED = (
+        "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nSUMMARY:Café Crème — a very long\r\n  "
+        "title folded\r\n\t across lines\r\nUID:1\r\nEND:VEVENT\r\n"
+        "BEGIN:VEVENT\r\nSUMMARY:Second\r\nUID:2\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+
+    def test_chunked_parse_matches_whole_text_parse(self):
+        expected = scrape._parse_ics_events(self.FOLDED)
+        self.assertEqual(
+            expected[0]["SUMMARY"], "Café Crème — a very long title folded across lines"
+        )
+        for size in (1, 2, 3, 5, 64, 4096):  # splits CRLFs and UTF-8 sequences
+            with self.subTest(chunk_size=size):
+                events = scrape._parse_ics_response(ChunkedResponse(self.FOLDED, size))
+                self.assertEqual(list(events), expected)
+
+    def test_events_yielded_before_body_is_read(self):
+        response = ChunkedResponse(GENERAL_ICS, chunk_size=16)
+        events = scrape._parse_ics_response(response)
+        first = next(events)
+        self.assertEqual(first["UID"], "1-1@illinois.edu")
+        self.assertLess(response.chunks_read * 16, len(response.body))
+
+    def test_rebuilt_response_streams(self):
+        # Cassette replays and cache hits hand back rebuilt requests.Responses.
+        response = scrape._cached_response("https://x/7.ics", GENERAL_ICS)
+        self.assertEqual(len(list(scrape._parse_ics_response(response))), 3)
+
+    def test_non_calendar_body_rejected(self):
+        html_page = "<html><body>BEGIN:VCALENDAR mentioned in passing</body></html>"
+        self.assertIsNone(scrape._parse_ics_response(ChunkedResponse(html_page)))
+        self.assertIsNone(scrape._parse_ics_response(ChunkedResponse("")))
+
+    def test_feed_cut_off_mid_download_falls_back_to_html(self):
+        def fake(url, session, **kw):
+            if url.endswith(".ics"):
+                return ChunkedResponse(GENERAL_ICS, chunk_size=64, fail_after=4)
+            return MockResponse(GENERAL_HTML)
+
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                ["https://calendars.illinois.edu/list/7"],
+            ),
+            patch.object(scrape, "safe_request", side_effect=fake),
+        ):
+            events, dead = scrape._scrape_general_feed()
+        self.assertEqual(dead, ["https://calendars.illinois.edu/list/7"])
+
+
+class CacheDirTestCase(unittest.TestCase):
+    """Runs each test with the persistent caches in a fresh temporary directory."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        scrape.configure_caches(self.tmp.name)
+
+    def tearDown(self):
+        scrape.configure_cassette(None)
+        scrape.configure_caches(None)
+        self.tmp.cleanup()
+
+
+class TestConditionalFeedFetch(CacheDirTestCase):
+    """Feeds are revalidated with ETag/Last-Modified; a 304 reuses the last parse."""
+
+    def _run(self, fake):
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                ["https://calendars.illinois.edu/list/7"],
+            ),
+            patch.object(scrape, "safe_request", side_effect=fake),
+            patch.object(
+                scrape, "_iter_ics_events", wraps=scrape._iter_ics_events
+            ) as parse,
+        ):
+            return scrape.scrape_general(), parse.call_count
+
+    def test_not_modified_reuses_parsed_feed(self):
+        sent = []
+
+        def fake(url, session, headers=None, **kw):
+            sent.append(headers or {})
+            if headers and headers.get("If-None-Match") == '"v1"':
+                return MockResponse("", status_code=304)
+            return MockResponse(GENERAL_ICS, headers={"ETag": '"v1"'})
+
+        first, first_parses = self._run(fake)
+        second, second_parses = self._run(fake)
+
+        self.assertEqual(sent[0], {})
+        self.assertEqual(sent[1], {"If-None-Match": '"v1"'})
+        self.assertEqual((first_parses, second_parses), (1, 0))
+        self.assertEqual(
+            [e["summary"] for e in first.values()],
+            [e["summary"] for e in second.values()],
+        )
+
+    def test_validators_survive_a_save(self):
+        def fake(url, session, headers=None, **kw):
+            return MockResponse(
+                GENERAL_ICS, headers={"Last-Modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+            )
+
+        self._run(fake)
+        scrape.save_caches()
+        scrape.configure_caches(self.tmp.name)  # fresh process, same cache dir
+        sent = []
+
+        def not_modified(url, session, headers=None, **kw):
+            sent.append(headers)
+            return MockResponse("", status_code=304)
+
+        data, _ = self._run(not_modified)
+        self.assertIn("If-Modified-Since", sent[0])
+        self.assertEqual(len(data), 2)
+
+    def _run_two(self, fake):
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                [
+                    "https://calendars.illinois.edu/list/7",
+                    "https://calendars.illinois.edu/list/557",
+                ],
+            ),
+            patch.object(scrape, "safe_request", side_effect=fake),
+        ):
+            return scrape._scrape_general_feed()
+
+    def test_feed_cut_off_mid_download_loses_only_its_calendar(self):
+        # Same as TestStreamingICS's case, with the validator store on: the
+        # broken feed is HTML-scraped, its validators forgotten, 557 kept.
+        for fail_after in (0, 4):  # before the first line, and mid-body
+            with self.subTest(fail_after=fail_after):
+
+                def fake(url, session, headers=None, **kw):
+                    body = ChunkedResponse(
+                        GENERAL_ICS, chunk_size=64, fail_after=fail_after
+                    )
+                    if url.endswith("/557.ics"):
+                        body.fail_after = None
+                    body.headers = {"ETag": '"v1"'}
+                    return body
+
+                events, dead = self._run_two(fake)
+                self.assertEqual(dead, ["https://calendars.illinois.edu/list/7"])
+                self.assertIn(
+                    "All Day Exhibit", {e["summary"] for e in events.values()}
+                )
+                store = scrape._feed_validators
+                self.assertEqual(
+                    store.request_headers(
+                        "https://calendars.illinois.edu/icalGmail/7.ics"
+                    ),
+                    {},
+                )
+                self.assertEqual(
+                    store.request_headers(
+                        "https://calendars.illinois.edu/icalGmail/557.ics"
+                    ),
+                    {"If-None-Match": '"v1"'},
+                )
+
+    def test_streams_with_validators_on(self):
+        url = "https://calendars.illinois.edu/icalGmail/7.ics"
+        response = ChunkedResponse(GENERAL_ICS, chunk_size=16)
+        response.headers = {"ETag": '"v1"'}
+        with patch.object(scrape, "safe_request", return_value=response):
+            events = scrape.fetch_feed(
+                url, MagicMock(), scrape._parse_ics_response, stream=True
+            )
+            first = next(events)
+        self.assertLess(response.chunks_read * 16, len(response.body))
+        self.assertIsNone(scrape._feed_validators.payload(url))  # not yet
+        rest = list(events)
+        self.assertEqual(scrape._feed_validators.payload(url), [first] + rest)
+
+    def test_stream_closed_however_it_ends(self):
+        url = "https://calendars.illinois.edu/icalGmail/7.ics"
+
+        def fetch(text):
+            response = ChunkedResponse(text, chunk_size=16)
+            with patch.object(scrape, "safe_request", return_value=response):
+                return response, scrape.fetch_feed(
+                    url, MagicMock(), scrape._parse_ics_response, stream=True
+                )
+
+        for caches in (True, False):
+            with self.subTest(caches=caches):
+                if not caches:
+                    scrape.configure_caches(None)
+                response, events = fetch("<html>not a calendar</html>")
+                self.assertIsNone(events)
+                self.assertTrue(response.closed)
+
+                response, events = fetch(GENERAL_ICS)
+                next(events)
+                self.assertFalse(response.closed)
+                del events  # abandoned halfway
+                self.assertTrue(response.closed)
+
+                response, events = fetch(GENERAL_ICS)
+                self.assertEqual(len(list(events)), 3)
+                self.assertTrue(response.closed)
+
+    def test_safe_request_passes_304_only_when_conditional(self):
+        session = MagicMock()
+        session.request.return_value = MockResponse("", status_code=304)
+        with patch.object(scrape, "_wait_for_host"):
+            self.assertIsNone(scrape.safe_request("https://x/feed", session))
+            self.assertIsNotNone(
+                scrape.safe_request(
+                    "https://x/feed", session, headers={"If-None-Match": '"v1"'}
+                )
+            )
+
+
+class TestIncrementalGeneralFeed(CacheDirTestCase):
+    """Unchanged VEVENTs reuse last run's processed event instead of re-deriving it."""
+
+    def _run(self, ics):
+        with (
+            patch.object(
+                scrape,
+                "GENERAL_CALENDAR_LINKS",
+                ["https://calendars.illinois.edu/list/7"],
+            ),
+            patch.object(scrape, "safe_request", return_value=MockResponse(ics)),
+            patch.object(
+                scrape, "_ics_unescape", wraps=scrape._ics_unescape
+            ) as unescape,
+        ):
+            events, _ = scrape._scrape_general_feed()
+        # Four fields are decoded for every event processed from scratch.
+        return events, unescape.call_count // 4
+
+    def test_unchanged_events_skip_processing(self):
+        first, first_calls = self._run(GENERAL_ICS)
+        scrape.save_caches()
+        scrape.configure_caches(self.tmp.name)  # next run, same cache dir
+        second, second_calls = self._run(GENERAL_ICS)
+        self.assertEqual((first_calls, second_calls), (2, 0))
+        self.assertEqual(second, first)
+
+    def test_unchanged_events_keep_their_tags(self):
+        first, _ = self._run(GENERAL_ICS)
+        scrape.enrich_events(first)
+        scrape.save_caches()
+        scrape.configure_caches(self.tmp.name)
+        scrape._enrichment_memo.clear()  # the index alone must carry the tags
+        second, _ = self._run(GENERAL_ICS)
+        with (
+            patch.object(scrape, "_classify", wraps=scrape._classify) as cls,
+            patch.object(scrape, "_has_free_food", wraps=scrape._has_free_food) as food,
+        ):
+            scrape.enrich_events(second)
+        self.assertEqual((cls.call_count, food.call_count), (0, 0))
+        self.assertEqual(second, first)
+        self.assertTrue(all(ev["tag"] for ev in second.values()))
+        self.assertFalse(any("enriched" in ev for ev in second.values()))
+
+    def test_modified_event_is_reprocessed(self):
+        self._run(GENERAL_ICS)
+        edited = GENERAL_ICS.replace(
+            "SUMMARY:All Day Exhibit", "SEQUENCE:1\nSUMMARY:All Day Exhibit (Moved)"
+        )
+        events, calls = self._run(edited)
+        self.assertEqual(calls, 1)
+        self.assertIn(
+            "All Day Exhibit (Moved)", [e["summary"] for e in events.values()]
+        )
+
+    def test_rule_change_invalidates_index(self):
+        self._run(GENERAL_ICS)
+        scrape.save_caches()
+        with patch.object(scrape, "ENRICHMENT_VERSION", scrape.ENRICHMENT_VERSION + 1):
+            scrape.configure_caches(self.tmp.name)
+        _, calls = self._run(GENERAL_ICS)
+        self.assertEqual(calls, 2)
+
+
+class TestEnrichmentMemo(CacheDirTestCase):
+    """Repeated text is classified and food-checked once, within and across runs."""
+
+    def _enrich(self, n=3):
+        with (
+            patch.object(scrape, "_classify", wraps=scrape._classify) as cls,
+            patch.object(scrape, "_has_free_food", wraps=scrape._has_free_food) as food,
+        ):
+            for _ in range(n):  # a weekly series: same text every time
+                event = {
+                    "summary": "Pizza with the Provost",
+                    "description": "Weekly office hours.",
+                    "location": "Illini Union",
+                }
+                event["tag"] = scrape.classify_event(
+                    event["summary"], event["description"], event["location"]
+                )
+                scrape.detect_free_food(event)
+        return event["tag"], cls.call_count, food.call_count
+
+    def test_series_enriched_once_per_run(self):
+        self.assertEqual(self._enrich(), ("Academic, Free Food 🍕", 1, 1))
+
+    def test_memo_carries_over_to_next_run(self):
+        first = self._enrich()
+        scrape.save_caches()
+        scrape.configure_caches(self.tmp.name)
+        self.assertEqual(self._enrich(), (first[0], 0, 0))
+
+    def test_rule_change_invalidates_memo(self):
+        self._enrich()
+        scrape.save_caches()
+        with patch.object(scrape, "ENRICHMENT_VERSION", scrape.ENRICHMENT_VERSION + 1):
+            scrape.configure_caches(self.tmp.name)
+        self.assertEqual(self._enrich(n=1)[1:], (1, 1))
+
+
+class TestDetailPageCache(CacheDirTestCase):
+    """Detail pages are served from the on-disk cache while younger than the TTL."""
+
+    def test_safe_request_caches_http_detail(self):
+        session = MagicMock()
+        session.request.return_value = MockResponse(STATEFARM_DETAIL_HTML)
+        with patch.object(scrape, "_wait_for_host"):
+            first = scrape.safe_request("https://k/show/1", session, cache_ttl=60)
+            second = scrape.safe_request("https://k/show/1", session, cache_ttl=60)
+            uncached = scrape.safe_request("https://k/show/1", session)
+        self.assertEqual(session.request.call_count, 2)  # second came from disk
+        self.assertEqual(second.text, first.text)
+        self.assertEqual(second.status_code, 200)
+        self.assertIsNotNone(uncached)
+
+    def test_rendered_page_cached_without_starting_a_browser(self):
+        url = "https://www.statefarmcenter.com/events/detail/x"
+        browser = AsyncMock(return_value={url: STATEFARM_DETAIL_HTML})
+        with patch.object(scrape, "_render_in_browser", browser):
+            scrape._render_pages([url], 60)
+            rendered = scrape._render_pages([url], 60)
+        self.assertEqual(rendered, {url: STATEFARM_DETAIL_HTML})
+        browser.assert_awaited_once()
+
+
+class TestCassette(CacheDirTestCase):
+    """A recorded run replays to the same events without touching the network."""
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp.name, "run.json")
+
+    def _scrape_cs(self, session):
+        with (
+            patch.object(scrape, "get_session", return_value=session),
+            patch.object(scrape, "_wait_for_host"),
+        ):
+            return scrape.scrape_cs()
+
+    def test_replay_matches_recording_offline(self):
+        live = MagicMock()
+        live.request.return_value = MockResponse(
+            CS_HTML, headers={"Content-Type": "text/html", "Set-Cookie": "x"}
+        )
+        scrape.configure_cassette(self.path, "record")
+        recorded = self._scrape_cs(live)
+        scrape.save_cassette()
+
+        offline = MagicMock()
+        offline.request.side_effect = AssertionError("network used during replay")
+        scrape.configure_cassette(self.path, "replay")
+        replayed = self._scrape_cs(offline)
+
+        self.assertTrue(recorded)
+        self.assertEqual(replayed, recorded)
+        offline.request.assert_not_called()
+
+    def test_unrecorded_request_fails_like_a_dead_fetch(self):
+        scrape.configure_cassette(self.path, "record")
+        scrape.save_cassette()
+        scrape.configure_cassette(self.path, "replay")
+        self.assertIsNone(scrape.safe_request("https://example.com/", MagicMock()))
+
+    def test_rendered_pages_replay_without_a_browser(self):
+        url = "https://www.statefarmcenter.com/events/detail/x"
+        other = "https://www.statefarmcenter.com/events/detail/never-rendered"
+        scrape.configure_cassette(self.path, "record")
+        with patch.object(
+            scrape,
+            "_render_in_browser",
+            AsyncMock(return_value={url: STATEFARM_DETAIL_HTML}),
+        ):
+            scrape._render_pages([url], None)
+        scrape.save_cassette()
+
+        scrape.configure_cassette(self.path, "replay")
+        browser = AsyncMock()
+        with patch.object(scrape, "_render_in_browser", browser):
+            rendered = scrape._render_pages([url, other], None)
+        self.assertEqual(rendered, {url: STATEFARM_DETAIL_HTML})
+        browser.assert_not_called()
+
 
 class TestScrapeAthleticsFeed(unittest.TestCase):
     """Primary path: Sidearm per-sport ICS feed."""
@@ -568,7 +1205,7 @@ class TestScrapeGeneral(unittest.TestCase):
             return scrape.scrape_general()
 
     def test_schema_fields_present(self):
-        data = self._run_general(GENERAL_HTML)
+        data = scrape.enrich_events(self._run_general(GENERAL_HTML))
         self.assertGreater(len(data), 0)
         required = {"summary", "start", "end", "htmlLink", "location", "tag"}
         for ev in data.values():
@@ -951,8 +1588,105 @@ class TestScrapeIntegration(unittest.TestCase):
             },
         )
 
+    def test_concurrent_merge_keeps_source_order(self):
+        """A slow early source must not let later ones jump ahead in the output."""
+        import time
+
+        def slow_state_farm():
+            time.sleep(0.05)
+            return {0: {"summary": "SF"}}
+
+        with (
+            patch.object(scrape, "OUTPUT_FILE", "/nonexistent/no-salvage.json"),
+            patch.object(scrape, "scrape_state_farm", side_effect=slow_state_farm),
+            patch.object(
+                scrape, "scrape_athletics", return_value={0: {"summary": "A"}}
+            ),
+            patch.object(scrape, "scrape_general", return_value={0: {"summary": "G"}}),
+            patch.object(scrape, "scrape_kcpa", return_value={}),
+            patch.object(scrape, "scrape_kam", return_value={}),
+            patch.object(scrape, "scrape_music", return_value={}),
+            patch.object(scrape, "scrape_spurlock", return_value={}),
+            patch.object(scrape, "scrape_parkland", return_value={}),
+            patch.object(scrape, "scrape_urbana_library", return_value={}),
+            patch.object(scrape, "scrape_gies", return_value={}),
+            patch.object(scrape, "scrape_cs", return_value={}),
+            patch.object(
+                scrape, "scrape_food_resources", return_value={0: {"summary": "F"}}
+            ),
+        ):
+            data = scrape.scrape(max_workers=4)
+
+        self.assertEqual([e["summary"] for e in data.values()], ["SF", "A", "G", "F"])
+        self.assertEqual(
+            list(scrape.last_scrape_stats)[:3], ["state_farm", "athletics", "general"]
+        )
+        self.assertEqual(scrape.last_scrape_stats["state_farm"]["events"], 1)
+        self.assertEqual(scrape.last_scrape_stats["kcpa"]["status"], "empty_or_failed")
+
+    def test_merge_drops_listing_an_earlier_source_brought(self):
+        link = "https://calendars.illinois.edu/detail/7009?eventId=9"
+        keys = scrape.event_keys(url=link, day=datetime(2099, 7, 12).date())
+        general = {"summary": "CS Social", "htmlLink": link, "identity": keys}
+        cs = {"summary": "CS CARES Social", "htmlLink": link, "identity": keys}
+        others = [
+            "scrape_state_farm",
+            "scrape_athletics",
+            "scrape_kcpa",
+            "scrape_kam",
+            "scrape_music",
+            "scrape_spurlock",
+            "scrape_parkland",
+            "scrape_urbana_library",
+            "scrape_gies",
+            "scrape_food_resources",
+        ]
+        with (
+            patch.object(scrape, "OUTPUT_FILE", "/nonexistent/no-salvage.json"),
+            patch.object(scrape, "scrape_general", return_value={0: general}),
+            patch.object(scrape, "scrape_cs", return_value={0: cs}),
+            patch.multiple(scrape, **{name: lambda: {} for name in others}),
+        ):
+            data = scrape.scrape(max_workers=1)
+        self.assertEqual(list(data), [scrape.stable_id(keys)])
+        self.assertEqual(data[scrape.stable_id(keys)]["summary"], "CS Social")
+        self.assertNotIn("identity", data[scrape.stable_id(keys)])
+
+    def test_output_keys_survive_a_changing_batch(self):
+        a = {"summary": "A", "start": "2099-07-12T10:00:00-05:00"}
+        b = {"summary": "B", "start": "2099-07-13T10:00:00-05:00"}
+        new = {"summary": "New", "start": "2099-07-11T10:00:00-05:00"}
+        others = [
+            "scrape_state_farm",
+            "scrape_athletics",
+            "scrape_kcpa",
+            "scrape_kam",
+            "scrape_music",
+            "scrape_spurlock",
+            "scrape_parkland",
+            "scrape_urbana_library",
+            "scrape_gies",
+            "scrape_cs",
+            "scrape_food_resources",
+        ]
+
+        def run(general):
+            with (
+                patch.object(scrape, "OUTPUT_FILE", "/nonexistent/no-salvage.json"),
+                patch.object(scrape, "scrape_general", return_value=general),
+                patch.multiple(scrape, **{name: lambda: {} for name in others}),
+            ):
+                data = scrape.scrape(max_workers=1)
+            return {ev["summary"]: key for key, ev in data.items()}
+
+        first = run({0: dict(a), 1: dict(b)})
+        second = run({0: dict(new), 1: dict(b), 2: dict(a)})
+        self.assertEqual(second["A"], first["A"])
+        self.assertEqual(second["B"], first["B"])
+        self.assertEqual(len(set(second.values())), 3)
+
     def test_main_raises_when_all_empty(self):
-        def fake_scrape():
+        def fake_scrape(processes=None):
             scrape.last_scrape_stats = {
                 "state_farm": {"events": 0, "status": "empty_or_failed"},
                 "athletics": {"events": 0, "status": "empty_or_failed"},
@@ -1023,11 +1757,39 @@ class TestScrapeIntegration(unittest.TestCase):
         summaries = {e["summary"] for e in data.values()}
         self.assertIn("Fresh", summaries)
         self.assertIn("Old KCPA Show", summaries)  # salvaged, not lost
+        self.assertEqual(data["0"]["summary"], "Old KCPA Show")  # under its old ID
         self.assertEqual(
             scrape.last_scrape_stats["kcpa"]["status"], "salvaged_from_previous_run"
         )
         self.assertEqual(scrape.last_scrape_stats["kcpa"]["salvaged"], 1)
 
+    def test_main_output_dir_leaves_committed_files_alone(self):
+        import tempfile
+
+        def fake_scrape(processes=None):
+            scrape.last_scrape_stats = {
+                name: {"events": 1, "status": "success"}
+                for name in scrape.CRITICAL_SOURCES
+            }
+            return {"a1": {"summary": "Replayed"}}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            committed = os.path.join(tmp, "committed")
+            out = os.path.join(tmp, "run-output")
+            with (
+                patch.object(
+                    scrape, "OUTPUT_FILE", os.path.join(committed, "events.json")
+                ),
+                patch.object(
+                    scrape, "FOOD_DIRECTORY_FILE", os.path.join(committed, "food.json")
+                ),
+                patch.object(scrape, "scrape", side_effect=fake_scrape) as run,
+            ):
+                scrape.main(output_dir=out, processes=2)
+            run.assert_called_once_with(processes=2)
+            self.assertFalse(os.path.exists(committed))
+            self.assertEqual(sorted(os.listdir(out)), ["events.json", "food.json"])
+
     def test_main_publishes_when_critical_source_salvaged(self):
         import json
         import tempfile
@@ -1035,7 +1797,7 @@ class TestScrapeIntegration(unittest.TestCase):
         out = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
         out.close()
 
-        def fake_scrape():
+        def fake_scrape(processes=None):
             scrape.last_scrape_stats = {
                 "general": {
                     "events": 0,
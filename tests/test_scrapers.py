@@ -2,13 +2,21 @@
 
 import sys
 import os
+import asyncio
 import collections
+import json
 import unittest
-from unittest.mock import patch, MagicMock
-from datetime import datetime
+from unittest.mock import AsyncMock, patch, MagicMock
+from datetime import datetime, timedelta
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Project"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
 import scrape
+from events import Event
+import bench_accuracy
+import calendar_priors
+import bench_classify
+import bench_food
 
 
 class TestParseMonthToNumber(unittest.TestCase):
@@ -126,6 +134,71 @@ class TestDetectFreeFood(unittest.TestCase):
         self.assertIn("Free Food", scrape.detect_free_food(e)["tag"])
 
 
+class TestOneScanFoodSignals(unittest.TestCase):
+    """detect_free_food must tag exactly as the seven separate searches did."""
+
+    PHRASES = [
+        "Free pizza!",
+        "complimentary   breakfast",
+        "Food Pantry hours",
+        "Community dinner; food drive after",
+        "Snacks will be provided",
+        "dinner is served",
+        "light refreshments",
+        "pizza party",
+        "coffee at no charge",
+        "bagels on us",
+        "ice cream courtesy of the dean",
+        "donuts while supplies last",
+        "Lunch and learn. Tickets on sale, $5",
+        "BBQ fundraiser",
+        "Food for thought: food systems",
+        "cash bar; hors d'oeuvres included",
+        "Luncheon — admission fee applies",
+        "Donuts with the Deans",
+        "Welcome back cookout for sale",
+        "registration fee: $$10",
+        "",
+    ]
+
+    def _texts(self):
+        for ev in bench_food.load_inputs():
+            yield ev["summary"], " ".join(
+                [ev["summary"], ev["description"], ev["location"]]
+            )
+        for phrase in self.PHRASES:
+            yield phrase, phrase
+
+    def test_matches_legacy_tags(self):
+        events = bench_food.load_inputs()
+        events += [
+            {"summary": p, "description": d, "location": "", "tag": "General"}
+            for p in self.PHRASES
+            for d in ("", "All events are free.", "Tickets $20.")
+        ]
+        for ev in events:
+            self.assertEqual(
+                scrape.detect_free_food(dict(ev))["tag"],
+                bench_food.legacy_detect_free_food(dict(ev))["tag"],
+                ev["summary"],
+            )
+
+    def test_every_signal_starts_at_a_lead(self):
+        """A match _FOOD_SCAN doesn't visit would be silently missed."""
+        signals = (
+            scrape._FOOD_ABSOLUTE,
+            scrape._FOOD_OFFERED,
+            scrape._FOOD_NOUN,
+            scrape._FREE_CUE,
+            scrape._FOOD_VETO,
+        )
+        for _, text in self._texts():
+            leads = {m.start() for m in scrape._FOOD_SCAN.finditer(text)}
+            for pattern in signals:
+                for m in pattern.finditer(text):
+                    self.assertIn(m.start(), leads, (pattern.pattern, m.group()))
+
+
 class TestClassifyEventCategories(unittest.TestCase):
     """A publisher-assigned ICS CATEGORIES value outranks keyword guessing."""
 
@@ -155,27 +228,187 @@ class TestClassifyEventCategories(unittest.TestCase):
         self.assertEqual(scrape.classify_event("Basketball vs Purdue"), "Athletics")
 
 
+class TestCalendarPriorReport(unittest.TestCase):
+    """Candidate priors are measured only on events no ICS category decides."""
+
+    def test_measured_on_events_no_category_decides(self):
+        def ev(summary, organizer, categories=""):
+            return {
+                "summary": summary,
+                "organizer": organizer,
+                "categories": categories,
+            }
+
+        events = [ev("Seminar: Thin Films", "Research Seminars")] * 3
+        events += [ev("Jazz Orchestra Concert", "Research Seminars")]
+        events += [ev("Anything", "Research Seminars", "Performance")] * 5
+        events += [ev("Opening reception", "Exhibits", "Other")]
+        priors = calendar_priors.measure(calendar_priors.fall_through(events))
+        self.assertEqual(
+            priors["Research Seminars"],
+            {"category": "Academic", "agreement": 0.75, "events": 4},
+        )
+        self.assertEqual(priors["Exhibits"]["events"], 1)
+        self.assertFalse(calendar_priors.qualifies(priors["Research Seminars"]))
+        self.assertTrue(
+            calendar_priors.qualifies(
+                {"category": "Academic", "agreement": 0.96, "events": 60}
+            )
+        )
+
+
+class TestSinglePassClassifier(unittest.TestCase):
+    """classify_event must pick exactly what the per-category first-match loop did."""
+
+    def assertSameAsLoop(self, *args):
+        self.assertEqual(
+            scrape.classify_event(*args),
+            bench_classify.legacy_classify_event(*args),
+            args,
+        )
+
+    def test_matches_loop_on_published_events(self):
+        for args in bench_classify.load_inputs():
+            self.assertSameAsLoop(*args)
+
+    def test_priority_between_overlapping_keywords(self):
+        cases = [
+            "Board game night at the Union",  # Entertainment, not Athletics "game"
+            "Home game vs. Purdue",
+            "Concert in the gallery",  # Performances outranks Arts
+            "Gallery talk: guest speaker",  # Arts outranks Academic
+            "Family movie in the park",  # Entertainment outranks Community
+            "Fairy tales",  # "fair" is whole-word only
+            "fair",
+            "FESTIVAL OF LIGHTS",
+            "drop-in hours",
+            "Workshop; then a 5k run",
+            "",
+        ]
+        for summary in cases:
+            self.assertSameAsLoop(summary)
+        self.assertSameAsLoop("Talk", "Followed by a reception", "Krannert Art Museum")
+
+    def test_every_keyword_classifies_alone(self):
+        for category, keywords in scrape.CATEGORY_KEYWORDS:
+            for keyword in keywords:
+                self.assertSameAsLoop(keyword)
+                self.assertSameAsLoop(f"x {keyword.upper()}s")
+
+
+class TestLabeledAccuracy(unittest.TestCase):
+    """Hold the enrichment rules to their measured accuracy on the labeled corpus.
+
+    Floors sit at the scores when the corpus was labeled; a rule change that
+    raises them should raise the floors with it.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = bench_accuracy.score(bench_accuracy.load_corpus())
+
+    def test_free_food_precision_and_recall(self):
+        self.assertGreaterEqual(self.result["free_food_precision"], 0.85)
+        self.assertGreaterEqual(self.result["free_food_recall"], 0.52)
+
+    def test_category_accuracy(self):
+        self.assertGreaterEqual(self.result["category_accuracy"], 0.58)
+
+    def test_corpus_labels_are_known_categories(self):
+        known = {cat for cat, _ in scrape.CATEGORY_KEYWORDS} | {"General"}
+        for ev in bench_accuracy.load_corpus():
+            self.assertIn(ev["labels"]["category"], known, ev["summary"])
+            self.assertIsInstance(ev["labels"]["free_food"], bool)
+
+
+class TestEnrichEvents(unittest.TestCase):
+    """The batch stage classifies and tags what the scrapers only parsed."""
+
+    def setUp(self):
+        scrape.configure_caches(None)  # a fresh in-process memo
+
+    def _events(self):
+        return {
+            0: {
+                "summary": "Talk",
+                "description": "Followed by a reception.",
+                "location": "Krannert Art Museum",
+                "categories": "Exhibition",
+            },
+            1: {
+                "summary": "Jazz Orchestra Concert",
+                "description": "Pizza provided after.",
+                "location": "",
+            },
+            2: {
+                "summary": "Illinois vs. Purdue",
+                "description": "",
+                "location": "",
+                "tag": "Athletics",
+            },
+            3: {
+                "summary": "Jazz Orchestra Concert",
+                "description": "Pizza provided after.",
+            },
+        }
+
+    def test_classifies_untagged_and_tags_food(self):
+        events = scrape.enrich_events(self._events())
+        self.assertEqual(events[0]["tag"], "Arts")  # from CATEGORIES
+        self.assertNotIn("categories", events[0])
+        self.assertEqual(events[1]["tag"], "Performances, Free Food 🍕")
+        self.assertEqual(events[2]["tag"], "Athletics")  # a source tag is kept
+
+    def test_matches_per_event_calls(self):
+        expected = self._events()
+        for ev in expected.values():
+            if not ev.get("tag"):
+                ev["tag"] = scrape.classify_event(
+                    ev.get("summary", ""),
+                    ev.get("description", ""),
+                    ev.get("location", ""),
+                    ev.pop("categories", ""),
+                )
+            scrape.detect_free_food(ev)
+        scrape.configure_caches(None)
+        self.assertEqual(scrape.enrich_events(self._events()), expected)
+
+    def test_repeated_text_worked_out_once(self):
+        with patch.object(
+            scrape, "_run_enrich_jobs", wraps=scrape._run_enrich_jobs
+        ) as run:
+            scrape.enrich_events(self._events())
+            scrape.enrich_events(self._events())
+        # Events 1 and 3 share their text; the second batch is all memo hits.
+        self.assertEqual(len(run.call_args_list[0].args[0]), 5)
+        self.assertEqual(run.call_count, 1)
+
+    def test_process_pool_gives_same_result(self):
+        in_process = scrape.enrich_events(self._events(), processes=0)
+        scrape.configure_caches(None)
+        with patch.object(scrape, "ENRICH_POOL_MIN_JOBS", 1):
+            pooled = scrape.enrich_events(self._events(), processes=2)
+        self.assertEqual(pooled, in_process)
+
+
 class TestCapRecurringSeries(unittest.TestCase):
     def _series(self, title, n, start_day=1):
-        return {
-            f"{title}-{i}": {
-                "summary": title,
-                "start": f"2026-09-{start_day + i:02d}T10:00:00-05:00",
-            }
+        return [
+            Event(summary=title, start=f"2026-09-{start_day + i:02d}T10:00:00-05:00")
             for i in range(n)
-        }
+        ]
 
     def test_short_series_untouched(self):
         events = self._series("Yoga", 3)
         out = scrape.cap_recurring_series(events, max_per_series=8)
         self.assertEqual(len(out), 3)
-        self.assertFalse(any("series_total" in e for e in out.values()))
+        self.assertFalse(any("series_total" in e for e in out))
 
     def test_long_series_trimmed_to_the_earliest_occurrences(self):
         events = self._series("Office Hours", 20)
         out = scrape.cap_recurring_series(events, max_per_series=8)
         self.assertEqual(len(out), 8)
-        starts = sorted(e["start"] for e in out.values())
+        starts = sorted(e["start"] for e in out)
         self.assertEqual(starts[0][:10], "2026-09-01")
         self.assertEqual(starts[-1][:10], "2026-09-08")
 
@@ -183,31 +416,238 @@ class TestCapRecurringSeries(unittest.TestCase):
         out = scrape.cap_recurring_series(
             self._series("Public Skate", 30), max_per_series=8
         )
-        for e in out.values():
+        for e in out:
             self.assertEqual(e["series_total"], 30)
             self.assertEqual(e["series_end"][:10], "2026-09-30")
 
     def test_distinct_titles_are_separate_series(self):
-        events = {**self._series("Yoga", 10), **self._series("Zumba", 2)}
+        events = self._series("Yoga", 10) + self._series("Zumba", 2)
         out = scrape.cap_recurring_series(events, max_per_series=8)
-        titles = collections.Counter(e["summary"] for e in out.values())
+        titles = collections.Counter(e["summary"] for e in out)
         self.assertEqual(titles["Yoga"], 8)
         self.assertEqual(titles["Zumba"], 2)
 
     def test_grouping_matches_frontend_title_normalization(self):
-        events = {
-            "a": {"summary": "Lunch Skate!", "start": "2026-09-01T10:00:00-05:00"},
-            "b": {"summary": "lunch  skate", "start": "2026-09-02T10:00:00-05:00"},
-            "c": {"summary": "LUNCH-SKATE", "start": "2026-09-03T10:00:00-05:00"},
-        }
+        events = [
+            Event(summary="Lunch Skate!", start="2026-09-01T10:00:00-05:00"),
+            Event(summary="lunch  skate", start="2026-09-02T10:00:00-05:00"),
+            Event(summary="LUNCH-SKATE", start="2026-09-03T10:00:00-05:00"),
+        ]
         out = scrape.cap_recurring_series(events, max_per_series=2)
         self.assertEqual(len(out), 2)  # all three are one series, so one is dropped
 
-    def test_keys_are_resequenced(self):
-        out = scrape.cap_recurring_series(
-            self._series("Freestyle", 12), max_per_series=5
+    def test_survivors_keep_their_order(self):
+        events = self._series("Freestyle", 12)[::-1] + self._series("Yoga", 2)
+        out = scrape.cap_recurring_series(events, max_per_series=5)
+        self.assertEqual([e.summary for e in out], ["Freestyle"] * 5 + ["Yoga"] * 2)
+        self.assertEqual(out[4]["start"][:10], "2026-09-01")
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    def test_bucket_starts_full_then_spaces_requests(self):
+        now = [100.0]
+        bucket = scrape._TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)  # queued behind the last one
+
+    def test_bucket_refills_over_time(self):
+        now = [0.0]
+        bucket = scrape._TokenBucket(rate=1.0, burst=1, clock=lambda: now[0])
+        bucket.reserve()
+        now[0] = 5.0
+        self.assertEqual(bucket.reserve(), 0.0)  # refilled, but capped at burst
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_hosts_do_not_wait_on_each_other(self):
+        with (
+            patch.dict(scrape._host_buckets, clear=True),
+            patch.object(scrape.time, "sleep") as sleep,
+        ):
+            scrape._wait_for_host("https://kam.illinois.edu/events")
+            scrape._wait_for_host(scrape.PARKLAND_EVENTS_JSON)
+            scrape._wait_for_host("https://spurlock.illinois.edu/events")
+            sleep.assert_not_called()
+            scrape._wait_for_host("https://kam.illinois.edu/event/1")
+            sleep.assert_called_once()
+
+    def test_per_host_rate_override(self):
+        with (
+            patch.dict(scrape._host_buckets, clear=True),
+            patch.dict(scrape.HOST_RATE_LIMITS, {"example.com": (10.0, 3)}),
+            patch.object(scrape.time, "sleep") as sleep,
+        ):
+            for _ in range(3):
+                scrape._wait_for_host("https://example.com/feed.ics")
+            sleep.assert_not_called()
+
+    def test_detail_page_hosts_keep_the_default_rate(self):
+        # fetch_pages overlaps detail-page latency; it must not raise a
+        # third-party host above one request every RATE_LIMIT_DELAY.
+        for link in (scrape.KCPA_CALENDAR_LINK, scrape.STATE_FARM_CENTER_CALENDAR_LINK):
+            with (
+                self.subTest(link=link),
+                patch.dict(scrape._host_buckets, clear=True),
+                patch.object(scrape.time, "sleep") as sleep,
+            ):
+                scrape._wait_for_host(link)
+                sleep.assert_not_called()
+                scrape._wait_for_host(link)
+                sleep.assert_called_once()
+                self.assertAlmostEqual(
+                    sleep.call_args[0][0], scrape.RATE_LIMIT_DELAY, places=2
+                )
+
+
+class TestSharedSession(unittest.TestCase):
+    def test_same_session_within_a_thread(self):
+        self.assertIs(scrape.get_session(), scrape.get_session())
+
+    def test_threads_share_one_connection_pool(self):
+        import threading
+
+        sessions = []
+        threads = [
+            threading.Thread(target=lambda: sessions.append(scrape.get_session()))
+            for _ in range(2)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        a, b = sessions
+        self.assertIsNot(a, b)
+        self.assertIs(a.get_adapter("https://x/"), b.get_adapter("https://y/"))
+        self.assertIs(
+            a.get_adapter("https://x/"), scrape.get_session().adapters["https://"]
+        )
+
+    def test_pool_sized_from_config(self):
+        adapter = scrape.get_session().get_adapter("https://calendars.illinois.edu/")
+        self.assertEqual(adapter._pool_maxsize, scrape.POOL_MAXSIZE)
+        self.assertEqual(adapter.max_retries.total, scrape.MAX_RETRIES)
+
+
+class TestBrowserRequestPolicy(unittest.TestCase):
+    def test_documents_and_xhr_pass(self):
+        for rtype in ("document", "xhr", "fetch"):
+            with self.subTest(rtype=rtype):
+                self.assertTrue(
+                    scrape._browser_request_allowed(
+                        rtype, "https://api.example.com/events.json"
+                    )
+                )
+
+    def test_heavy_subresources_blocked(self):
+        for rtype in ("image", "font", "media", "stylesheet", "other"):
+            with self.subTest(rtype=rtype):
+                self.assertFalse(
+                    scrape._browser_request_allowed(
+                        rtype, "https://www.statefarmcenter.com/a.bin"
+                    )
+                )
+
+    def test_scripts_only_from_first_party(self):
+        self.assertTrue(
+            scrape._browser_request_allowed(
+                "script", "https://www.statefarmcenter.com/app.js"
+            )
+        )
+        self.assertFalse(
+            scrape._browser_request_allowed("script", "https://cdn.example.com/x.js")
+        )
+
+    def test_analytics_hosts_blocked_whatever_the_type(self):
+        self.assertFalse(
+            scrape._browser_request_allowed(
+                "xhr", "https://www.google-analytics.com/g/collect"
+            )
+        )
+        self.assertFalse(
+            scrape._browser_request_allowed(
+                "script", "https://connect.facebook.net/en_US/fbevents.js"
+            )
         )
-        self.assertEqual(sorted(out.keys()), list(range(5)))
+
+    def test_route_handler_aborts_or_continues(self):
+        route = AsyncMock()
+        route.request = MagicMock(
+            resource_type="image", url="https://www.statefarmcenter.com/hero.jpg"
+        )
+        asyncio.run(scrape._route_request(route))
+        route.abort.assert_awaited_once()
+        route.continue_.assert_not_called()
+
+
+class _FakePage:
+    """Stands in for a Playwright page; ``behaviour`` maps URL to delay or error."""
+
+    def __init__(self, pool, behaviour):
+        self.pool = pool
+        self.behaviour = behaviour
+        self.url = None
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def goto(self, url, **kw):
+        self.pool.in_flight += 1
+        self.pool.peak = max(self.pool.peak, self.pool.in_flight)
+        try:
+            outcome = self.behaviour.get(url, 0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            await asyncio.sleep(outcome)
+            self.url = url
+        finally:
+            self.pool.in_flight -= 1
+
+    async def content(self):
+        return f"<html>{self.url}</html>"
+
+
+class _FakeBrowser:
+    def __init__(self, behaviour=None):
+        self.behaviour = behaviour or {}
+        self.contexts = []
+        self.closed = 0
+        self.in_flight = self.peak = 0
+
+    async def new_context(self, **kw):
+        browser = self
+
+        class Context:
+            async def new_page(self):
+                return _FakePage(browser, browser.behaviour)
+
+            async def close(self):
+                browser.closed += 1
+
+        self.contexts.append(Context())
+        return self.contexts[-1]
+
+
+class TestRenderPagePool(unittest.TestCase):
+    def test_pages_render_concurrently(self):
+        browser = _FakeBrowser({f"u{i}": 0.02 for i in range(6)})
+        urls = [f"u{i}" for i in range(6)]
+        results = asyncio.run(scrape._render_with_browser(browser, urls, pages=3))
+        self.assertEqual(results, {u: f"<html>{u}</html>" for u in urls})
+        self.assertEqual(browser.peak, 3)
+        self.assertEqual(len(browser.contexts), 3)
+        self.assertEqual(browser.closed, 3)  # every context closed at the end
+
+    def test_timed_out_or_crashed_page_is_recycled(self):
+        browser = _FakeBrowser({"slow": 5, "crash": RuntimeError("Target crashed")})
+        urls = ["slow", "ok1", "crash", "ok2"]
+        with patch.object(scrape.logger, "warning"):
+            results = asyncio.run(
+                scrape._render_with_browser(browser, urls, pages=1, timeout=0.05)
+            )
+        self.assertEqual(sorted(results), ["ok1", "ok2"])
+        # one context for the first page, plus a fresh one after each failure
+        self.assertEqual(len(browser.contexts), 3)
 
 
 class TestValidateEvent(unittest.TestCase):
@@ -294,6 +734,174 @@ class TestClassifyEvent(unittest.TestCase):
         )
 
 
+class TestNearDedupeEvents(unittest.TestCase):
+    """Near-identical listings from different sources collapse to one."""
+
+    def _ev(self, summary, source, start="2026-09-12T10:00:00-05:00", description=""):
+        return Event(
+            summary=summary, source=source, start=start, description=description
+        )
+
+    def test_mirrored_listing_collapses_richer_wins(self):
+        events = [
+            self._ev("Concerts for Kids", "music"),
+            self._ev("Other talk", "general"),
+            self._ev("Concert for Kids", "urbana_library", description="Full details"),
+        ]
+        out = scrape.near_dedupe_events(events)
+        self.assertEqual(
+            [(e.summary, e.source) for e in out],
+            [("Concert for Kids", "urbana_library"), ("Other talk", "general")],
+        )
+
+    def test_start_within_window(self):
+        events = [
+            self._ev("Kids at KAM: Artmaking and More!", "kam"),
+            self._ev(
+                "Kids at KAM: Artmaking and More! | Krannert Art Museum",
+                "general",
+                start="2026-09-12T10:30:00-05:00",
+            ),
+            self._ev(
+                "Kids at KAM: Artmaking", "kam", start="2026-09-13T10:00:00-05:00"
+            ),
+        ]
+        self.assertEqual(len(scrape.near_dedupe_events(events)), 2)
+        self.assertEqual(len(scrape.near_dedupe_events(events, window_minutes=15)), 3)
+
+    def test_threshold_is_configurable(self):
+        events = [
+            self._ev("Kids at KAM: Artmaking and More!", "kam"),
+            self._ev(
+                "Kids at KAM: Artmaking and More! | Krannert Art Museum", "general"
+            ),
+        ]
+        self.assertEqual(len(scrape.near_dedupe_events(events, threshold=0.6)), 1)
+        self.assertEqual(len(scrape.near_dedupe_events(events, threshold=0.9)), 2)
+
+    def test_one_source_never_collapses_with_itself(self):
+        events = [
+            self._ev("Yoga for Beginners", "general"),
+            self._ev("Yoga for Beginner", "general"),
+        ]
+        self.assertEqual(len(scrape.near_dedupe_events(events)), 2)
+        # Bridged by another source, the two general listings still stay apart.
+        events.append(self._ev("Yoga for Beginners!", "parkland"))
+        out = scrape.near_dedupe_events(events)
+        self.assertEqual(sorted(e.source for e in out), ["general", "general"])
+
+    def test_untimed_and_untitled_are_kept(self):
+        events = [
+            self._ev("Open House", "general", start=""),
+            self._ev("Open House", "kam", start=""),
+            self._ev("", "kam"),
+            self._ev("", "general"),
+        ]
+        self.assertEqual(len(scrape.near_dedupe_events(events)), 4)
+
+
+def published_events():
+    """The published events, each ending after the returned ``now``."""
+    path = os.path.join(
+        os.path.dirname(__file__), "..", "Project", "scraped_events.json"
+    )
+    with open(path) as f:
+        events = list(json.load(f).values())
+    ends = [datetime.fromisoformat(ev["end"]) for ev in events if ev.get("end")]
+    return events, min(ends) - timedelta(days=1)
+
+
+class TestPostprocessEvents(unittest.TestCase):
+    """The fused stage must match drop → dedupe → near-dedupe → cap in turn."""
+
+    def _sequential(self, events, now, max_per_series):
+        events = scrape.drop_past_events(events, now)
+        after_past = len(events)
+        events = scrape.dedupe_events(events)
+        after_dedupe = len(events)
+        events = scrape.near_dedupe_events(events)
+        after_near = len(events)
+        events = scrape.cap_recurring_series(events, max_per_series)
+        return [e.to_dict() for e in events], after_past, after_dedupe, after_near
+
+    def assertSameAsSequential(self, raw, now, max_per_series=8):
+        fused, *counts = scrape.postprocess_events(
+            [Event.from_dict(ev) for ev in raw], now, max_per_series
+        )
+        self.assertEqual(
+            ([e.to_dict() for e in fused], *counts),
+            self._sequential([Event.from_dict(ev) for ev in raw], now, max_per_series),
+        )
+
+    def test_matches_sequential_on_published_events(self):
+        raw, before_all = published_events()
+        starts = sorted(ev["start"] for ev in raw)
+        midway = datetime.fromisoformat(starts[len(starts) // 2])
+        for now in (before_all, midway):
+            for cap in (1, 3, 8):
+                self.assertSameAsSequential(raw, now, cap)
+
+    def test_dedupe_winner_and_series_cap_together(self):
+        now = datetime(2026, 9, 1, tzinfo=scrape.TZ)
+        raw = [
+            {"summary": "Yoga", "start": f"2026-09-{d:02d}T10:00:00-05:00"}
+            for d in (9, 3, 5, 4)
+        ]
+        raw += [
+            {
+                "summary": "YOGA!",
+                "start": "2026-09-03T10:00:00-05:00",
+                "description": "x",
+            },
+            {"summary": "Yoga", "start": "2026-08-01T10:00:00-05:00"},  # past
+            {"summary": "", "start": "", "description": ""},
+            {"summary": "Untimed", "start": "", "end": ""},
+        ]
+        self.assertSameAsSequential(raw, now, max_per_series=2)
+        kept, after_past, after_dedupe, after_near = scrape.postprocess_events(
+            [Event.from_dict(ev) for ev in raw], now, max_per_series=2
+        )
+        self.assertEqual(
+            (len(kept), after_past, after_dedupe, after_near), (4, 7, 6, 6)
+        )
+        yoga = [e for e in kept if e.summary.lower().startswith("yoga")]
+        self.assertEqual([e["start"][:10] for e in yoga], ["2026-09-03", "2026-09-04"])
+        self.assertEqual(yoga[0].description, "x")
+        self.assertEqual({e.series_total for e in yoga}, {4})
+
+
+class TestPublishEvents(unittest.TestCase):
+    def test_id_follows_identity_not_position(self):
+        talk = Event(summary="Talk!", start="2026-07-16T10:00:00-05:00")
+        moved = Event(summary="talk", start="2026-07-16T10:00:59-05:00")
+        self.assertEqual(scrape.event_id(talk), scrape.event_id(moved))
+        later = Event(summary="Talk", start="2026-07-16T11:00:00-05:00")
+        self.assertNotEqual(scrape.event_id(talk), scrape.event_id(later))
+        keys = ["uid:1-1@illinois.edu"]
+        self.assertEqual(scrape.event_id(talk, keys), scrape.stable_id(keys))
+
+    def test_keyed_by_id_in_list_order(self):
+        events = [
+            Event(summary="B", start="2026-07-16T10:00:00-05:00"),
+            Event(summary="A", start="2026-07-16T10:00:00-05:00"),
+        ]
+        events[0].id = "given"
+        self.assertEqual(
+            scrape.publish_events(events),
+            {
+                "given": events[0].to_dict(),
+                scrape.event_id(events[1]): events[1].to_dict(),
+            },
+        )
+
+    def test_clashing_ids_are_suffixed(self):
+        events = [Event(summary="", start="") for _ in range(3)]
+        base = scrape.event_id(events[0])
+        self.assertEqual(
+            list(scrape.publish_events(events)), [base, f"{base}-2", f"{base}-3"]
+        )
+
+
 class TestDropPastEvents(unittest.TestCase):
     def setUp(self):
         from zoneinfo import ZoneInfo
@@ -302,114 +910,121 @@ class TestDropPastEvents(unittest.TestCase):
         self.now = datetime(2026, 6, 28, 12, 0, tzinfo=self.TZ)
 
     def test_drops_past_keeps_future(self):
-        events = {
-            0: {
-                "summary": "Past",
-                "start": "2026-06-01T10:00:00-05:00",
-                "end": "2026-06-01T11:00:00-05:00",
-            },
-            1: {
-                "summary": "Future",
-                "start": "2026-07-01T10:00:00-05:00",
-                "end": "2026-07-01T11:00:00-05:00",
-            },
-        }
+        events = [
+            Event(
+                summary="Past",
+                start="2026-06-01T10:00:00-05:00",
+                end="2026-06-01T11:00:00-05:00",
+            ),
+            Event(
+                summary="Future",
+                start="2026-07-01T10:00:00-05:00",
+                end="2026-07-01T11:00:00-05:00",
+            ),
+        ]
         kept = scrape.drop_past_events(events, now=self.now)
-        self.assertEqual([e["summary"] for e in kept.values()], ["Future"])
+        self.assertEqual([e["summary"] for e in kept], ["Future"])
 
     def test_keeps_event_ending_now_or_later(self):
-        events = {
-            0: {
-                "summary": "Ongoing",
-                "start": "2026-06-28T11:00:00-05:00",
-                "end": "2026-06-28T23:00:00-05:00",
-            }
-        }
+        events = [
+            Event(
+                summary="Ongoing",
+                start="2026-06-28T11:00:00-05:00",
+                end="2026-06-28T23:00:00-05:00",
+            )
+        ]
         kept = scrape.drop_past_events(events, now=self.now)
         self.assertEqual(len(kept), 1)
 
     def test_keeps_unparseable(self):
-        events = {0: {"summary": "Bad", "start": "not-a-date", "end": "also-bad"}}
+        events = [Event(summary="Bad", start="not-a-date", end="also-bad")]
         kept = scrape.drop_past_events(events, now=self.now)
         self.assertEqual(len(kept), 1)
 
-    def test_rekeys_sequentially(self):
-        events = {
-            5: {
-                "summary": "Future A",
-                "start": "2026-07-01T10:00:00-05:00",
-                "end": "2026-07-01T11:00:00-05:00",
-            },
-            9: {
-                "summary": "Future B",
-                "start": "2026-07-02T10:00:00-05:00",
-                "end": "2026-07-02T11:00:00-05:00",
-            },
-        }
+    def test_keeps_order(self):
+        events = [
+            Event(
+                summary="Future B",
+                start="2026-07-02T10:00:00-05:00",
+                end="2026-07-02T11:00:00-05:00",
+            ),
+            Event(
+                summary="Future A",
+                start="2026-07-01T10:00:00-05:00",
+                end="2026-07-01T11:00:00-05:00",
+            ),
+        ]
         kept = scrape.drop_past_events(events, now=self.now)
-        self.assertEqual(sorted(kept.keys()), [0, 1])
+        self.assertEqual([e.summary for e in kept], ["Future B", "Future A"])
 
 
 class TestDedupeEvents(unittest.TestCase):
     def test_collapses_cross_source_duplicates(self):
         # Same title + same start time from two feeds → one event, richer wins.
-        events = {
-            0: {
-                "summary": "Krannert Uncorked",
-                "start": "2026-07-16T17:30:00-05:00",
-                "description": "",
-            },
-            1: {
-                "summary": "Krannert  Uncorked!",
-                "start": "2026-07-16T17:30:00-05:00",
-                "description": "Full details",
-            },
-        }
+        events = [
+            Event(
+                summary="Krannert Uncorked",
+                start="2026-07-16T17:30:00-05:00",
+                description="",
+            ),
+            Event(
+                summary="Krannert  Uncorked!",
+                start="2026-07-16T17:30:00-05:00",
+                description="Full details",
+            ),
+        ]
         out = scrape.dedupe_events(events)
         self.assertEqual(len(out), 1)
-        self.assertEqual(list(out.values())[0]["description"], "Full details")
+        self.assertEqual(out[0]["description"], "Full details")
 
     def test_keeps_same_title_different_time_same_day(self):
         # Distinct sessions (e.g. recurring tutoring) must NOT be merged.
-        events = {
-            0: {
-                "summary": "Drop-in Tutoring",
-                "start": "2026-07-16T07:00:00-05:00",
-                "description": "",
-            },
-            1: {
-                "summary": "Drop-in Tutoring",
-                "start": "2026-07-16T12:00:00-05:00",
-                "description": "",
-            },
-        }
+        events = [
+            Event(
+                summary="Drop-in Tutoring",
+                start="2026-07-16T07:00:00-05:00",
+                description="",
+            ),
+            Event(
+                summary="Drop-in Tutoring",
+                start="2026-07-16T12:00:00-05:00",
+                description="",
+            ),
+        ]
         out = scrape.dedupe_events(events)
         self.assertEqual(len(out), 2)
 
     def test_keeps_same_title_different_day(self):
-        events = {
-            0: {
-                "summary": "Yoga Class",
-                "start": "2026-07-16T10:00:00-05:00",
-                "description": "",
-            },
-            1: {
-                "summary": "Yoga Class",
-                "start": "2026-07-17T10:00:00-05:00",
-                "description": "",
-            },
-        }
+        events = [
+            Event(
+                summary="Yoga Class", start="2026-07-16T10:00:00-05:00", description=""
+            ),
+            Event(
+                summary="Yoga Class", start="2026-07-17T10:00:00-05:00", description=""
+            ),
+        ]
         out = scrape.dedupe_events(events)
         self.assertEqual(len(out), 2)
 
     def test_keeps_events_without_title_or_date(self):
-        events = {
-            0: {"summary": "", "start": "2026-07-16T10:00:00-05:00", "description": ""},
-            1: {"summary": "Thing", "start": "", "description": ""},
-        }
+        events = [
+            Event(summary="", start="2026-07-16T10:00:00-05:00", description=""),
+            Event(summary="Thing", start="", description=""),
+        ]
         out = scrape.dedupe_events(events)
         self.assertEqual(len(out), 2)
 
+    def test_winner_keeps_first_position(self):
+        events = [
+            Event(summary="Talk", start="2026-07-16T10:00:00-05:00", description=""),
+            Event(summary="Other", start="2026-07-16T10:00:00-05:00", description=""),
+            Event(summary="Talk", start="2026-07-16T10:00:00-05:00", description="x"),
+        ]
+        out = scrape.dedupe_events(events)
+        self.assertEqual(
+            [(e.summary, e.description) for e in out], [("Talk", "x"), ("Other", "")]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()